@@ -0,0 +1,138 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import CharField, F, Q, Value
+from django.db.models.functions import Concat
+
+from apps.skills.models import Skill
+from apps.projects.models import Project
+from apps.notifications.models import Notification
+
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 50
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+# =========================
+# Feed sources
+# =========================
+# Every source is projected onto the same four columns so they can be
+# combined with UNION ALL and ordered by (date, type, ref_id) in SQL.
+def _skills(user):
+    return Skill.objects.filter(user=user).annotate(
+        type=Value("skill", output_field=CharField()),
+        ref_id=F("id"),
+        text=Concat(Value("Added skill "), "name", output_field=CharField()),
+        date=F("created_at"),
+    )
+
+
+def _projects(user):
+    return Project.objects.filter(user=user).annotate(
+        type=Value("project", output_field=CharField()),
+        ref_id=F("id"),
+        text=Concat(Value("Created project "), "title", output_field=CharField()),
+        date=F("created_at"),
+    )
+
+
+def _notifications(user):
+    return Notification.objects.filter(user=user).annotate(
+        type=Value("notification", output_field=CharField()),
+        ref_id=F("id"),
+        text=F("title"),
+        date=F("created_at"),
+    )
+
+
+SOURCES = (
+    ("skill", _skills),
+    ("project", _projects),
+    ("notification", _notifications),
+)
+
+FIELDS = ("type", "ref_id", "text", "date")
+
+
+# =========================
+# Cursor
+# =========================
+def encode_cursor(item):
+    raw = f"{item['date'].isoformat()}|{item['type']}|{item['ref_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date, kind, ref_id = raw.split("|")
+        return datetime.fromisoformat(date), kind, int(ref_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor("Invalid cursor")
+
+
+def _after(kind, position):
+    """
+    Keyset condition "row < position" in (date, type, ref_id) order,
+    resolved per source (where `type` is a constant) so it stays a
+    plain index range on (user, created_at, id).
+    """
+    date, cursor_kind, ref_id = position
+    if kind < cursor_kind:
+        return Q(created_at__lte=date)
+    if kind > cursor_kind:
+        return Q(created_at__lt=date)
+    return Q(created_at__lt=date) | Q(created_at=date, id__lt=ref_id)
+
+
+# =========================
+# Feed
+# =========================
+def get_activity_page(user, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    One page of the user's activity, newest first.
+
+    A single UNION ALL query over skills, projects and notifications.
+    Each branch keeps only its own limit + 1 newest rows, read from its
+    (user, created_at, id) index, so the database merges at most
+    3 * (limit + 1) rows however long the user's history is. Paging is
+    keyset based (no OFFSET). Returns (items, next_cursor).
+    """
+    position = decode_cursor(cursor) if cursor else None
+
+    querysets = []
+    for kind, source in SOURCES:
+        qs = source(user)
+        if position:
+            qs = qs.filter(_after(kind, position))
+        # Not sliced directly: SQLite rejects LIMIT inside a compound
+        # statement, but not in a subquery of one
+        newest = qs.order_by("-created_at", "-id").values("id")[:limit + 1]
+        querysets.append(source(user).filter(id__in=newest).values(*FIELDS))
+
+    first, *rest = querysets
+    rows = list(
+        first.union(*rest, all=True)
+        .order_by("-date", "-type", "-ref_id")[:limit + 1]
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1])
+
+    items = [
+        {
+            "id": f"{row['type']}-{row['ref_id']}",
+            "type": row["type"],
+            "message": row["text"],
+            "date": row["date"],
+        }
+        for row in rows
+    ]
+    return items, next_cursor
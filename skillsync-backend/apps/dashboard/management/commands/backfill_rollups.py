@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.dashboard.models import DailyRollup
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily time-series rollups from the skills, projects and milestones tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Limit to a single user (email).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        users = User.objects.order_by("pk")
+        if options["user"]:
+            users = users.filter(email=options["user"])
+            if not users.exists():
+                raise CommandError(f"No user with email {options['user']}")
+
+        processed = cells_written = 0
+        last_pk = 0
+
+        while True:
+            user_ids = list(
+                users.filter(pk__gt=last_pk)
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_pk = user_ids[-1]
+
+            written = DailyRollup.objects.rebuild(user_ids)
+
+            processed += len(user_ids)
+            cells_written += written
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled {cells_written} rollup rows for {processed} users."
+            )
+        )
@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.dashboard.managers import COUNTER_FIELDS
+from apps.dashboard.models import UserStats
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or verify) the per-user dashboard counters from the source tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only report drifted counters, don't write anything.",
+        )
+        parser.add_argument(
+            "--user",
+            help="Limit to a single user (email).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+        )
+
+    def handle(self, *args, **options):
+        verify = options["verify"]
+        batch_size = options["batch_size"]
+
+        users = User.objects.order_by("pk")
+        if options["user"]:
+            users = users.filter(email=options["user"])
+            if not users.exists():
+                raise CommandError(f"No user with email {options['user']}")
+
+        checked = drifted = 0
+        last_pk = 0
+
+        # Walk users by primary key so every batch is an index range scan
+        while True:
+            user_ids = list(
+                users.filter(pk__gt=last_pk)
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_pk = user_ids[-1]
+
+            expected = UserStats.objects.compute(user_ids)
+            existing = UserStats.objects.in_bulk(user_ids, field_name="user_id")
+
+            to_create = []
+            to_update = []
+            for user_id, counts in expected.items():
+                stats = existing.get(user_id)
+                if stats is None:
+                    to_create.append(UserStats(user_id=user_id, **counts))
+                    continue
+
+                if any(getattr(stats, f) != counts[f] for f in COUNTER_FIELDS):
+                    if verify:
+                        self.stdout.write(
+                            f"user {user_id}: "
+                            + ", ".join(
+                                f"{f} {getattr(stats, f)} != {counts[f]}"
+                                for f in COUNTER_FIELDS
+                                if getattr(stats, f) != counts[f]
+                            )
+                        )
+                    for field, value in counts.items():
+                        setattr(stats, field, value)
+                    stats.version += 1
+                    to_update.append(stats)
+
+            checked += len(user_ids)
+            drifted += len(to_update)
+
+            if not verify:
+                with transaction.atomic():
+                    UserStats.objects.bulk_create(to_create)
+                    UserStats.objects.bulk_update(
+                        to_update, COUNTER_FIELDS + ("version",)
+                    )
+
+        if verify:
+            self.stdout.write(f"Checked {checked} users, {drifted} drifted.")
+            if drifted:
+                raise CommandError("Counters out of sync, run without --verify to repair.")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt counters for {checked} users ({drifted} repaired).")
+            )
@@ -0,0 +1,187 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.skills.models import Skill
+from apps.projects.models import Project
+from apps.notifications.models import Notification
+from . import rollups
+
+
+COUNTER_FIELDS = (
+    "skills_count",
+    "projects_count",
+    "completed_projects_count",
+    "notifications_count",
+    "unread_notifications_count",
+)
+
+
+class UserStatsManager(models.Manager):
+    def compute(self, user_ids):
+        """
+        Count skills / projects / notifications straight from the source
+        tables for a batch of users (one grouped query per table).
+        Returns {user_id: {counter_field: value}}.
+        """
+        user_ids = list(user_ids)
+        counts = {
+            user_id: dict.fromkeys(COUNTER_FIELDS, 0)
+            for user_id in user_ids
+        }
+
+        skills = (
+            Skill.objects
+            .filter(user_id__in=user_ids)
+            .values("user_id")
+            .annotate(total=Count("id"))
+        )
+        for row in skills:
+            counts[row["user_id"]]["skills_count"] = row["total"]
+
+        projects = (
+            Project.objects
+            .filter(user_id__in=user_ids)
+            .values("user_id")
+            .annotate(
+                total=Count("id"),
+                completed=Count("id", filter=Q(status="completed")),
+            )
+        )
+        for row in projects:
+            counts[row["user_id"]]["projects_count"] = row["total"]
+            counts[row["user_id"]]["completed_projects_count"] = row["completed"]
+
+        notifications = (
+            Notification.objects
+            .filter(user_id__in=user_ids)
+            .values("user_id")
+            .annotate(
+                total=Count("id"),
+                unread=Count("id", filter=Q(is_read=False)),
+            )
+        )
+        for row in notifications:
+            counts[row["user_id"]]["notifications_count"] = row["total"]
+            counts[row["user_id"]]["unread_notifications_count"] = row["unread"]
+
+        return counts
+
+    def rebuild_for(self, user_id):
+        counts = self.compute([user_id])[user_id]
+        stats, _ = self.update_or_create(user_id=user_id, defaults=counts)
+        return stats
+
+    def for_user(self, user):
+        """
+        Counters row for `user`, built from the source tables the first
+        time it is requested.
+        """
+        try:
+            return self.get(user=user)
+        except self.model.DoesNotExist:
+            return self.rebuild_for(user.pk)
+
+    def adjust(self, user_id, **deltas):
+        """
+        Apply counter deltas with a single UPDATE ... SET f = f + n,
+        bumping the row version as well.
+
+        Runs inside the caller's transaction, so the counters commit or
+        roll back together with the row that changed. Users without a
+        counters row yet are skipped; for_user() builds it from scratch.
+        """
+        changes = {
+            field: F(field) + delta
+            for field, delta in deltas.items()
+            if delta
+        }
+        self.filter(user_id=user_id).update(
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+            **changes
+        )
+
+    def touch(self, user_id):
+        """
+        Bump the version only: the user's data changed without
+        affecting any counter.
+        """
+        self.adjust(user_id)
+
+    def recount_unread(self, user_id):
+        """
+        Recount unread notifications inside one UPDATE, for writes that
+        don't say whether is_read changed (e.g. a plain save()).
+        """
+        unread = (
+            Notification.objects
+            .filter(user_id=OuterRef("user_id"), is_read=False)
+            .order_by()
+            .values("user_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        self.filter(user_id=user_id).update(
+            unread_notifications_count=Coalesce(Subquery(unread), 0),
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+        )
+
+    def touch_for_project(self, project_id):
+        # Resolves the owner in the UPDATE itself, no extra lookup
+        self.filter(user__projects=project_id).update(
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+        )
+
+
+class DailyRollupManager(models.Manager):
+    def add(self, user_id, cells):
+        """
+        Increment rollup cells for a user.
+        `cells` maps (metric, day, key) -> delta, e.g. a Counter.
+
+        Each cell is an UPDATE ... SET value = value + n, falling back to
+        an INSERT the first time a cell is touched.
+        """
+        for (metric, day, key), delta in cells.items():
+            if not delta:
+                continue
+
+            cell = self.filter(user_id=user_id, metric=metric, day=day, key=key)
+            if cell.update(value=F("value") + delta):
+                continue
+
+            try:
+                with transaction.atomic():
+                    self.create(
+                        user_id=user_id,
+                        metric=metric,
+                        day=day,
+                        key=key,
+                        value=delta,
+                    )
+            except IntegrityError:
+                # Created concurrently, increment the winner's row
+                cell.update(value=F("value") + delta)
+
+    def rebuild(self, user_ids):
+        """
+        Replace the rollups of a batch of users with values recomputed
+        from the source tables. Returns the number of rows written.
+        """
+        rows = [
+            self.model(user_id=user_id, metric=metric, day=day, key=key, value=value)
+            for user_id, cells in rollups.compute(user_ids).items()
+            for (metric, day, key), value in cells.items()
+            if value
+        ]
+
+        # Swap atomically so charts never see a gap
+        with transaction.atomic():
+            self.filter(user_id__in=user_ids).delete()
+            self.bulk_create(rows, batch_size=1000)
+
+        return len(rows)
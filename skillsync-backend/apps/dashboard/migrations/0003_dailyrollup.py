@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0002_userstats_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('metric', models.CharField(choices=[('skills_added', 'Skills added'), ('projects_created', 'Projects created'), ('projects_completed', 'Projects completed'), ('milestones_added', 'Milestones added'), ('milestones_completed', 'Milestones completed')], max_length=30)),
+                ('key', models.CharField(blank=True, default='', max_length=50)),
+                ('value', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'metric', 'day', 'key'), name='daily_rollup_unique_cell')],
+            },
+        ),
+    ]
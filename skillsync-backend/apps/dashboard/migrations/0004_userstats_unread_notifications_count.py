@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:49
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_unread(apps, schema_editor):
+    UserStats = apps.get_model("dashboard", "UserStats")
+    Notification = apps.get_model("notifications", "Notification")
+
+    unread = (
+        Notification.objects
+        .filter(user_id=OuterRef("user_id"), is_read=False)
+        .order_by()
+        .values("user_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    UserStats.objects.update(
+        unread_notifications_count=Coalesce(Subquery(unread), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_dailyrollup'),
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userstats',
+            name='unread_notifications_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_unread, migrations.RunPython.noop),
+    ]
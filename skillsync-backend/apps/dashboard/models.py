@@ -1,3 +1,77 @@
 from django.db import models
+from django.conf import settings
 
-# Create your models here.
+from .managers import UserStatsManager, DailyRollupManager
+
+
+class UserStats(models.Model):
+    """
+    Per-user counters kept up to date by apps.dashboard.signals,
+    so stats endpoints read one row instead of running COUNT(*)s.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="stats",
+    )
+
+    skills_count = models.IntegerField(default=0)
+    projects_count = models.IntegerField(default=0)
+    completed_projects_count = models.IntegerField(default=0)
+    notifications_count = models.IntegerField(default=0)
+    unread_notifications_count = models.IntegerField(default=0)
+
+    # Bumped on every change to the user's dashboard data (ETags)
+    version = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = UserStatsManager()
+
+    def __str__(self):
+        return f"Stats - {self.user_id}"
+
+    @property
+    def etag(self):
+        return f'W/"dashboard-{self.user_id}-{self.version}"'
+
+
+class DailyRollup(models.Model):
+    """
+    Per-user, per-day event counts for the time-series charts,
+    maintained on write by apps.dashboard.signals and rebuilt by
+    `manage.py backfill_rollups`.
+    """
+    METRIC_CHOICES = [
+        ("skills_added", "Skills added"),
+        ("projects_created", "Projects created"),
+        ("projects_completed", "Projects completed"),
+        ("milestones_added", "Milestones added"),
+        ("milestones_completed", "Milestones completed"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+    )
+
+    day = models.DateField()
+    metric = models.CharField(max_length=30, choices=METRIC_CHOICES)
+    # Skill category for skills_added, empty for the other metrics
+    key = models.CharField(max_length=50, blank=True, default="")
+    value = models.IntegerField(default=0)
+
+    objects = DailyRollupManager()
+
+    class Meta:
+        constraints = [
+            # Also serves the (user, metric, day range) time-series reads
+            models.UniqueConstraint(
+                fields=["user", "metric", "day", "key"],
+                name="daily_rollup_unique_cell",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} {self.day} {self.key} = {self.value}"
@@ -0,0 +1,81 @@
+from collections import Counter
+
+from django.db.models import CharField, Count, F, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+
+
+# Rollups count events on the day they happened: deleting a row later
+# does not rewrite history, while un-completing a project/milestone
+# withdraws its completion. The backfill can only see rows that still
+# exist, so it reproduces the same numbers minus deleted rows.
+
+
+NO_KEY = Value("", output_field=CharField())
+
+
+def day_of(value):
+    return timezone.localdate(value)
+
+
+def skill_added(skill):
+    return Counter({("skills_added", day_of(skill.created_at), skill.category): 1})
+
+
+def created(metric, instance):
+    return Counter({(metric, day_of(instance.created_at), ""): 1})
+
+
+def completion_changed(metric, old, new):
+    """
+    Cells to move when completed_at changes from `old` to `new`
+    (either may be None).
+    """
+    cells = Counter()
+    if old == new:
+        return cells
+    if old is not None:
+        cells[(metric, day_of(old), "")] -= 1
+    if new is not None:
+        cells[(metric, day_of(new), "")] += 1
+    return cells
+
+
+def compute(user_ids):
+    """
+    Rebuild rollup cells from the source tables for a batch of users.
+    Returns {user_id: Counter((metric, day, key) -> value)}.
+    """
+    cells = {user_id: Counter() for user_id in user_ids}
+
+    skills = Skill.objects.filter(user_id__in=user_ids)
+    projects = Project.objects.filter(user_id__in=user_ids)
+    milestones = Milestone.objects.filter(project__user_id__in=user_ids)
+
+    sources = [
+        ("skills_added", skills, "user_id", "created_at", F("category")),
+        ("projects_created", projects, "user_id", "created_at", NO_KEY),
+        ("projects_completed", projects, "user_id", "completed_at", NO_KEY),
+        ("milestones_added", milestones, "project__user_id", "created_at", NO_KEY),
+        ("milestones_completed", milestones, "project__user_id", "completed_at", NO_KEY),
+    ]
+
+    for metric, qs, owner, date_field, key in sources:
+        rows = (
+            qs.filter(**{f"{date_field}__isnull": False})
+            .annotate(
+                owner=F(owner),
+                day=TruncDate(date_field),
+                cell_key=key,
+            )
+            .values("owner", "day", "cell_key")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        for row in rows:
+            cells[row["owner"]][(metric, row["day"], row["cell_key"])] += row["total"]
+
+    return cells
@@ -0,0 +1,277 @@
+from collections import Counter
+
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from apps.skills.models import Skill
+from apps.skills.signals import (
+    skills_bulk_created,
+    skills_bulk_updated,
+    skills_deleted,
+)
+from apps.projects.models import Project, Milestone
+from apps.projects.signals import milestones_bulk_changed, projects_bulk_created
+from apps.notifications.models import Notification
+from apps.notifications.signals import (
+    notifications_marked_read,
+    notifications_marked_unread,
+    notifications_bulk_created,
+    notifications_deleted,
+    notifications_merged,
+)
+from .models import UserStats, DailyRollup
+from . import rollups
+
+# Marks a field that was deferred when the instance was loaded
+UNKNOWN = object()
+
+
+def _is_completed(project):
+    # Read from __dict__ so a deferred status never triggers a query
+    return project.__dict__.get("status") == "completed"
+
+
+def _completion_cells(metric, instance, created):
+    """
+    Rollup cells to move for a completed_at change since load,
+    compared through values remembered by remember_completed_at().
+    """
+    previous = None if created else instance._rollup_completed_at
+    current = instance.__dict__.get("completed_at", UNKNOWN)
+    instance._rollup_completed_at = current
+
+    if previous is UNKNOWN or current is UNKNOWN:
+        return Counter()
+    return rollups.completion_changed(metric, previous, current)
+
+
+@receiver(post_init, sender=Project)
+@receiver(post_init, sender=Milestone)
+def remember_completed_at(sender, instance, **kwargs):
+    instance._rollup_completed_at = instance.__dict__.get("completed_at", UNKNOWN)
+
+
+# =========================
+# Skills
+# =========================
+@receiver(post_save, sender=Skill)
+def skill_saved_stats(sender, instance, created, **kwargs):
+    if created:
+        UserStats.objects.adjust(instance.user_id, skills_count=1)
+    else:
+        UserStats.objects.touch(instance.user_id)
+
+
+@receiver(post_save, sender=Skill)
+def skill_saved_rollups(sender, instance, created, **kwargs):
+    if created:
+        DailyRollup.objects.add(instance.user_id, rollups.skill_added(instance))
+
+
+# Skill deletes are reported through skills_deleted rather than
+# post_delete, see apps.skills.signals.
+@receiver(skills_deleted)
+def skills_deleted_stats(sender, counts, **kwargs):
+    for user_id, count in counts.items():
+        UserStats.objects.adjust(user_id, skills_count=-count)
+
+
+@receiver(skills_bulk_created)
+def skills_bulk_created_dashboard(sender, user, skills, **kwargs):
+    UserStats.objects.adjust(user.id, skills_count=len(skills))
+
+    cells = Counter()
+    for skill in skills:
+        cells.update(rollups.skill_added(skill))
+    DailyRollup.objects.add(user.id, cells)
+
+
+@receiver(skills_bulk_updated)
+def skills_bulk_updated_stats(sender, user, skills, **kwargs):
+    UserStats.objects.touch(user.id)
+
+
+# =========================
+# Projects
+# =========================
+@receiver(post_init, sender=Project)
+def project_loaded_stats(sender, instance, **kwargs):
+    instance._stats_completed = (
+        _is_completed(instance)
+        if "status" in instance.__dict__
+        else None
+    )
+
+
+@receiver(post_save, sender=Project)
+def project_saved_stats(sender, instance, created, **kwargs):
+    completed = _is_completed(instance)
+
+    if created:
+        UserStats.objects.adjust(
+            instance.user_id,
+            projects_count=1,
+            completed_projects_count=int(completed),
+        )
+    elif (
+        instance._stats_completed is not None
+        and instance._stats_completed != completed
+    ):
+        UserStats.objects.adjust(
+            instance.user_id,
+            completed_projects_count=1 if completed else -1,
+        )
+    else:
+        UserStats.objects.touch(instance.user_id)
+
+    instance._stats_completed = completed
+
+
+@receiver(post_save, sender=Project)
+def project_saved_rollups(sender, instance, created, **kwargs):
+    cells = _completion_cells("projects_completed", instance, created)
+    if created:
+        cells.update(rollups.created("projects_created", instance))
+    DailyRollup.objects.add(instance.user_id, cells)
+
+
+@receiver(projects_bulk_created)
+def projects_bulk_created_dashboard(sender, user, projects, milestones, **kwargs):
+    cells = Counter()
+    for project in projects:
+        cells.update(rollups.created("projects_created", project))
+        cells.update(rollups.completion_changed(
+            "projects_completed", None, project.completed_at
+        ))
+    for milestone in milestones:
+        cells.update(rollups.created("milestones_added", milestone))
+        cells.update(rollups.completion_changed(
+            "milestones_completed", None, milestone.completed_at
+        ))
+
+    DailyRollup.objects.add(user.pk, cells)
+    UserStats.objects.adjust(
+        user.pk,
+        projects_count=len(projects),
+        completed_projects_count=sum(_is_completed(p) for p in projects),
+    )
+
+
+@receiver(post_delete, sender=Project)
+def project_deleted_stats(sender, instance, **kwargs):
+    UserStats.objects.adjust(
+        instance.user_id,
+        projects_count=-1,
+        completed_projects_count=-int(_is_completed(instance)),
+    )
+
+
+# =========================
+# Milestones
+# =========================
+# No post_delete receiver on purpose: it would stop Django from deleting
+# milestones with a single DELETE. Every path that removes milestones
+# saves their project as well, which bumps the version.
+#
+# Writers of many milestones (the API, the admin inline) bulk write them
+# and send one milestones_bulk_changed instead, so the version is bumped
+# once per project inside their transaction.
+@receiver(post_save, sender=Milestone)
+def milestone_saved_stats(sender, instance, **kwargs):
+    UserStats.objects.touch_for_project(instance.project_id)
+
+
+@receiver(post_save, sender=Milestone)
+def milestone_saved_rollups(sender, instance, created, **kwargs):
+    cells = _completion_cells("milestones_completed", instance, created)
+    if created:
+        cells.update(rollups.created("milestones_added", instance))
+    if not any(cells.values()):
+        return
+
+    if Milestone.project.is_cached(instance):
+        user_id = instance.project.user_id
+    else:
+        user_id = (
+            Project.objects
+            .filter(pk=instance.project_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+    DailyRollup.objects.add(user_id, cells)
+
+
+@receiver(milestones_bulk_changed)
+def milestones_bulk_changed_dashboard(sender, project, created, completion_changes, **kwargs):
+    cells = Counter()
+    for milestone in created:
+        cells.update(rollups.created("milestones_added", milestone))
+        cells.update(rollups.completion_changed(
+            "milestones_completed", None, milestone.completed_at
+        ))
+    for previous, current in completion_changes:
+        cells.update(rollups.completion_changed(
+            "milestones_completed", previous, current
+        ))
+
+    DailyRollup.objects.add(project.user_id, cells)
+    UserStats.objects.touch(project.user_id)
+
+
+# =========================
+# Notifications
+# =========================
+@receiver(post_save, sender=Notification)
+def notification_saved_stats(sender, instance, created, **kwargs):
+    if created:
+        UserStats.objects.adjust(
+            instance.user_id,
+            notifications_count=1,
+            unread_notifications_count=int(not instance.is_read),
+        )
+    else:
+        # is_read may have changed either way
+        UserStats.objects.recount_unread(instance.user_id)
+
+
+# Notification deletes are reported through notifications_deleted
+# rather than post_delete, see apps.notifications.signals.
+@receiver(notifications_deleted)
+def notifications_deleted_stats(sender, counts, unread, **kwargs):
+    for user_id, count in counts.items():
+        UserStats.objects.adjust(
+            user_id,
+            notifications_count=-count,
+            unread_notifications_count=-unread.get(user_id, 0),
+        )
+
+
+@receiver(notifications_bulk_created)
+def notifications_bulk_created_stats(sender, notifications, **kwargs):
+    per_user = Counter(n.user_id for n in notifications)
+    unread = Counter(n.user_id for n in notifications if not n.is_read)
+    for user_id, count in per_user.items():
+        UserStats.objects.adjust(
+            user_id,
+            notifications_count=count,
+            unread_notifications_count=unread[user_id],
+        )
+
+
+@receiver(notifications_merged)
+def notifications_merged_stats(sender, notifications, **kwargs):
+    # Counts are unchanged, the content isn't
+    for user_id in {n.user_id for n in notifications}:
+        UserStats.objects.touch(user_id)
+
+
+@receiver(notifications_marked_read)
+def notifications_marked_read_stats(sender, user_id, count, **kwargs):
+    if count:
+        UserStats.objects.adjust(user_id, unread_notifications_count=-count)
+
+
+@receiver(notifications_marked_unread)
+def notifications_marked_unread_stats(sender, user_id, count, **kwargs):
+    if count:
+        UserStats.objects.adjust(user_id, unread_notifications_count=count)
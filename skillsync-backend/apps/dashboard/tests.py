@@ -1,3 +1,292 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+from .models import UserStats, DailyRollup
+
+
+class DashboardProgressViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="progress@example.com",
+            password="pass12345",
+            name="Progress",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _create_projects(self, count):
+        for i in range(count):
+            project = Project.objects.create(user=self.user, title=f"P{i}")
+            Milestone.objects.create(project=project, title="a", is_completed=True)
+            Milestone.objects.create(project=project, title="b")
+            Milestone.objects.create(project=project, title="c")
+
+    def test_returns_milestone_totals(self):
+        self._create_projects(1)
+        Project.objects.create(user=self.user, title="Empty")
+
+        res = self.client.get("/api/dashboard/progress/")
+
+        self.assertEqual(res.status_code, 200)
+        progress = res.data["project_progress"]
+        self.assertEqual(progress[0]["milestones_total"], 3)
+        self.assertEqual(progress[0]["milestones_completed"], 1)
+        self.assertEqual(progress[0]["progress"], 33)
+        self.assertEqual(progress[1]["milestones_total"], 0)
+        self.assertEqual(progress[1]["progress"], 0)
+
+    def test_query_count_is_constant(self):
+        self._create_projects(2)
+        with self.assertNumQueries(2):
+            self.client.get("/api/dashboard/progress/")
+
+        self._create_projects(25)
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/dashboard/progress/")
+        self.assertEqual(len(res.data["project_progress"]), 27)
+
+
+class UserStatsCountersTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="stats@example.com",
+            password="pass12345",
+            name="Stats",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_counters_follow_writes(self):
+        # First read builds the row from the source tables
+        self.client.get("/api/dashboard/stats/")
+
+        skill = Skill.objects.create(
+            user=self.user, name="Django", category="backend", proficiency="advanced"
+        )
+        project = Project.objects.create(user=self.user, title="P")
+        project.status = "completed"
+        project.save()
+
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/dashboard/stats/")
+        self.assertEqual(res.data, {
+            "total_skills": 1,
+            "total_projects": 1,
+            "completed_projects": 1,
+        })
+
+        skill.delete()
+        project.delete()
+        res = self.client.get("/api/users/stats/")
+        # Two creation notifications are left behind
+        self.assertEqual(res.data, {"skills": 0, "projects": 0, "notifications": 2})
+
+    def test_rebuild_command_repairs_drift(self):
+        Skill.objects.create(
+            user=self.user, name="Vue", category="frontend", proficiency="beginner"
+        )
+        stats = UserStats.objects.for_user(self.user)
+        UserStats.objects.filter(pk=stats.pk).update(skills_count=42)
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_user_stats", "--verify", stdout=StringIO())
+
+        call_command("rebuild_user_stats", stdout=StringIO())
+        stats.refresh_from_db()
+        self.assertEqual(stats.skills_count, 1)
+        self.assertEqual(stats.notifications_count, 1)
+
+
+class DashboardActivityViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="activity@example.com",
+            password="pass12345",
+            name="Activity",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOWS={})
+    def test_pages_through_whole_history(self):
+        for i in range(8):
+            Skill.objects.create(
+                user=self.user, name=f"S{i}", category="other", proficiency="beginner"
+            )
+            Project.objects.create(user=self.user, title=f"P{i}")
+        # 8 skills + 8 projects + 16 creation notifications
+        expected = 32
+
+        seen = []
+        url = "/api/dashboard/activity/?limit=5"
+        while url:
+            with self.assertNumQueries(1) as ctx:
+                res = self.client.get(url)
+            # Every branch is limited before the union, then the union
+            self.assertEqual(ctx.captured_queries[0]["sql"].count("LIMIT"), 4)
+            self.assertLessEqual(len(res.data["results"]), 5)
+            seen.extend(res.data["results"])
+            url = res.data["next"]
+
+        self.assertEqual(len(seen), expected)
+        self.assertEqual(len({item["id"] for item in seen}), expected)
+        dates = [item["date"] for item in seen]
+        self.assertEqual(dates, sorted(dates, reverse=True))
+
+    def test_unpaginated_response_is_a_list(self):
+        Project.objects.create(user=self.user, title="Solo")
+
+        res = self.client.get("/api/dashboard/activity/")
+
+        # The creation notification is written right after the project
+        self.assertEqual([item["type"] for item in res.data], ["notification", "project"])
+        self.assertEqual(res.data[1]["message"], "Created project Solo")
+
+    def test_rejects_bad_cursor(self):
+        res = self.client.get("/api/dashboard/activity/?cursor=nope")
+        self.assertEqual(res.status_code, 400)
+
+
+class DashboardSummaryViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="summary@example.com",
+            password="pass12345",
+            name="Summary",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_etag_revalidation(self):
+        project = Project.objects.create(user=self.user, title="P")
+
+        res = self.client.get("/api/dashboard/summary/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["stats"]["total_projects"], 1)
+        self.assertEqual(res.data["unread_count"], 1)
+        etag = res["ETag"]
+
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/dashboard/summary/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+
+        Milestone.objects.create(project=project, title="M")
+
+        res = self.client.get("/api/dashboard/summary/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
+        self.assertEqual(
+            res.data["progress"]["project_progress"][0]["milestones_total"], 1
+        )
+
+
+    def test_admin_inline_bumps_the_version_once(self):
+        project = Project.objects.create(user=self.user, title="P")
+        done = Milestone.objects.create(project=project, title="Done")
+        admin = User.objects.create_superuser(email="admin@example.com", password="x")
+        self.client.force_login(admin)
+
+        data = {
+            "user": self.user.id,
+            "title": "P",
+            "status": project.status,
+            "milestones-TOTAL_FORMS": 4,
+            "milestones-INITIAL_FORMS": 1,
+            "milestones-0-id": done.id,
+            "milestones-0-project": project.id,
+            "milestones-0-title": "Done",
+            "milestones-0-is_completed": "on",
+        }
+        for i in range(1, 4):
+            data[f"milestones-{i}-project"] = project.id
+            data[f"milestones-{i}-title"] = f"M{i}"
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(f"/admin/projects/project/{project.id}/change/", data)
+        self.assertEqual(res.status_code, 302)
+
+        bumps = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "dashboard_userstats"')
+        ]
+        # One for the project save, one for its milestones
+        self.assertEqual(len(bumps), 2)
+        self.assertEqual(project.milestones.count(), 4)
+        done.refresh_from_db()
+        self.assertIsNotNone(done.completed_at)
+        completed = DailyRollup.objects.filter(
+            user=self.user, metric="milestones_completed"
+        ).values_list("value", flat=True)
+        self.assertEqual(sum(completed), 1)
+
+class DailyRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="rollup@example.com",
+            password="pass12345",
+            name="Rollup",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _cells(self):
+        return {
+            (r.metric, r.key): r.value
+            for r in DailyRollup.objects.filter(user=self.user)
+        }
+
+    def test_maintained_on_write_matches_backfill(self):
+        Skill.objects.create(
+            user=self.user, name="React", category="frontend", proficiency="advanced"
+        )
+        project = Project.objects.create(user=self.user, title="P")
+        milestone = Milestone.objects.create(project=project, title="M")
+        milestone.is_completed = True
+        milestone.save()
+        project.status = "completed"
+        project.save()
+
+        incremental = self._cells()
+        self.assertEqual(incremental, {
+            ("skills_added", "frontend"): 1,
+            ("projects_created", ""): 1,
+            ("projects_completed", ""): 1,
+            ("milestones_added", ""): 1,
+            ("milestones_completed", ""): 1,
+        })
+
+        project.status = "in_progress"
+        project.save()
+        self.assertEqual(self._cells()[("projects_completed", "")], 0)
+
+        DailyRollup.objects.all().delete()
+        call_command("backfill_rollups", stdout=StringIO())
+        incremental.pop(("projects_completed", ""))
+        self.assertEqual(self._cells(), incremental)
+
+    def test_timeseries_endpoint(self):
+        for name in ("Go", "Rust"):
+            Skill.objects.create(
+                user=self.user, name=name, category="backend", proficiency="beginner"
+            )
+
+        res = self.client.get(
+            "/api/dashboard/timeseries/?metric=skills_added&bucket=month"
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.data["series"]["skills_added"]), 1)
+        point = res.data["series"]["skills_added"][0]
+        self.assertEqual((point["key"], point["value"]), ("backend", 2))
+
+        res = self.client.get("/api/dashboard/timeseries/?bucket=year")
+        self.assertEqual(res.status_code, 400)
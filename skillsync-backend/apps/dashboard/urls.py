@@ -3,10 +3,14 @@ from .views import (
     DashboardStatsView,
     DashboardActivityView,
     DashboardProgressView,
+    DashboardSummaryView,
+    DashboardTimeSeriesView,
 )
 
 urlpatterns = [
     path("stats/", DashboardStatsView.as_view()),
     path("activity/", DashboardActivityView.as_view()),
     path("progress/", DashboardProgressView.as_view()),
+    path("summary/", DashboardSummaryView.as_view()),
+    path("timeseries/", DashboardTimeSeriesView.as_view()),
 ]
@@ -1,11 +1,21 @@
+from datetime import timedelta
+
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django.db.models import Count
-
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import replace_query_param
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from django.utils.http import parse_etags
+
+from core.params import parse_date_param
 from apps.skills.models import Skill
-from apps.projects.models import Project, Milestone
-from apps.notifications.models import Notification
+from apps.projects.models import Project
+from .models import UserStats, DailyRollup
+from . import activity
 
 
 class DashboardStatsView(APIView):
@@ -18,64 +28,59 @@ class DashboardStatsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
+        stats = UserStats.objects.for_user(request.user)
+        return Response(self.build(stats))
 
-        total_skills = Skill.objects.filter(user=user).count()
-        total_projects = Project.objects.filter(user=user).count()
-        completed_projects = Project.objects.filter(
-            user=user,
-            status="completed"
-        ).count()
-
-        return Response({
-            "total_skills": total_skills,
-            "total_projects": total_projects,
-            "completed_projects": completed_projects,
-        })
+    @staticmethod
+    def build(stats):
+        return {
+            "total_skills": stats.skills_count,
+            "total_projects": stats.projects_count,
+            "completed_projects": stats.completed_projects_count,
+        }
 
 
 class DashboardActivityView(APIView):
     """
-    Unified recent activity feed
+    Unified activity feed (skills, projects, notifications), newest first
+
+    GET /api/dashboard/activity/                  -> latest 10 items
+    GET /api/dashboard/activity/?limit=20         -> {"next", "results"}
+    GET /api/dashboard/activity/?cursor=<next>    -> following page
     """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
-        activities = []
-
-        # Recent skills
-        for skill in Skill.objects.filter(user=user).order_by("-created_at")[:5]:
-            activities.append({
-                "type": "skill",
-                "message": f"Added skill {skill.name}",
-                "date": skill.created_at,
-            })
-
-        # Recent projects
-        for project in Project.objects.filter(user=user).order_by("-created_at")[:5]:
-            activities.append({
-                "type": "project",
-                "message": f"Created project {project.title}",
-                "date": project.created_at,
-            })
-
-        # Recent notifications
-        for note in Notification.objects.filter(user=user).order_by("-created_at")[:5]:
-            activities.append({
-                "type": "notification",
-                "message": note.title,
-                "date": note.created_at,
-            })
-
-        # Sort all by date (latest first) and limit
-        activities = sorted(
-            activities,
-            key=lambda x: x["date"],
-            reverse=True
-        )[:10]
+        paginated = "limit" in request.query_params or "cursor" in request.query_params
+
+        try:
+            limit = int(request.query_params.get("limit", activity.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, activity.MAX_PAGE_SIZE))
+
+        try:
+            items, next_cursor = activity.get_activity_page(
+                request.user,
+                limit=limit,
+                cursor=request.query_params.get("cursor"),
+            )
+        except activity.InvalidCursor:
+            raise ValidationError({"cursor": "Invalid cursor."})
+
+        if not paginated:
+            return Response(items)
+
+        next_url = None
+        if next_cursor:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", next_cursor
+            )
 
-        return Response(activities)
+        return Response({
+            "next": next_url,
+            "results": items,
+        })
 
 
 class DashboardProgressView(APIView):
@@ -85,36 +90,145 @@ class DashboardProgressView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
+        return Response(self.build(request.user))
 
+    @staticmethod
+    def build(user):
         # Skills by category (for pie/bar charts)
-        skills_by_category = (
+        skills_by_category = list(
             Skill.objects
             .filter(user=user)
             .values("category")
             .annotate(count=Count("id"))
         )
 
-        # Project progress (milestones completion)
+        # Project progress (milestones completion), one aggregated query
         project_progress = []
-        projects = Project.objects.filter(user=user)
+        projects = (
+            Project.objects
+            .filter(user=user)
+            .with_milestone_counts()
+            .order_by("id")
+            .values("id", "title", "milestones_total", "milestones_completed")
+        )
 
         for project in projects:
-            milestones = Milestone.objects.filter(project=project)
-            total = milestones.count()
-            completed = milestones.filter(is_completed=True).count()
-
-            progress = 0
-            if total > 0:
-                progress = int((completed / total) * 100)
-
             project_progress.append({
-                "project_id": project.id,
-                "title": project.title,
-                "progress": progress,
+                "project_id": project["id"],
+                "title": project["title"],
+                "progress": Project.progress_for(
+                    project["milestones_total"],
+                    project["milestones_completed"],
+                ),
+                "milestones_total": project["milestones_total"],
+                "milestones_completed": project["milestones_completed"],
             })
 
-        return Response({
+        return {
             "skills_by_category": skills_by_category,
             "project_progress": project_progress,
+        }
+
+
+class DashboardTimeSeriesView(APIView):
+    """
+    Time-series for charts, read from the daily rollup table only
+
+    GET /api/dashboard/timeseries/?metric=skills_added,projects_completed
+        &from=2026-01-01&to=2026-03-31&bucket=week
+
+    bucket: day | week | month (default week)
+    Defaults: all metrics, the last 90 days.
+    Milestone burn-down = running total of
+    milestones_added - milestones_completed.
+    """
+    permission_classes = [IsAuthenticated]
+
+    BUCKETS = ("day", "week", "month")
+    DEFAULT_RANGE = timedelta(days=90)
+
+    def get(self, request):
+        params = request.query_params
+        valid_metrics = [choice for choice, _ in DailyRollup.METRIC_CHOICES]
+
+        metrics = params.get("metric")
+        metrics = metrics.split(",") if metrics else valid_metrics
+        unknown = set(metrics) - set(valid_metrics)
+        if unknown:
+            raise ValidationError({"metric": f"Unknown metric(s): {', '.join(sorted(unknown))}"})
+
+        bucket = params.get("bucket", "week")
+        if bucket not in self.BUCKETS:
+            raise ValidationError({"bucket": f"Must be one of {', '.join(self.BUCKETS)}."})
+
+        date_to = parse_date_param(params, "to") or timezone.localdate()
+        date_from = parse_date_param(params, "from") or date_to - self.DEFAULT_RANGE
+        if date_from > date_to:
+            raise ValidationError({"from": "Must not be after 'to'."})
+
+        rows = (
+            DailyRollup.objects
+            .filter(
+                user=request.user,
+                metric__in=metrics,
+                day__range=(date_from, date_to),
+            )
+            .annotate(period=Trunc("day", bucket, output_field=DateField()))
+            .values("metric", "period", "key")
+            .annotate(value=Sum("value"))
+            .order_by("metric", "period", "key")
+        )
+
+        series = {metric: [] for metric in metrics}
+        for row in rows:
+            series[row["metric"]].append({
+                "period": row["period"],
+                "key": row["key"],
+                "value": row["value"],
+            })
+
+        return Response({
+            "from": date_from,
+            "to": date_to,
+            "bucket": bucket,
+            "series": series,
         })
+
+
+class DashboardSummaryView(APIView):
+    """
+    Everything the dashboard needs on page load in one response:
+    stats, latest activity, progress and unread notifications count.
+
+    Carries a per-user ETag derived from UserStats.version, which
+    changes whenever the user's skills, projects, milestones or
+    notifications change. A matching If-None-Match gets a 304 after
+    a single lookup, without recomputing anything.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        stats = UserStats.objects.for_user(user)
+        etag = stats.etag
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Authorization",
+        }
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        recent_activity, _ = activity.get_activity_page(user)
+
+        return Response(
+            {
+                "stats": DashboardStatsView.build(stats),
+                "activity": recent_activity,
+                "progress": DashboardProgressView.build(user),
+                "unread_count": stats.unread_notifications_count,
+            },
+            headers=headers,
+        )
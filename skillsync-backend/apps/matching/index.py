@@ -0,0 +1,345 @@
+import math
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.functions import Coalesce
+
+from apps.skills.models import Skill
+
+
+# =========================
+# Weights
+# =========================
+PROFICIENCY_WEIGHT = {
+    "beginner": 1.0,
+    "intermediate": 2.0,
+    "advanced": 3.0,
+}
+
+
+def skill_key(name):
+    """Case and whitespace insensitive key for a free-text skill name."""
+    return " ".join(name.lower().split())
+
+
+def skill_weight(proficiency, years_of_experience):
+    # Experience adds diminishing returns on top of proficiency
+    return PROFICIENCY_WEIGHT.get(proficiency, 1.0) * (
+        1.0 + math.log1p(years_of_experience or 0)
+    )
+
+
+# =========================
+# Index
+# =========================
+class SkillIndex:
+    """
+    In-memory sparse user x skill matrix.
+
+    Rows are users, columns are skill keys, values are skill_weight().
+    Each column keeps a postings dict {row: weight}, materialized into
+    numpy arrays on first use and cached until the column changes, so a
+    query is a handful of vectorized scatter-adds over the postings of
+    the queried skills instead of a scan over all users.
+
+    Updates are per user (set_user), touching only that user's columns.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._columns = {}        # skill key -> column
+        self._names = []          # column -> display name
+        self._postings = []       # column -> {row: weight}
+        self._arrays = {}         # column -> (rows, weights), cache
+        self._rows = {}           # user id -> row
+        self._vectors = []        # row -> {column: weight}
+        self._user_ids = np.zeros(0, dtype=np.int64)
+        self._norms = np.zeros(0)
+
+    def __len__(self):
+        return len(self._rows)
+
+    # -------------------------
+    # Building / updates
+    # -------------------------
+    @classmethod
+    def build(cls, skills):
+        """
+        Index from (user_id, name, proficiency, years_of_experience)
+        tuples, e.g. a values_list() over Skill.
+        """
+        per_user = {}
+        for user_id, name, proficiency, years in skills:
+            per_user.setdefault(user_id, []).append((name, proficiency, years))
+
+        index = cls()
+        for user_id, user_skills in per_user.items():
+            index.set_user(user_id, user_skills)
+        return index
+
+    def set_user(self, user_id, skills):
+        """Replace a user's row with `skills` [(name, proficiency, years)]."""
+        vector = {}
+        for name, proficiency, years in skills:
+            column = self._column(name)
+            vector[column] = max(vector.get(column, 0.0), skill_weight(proficiency, years))
+
+        with self._lock:
+            row = self._row(user_id)
+            old = self._vectors[row]
+
+            for column in old.keys() - vector.keys():
+                del self._postings[column][row]
+                self._arrays.pop(column, None)
+            for column, weight in vector.items():
+                if old.get(column) != weight:
+                    self._postings[column][row] = weight
+                    self._arrays.pop(column, None)
+
+            self._vectors[row] = vector
+            self._norms[row] = math.sqrt(sum(w * w for w in vector.values()))
+
+    def _column(self, name):
+        key = skill_key(name)
+        column = self._columns.get(key)
+        if column is None:
+            with self._lock:
+                column = self._columns.setdefault(key, len(self._names))
+                if column == len(self._names):
+                    self._names.append(name.strip())
+                    self._postings.append({})
+        return column
+
+    def _row(self, user_id):
+        row = self._rows.get(user_id)
+        if row is not None:
+            return row
+
+        row = len(self._vectors)
+        if row == len(self._user_ids):
+            # Grow geometrically so appends stay amortized O(1)
+            size = max(16, 2 * row)
+            self._user_ids = np.resize(self._user_ids, size)
+            self._norms = np.concatenate([self._norms, np.zeros(size - row)])
+        self._user_ids[row] = user_id
+        self._norms[row] = 0.0
+        self._vectors.append({})
+        self._rows[user_id] = row
+        return row
+
+    def _posting_arrays(self, column):
+        arrays = self._arrays.get(column)
+        if arrays is None:
+            postings = self._postings[column]
+            arrays = (
+                np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float64, count=len(postings)),
+            )
+            self._arrays[column] = arrays
+        return arrays
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def _scores(self, query):
+        scores = np.zeros(len(self._vectors))
+        for column, weight in query.items():
+            rows, weights = self._posting_arrays(column)
+            # Rows are unique within a column, plain fancy indexing is safe
+            scores[rows] += weight * weights
+        return scores
+
+    def _top(self, scores, k, query):
+        hits = np.flatnonzero(scores > 0)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k - 1)[:k]]
+        hits = hits[np.lexsort((self._user_ids[hits], -scores[hits]))]
+
+        return [
+            {
+                "user_id": int(self._user_ids[row]),
+                "score": round(float(scores[row]), 4),
+                "skills": sorted(
+                    self._names[column]
+                    for column in self._vectors[row].keys() & query.keys()
+                ),
+            }
+            for row in hits
+        ]
+
+    def similar_users(self, user_id, k=10):
+        """
+        Top-k users by cosine similarity of their weighted skill
+        vectors to `user_id`'s.
+        """
+        with self._lock:
+            row = self._rows.get(user_id)
+            if row is None or not self._norms[row]:
+                return []
+
+            query = self._vectors[row]
+            scores = self._scores(query)
+            norms = self._norms[:len(scores)] * self._norms[row]
+            np.divide(scores, norms, out=scores, where=norms > 0)
+            scores[row] = 0.0
+            return self._top(scores, k, query)
+
+    def candidates(self, skill_names, k=10, exclude=()):
+        """
+        Top-k users for a set of required skills, scored by the sum of
+        their weights over those skills.
+        """
+        with self._lock:
+            query = {}
+            for name in skill_names:
+                column = self._columns.get(skill_key(name))
+                if column is not None:
+                    query[column] = 1.0
+            if not query:
+                return []
+
+            scores = self._scores(query)
+            for user_id in exclude:
+                row = self._rows.get(user_id)
+                if row is not None:
+                    scores[row] = 0.0
+            return self._top(scores, k, query)
+
+
+# =========================
+# Process-wide index
+# =========================
+# Built lazily once per worker. Skill writes in this process mark their
+# users dirty (see apps.matching.signals) and are re-read in one query
+# before the next lookup; a full rebuild every MATCHING_INDEX_MAX_AGE
+# seconds picks up writes made by other workers.
+#
+# A rebuild loads from a snapshot taken when it starts, so users applied
+# to the old index while it runs are kept in _replay and marked dirty
+# again once the new index is swapped in.
+_index = None
+_built_at = 0.0
+_dirty = set()
+_replay = set()
+_rebuilding = False
+_state_lock = threading.Lock()
+# Held for the whole first build only, see _initial_index()
+_load_lock = threading.Lock()
+
+
+def _max_age():
+    return settings.MATCHING_INDEX_MAX_AGE
+
+
+def skill_rows(queryset):
+    """
+    (user_id, name, proficiency, years) for SkillIndex, keyed on the
+    canonical name so "React" and "ReactJS" land in the same column.
+    """
+    return queryset.order_by().values_list(
+        "user_id",
+        Coalesce("canonical__name", "name"),
+        "proficiency",
+        "years_of_experience",
+    )
+
+
+def _load():
+    return SkillIndex.build(
+        skill_rows(Skill.objects.all()).iterator(chunk_size=5000)
+    )
+
+
+def _rebuild_in_background():
+    global _index, _built_at, _rebuilding
+    try:
+        started = time.monotonic()
+        index = _load()
+        with _state_lock:
+            _index, _built_at = index, started
+            _dirty.update(_replay)
+    finally:
+        with _state_lock:
+            _replay.clear()
+            _rebuilding = False
+        # Threads get their own connection, don't leak it
+        connection.close()
+
+
+def mark_dirty(user_ids):
+    with _state_lock:
+        _dirty.update(user_ids)
+
+
+def mark_dirty_on_commit(user_ids):
+    """
+    mark_dirty() once the current transaction commits: a lookup in
+    between would re-read the users before their writes are visible
+    and then consider them clean.
+    """
+    user_ids = list(user_ids)
+    transaction.on_commit(lambda: mark_dirty(user_ids))
+
+
+def reset():
+    """Drop the index; the next get_index() rebuilds it."""
+    global _index
+    with _state_lock:
+        _index = None
+        _dirty.clear()
+        _replay.clear()
+
+
+def _initial_index():
+    global _index, _built_at
+    # Concurrent first lookups wait for one build instead of each
+    # loading their own and overwriting the others'
+    with _load_lock:
+        if _index is None:
+            with _state_lock:
+                _dirty.clear()
+                _replay.clear()
+                _built_at = time.monotonic()
+            index = _load()
+            with _state_lock:
+                _index = index
+        return _index
+
+
+def get_index():
+    global _rebuilding
+
+    if _index is None:
+        _initial_index()
+
+    with _state_lock:
+        index = _index
+        dirty = set(_dirty)
+        _dirty.clear()
+
+        stale = (
+            not _rebuilding
+            and time.monotonic() - _built_at > _max_age()
+        )
+        if stale:
+            _rebuilding = True
+            _replay.clear()
+        if _rebuilding:
+            _replay.update(dirty)
+
+    if stale:
+        threading.Thread(target=_rebuild_in_background, daemon=True).start()
+
+    if dirty:
+        skills = {user_id: [] for user_id in dirty}
+        for user_id, name, proficiency, years in skill_rows(
+            Skill.objects.filter(user_id__in=dirty)
+        ):
+            skills[user_id].append((name, proficiency, years))
+        for user_id, user_skills in skills.items():
+            index.set_user(user_id, user_skills)
+
+    return index
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.skills.models import Skill
+from apps.skills.signals import (
+    skills_bulk_created,
+    skills_bulk_updated,
+    skills_deleted,
+)
+from . import index
+
+
+# Writes only mark the owner dirty, once committed (see
+# index.mark_dirty_on_commit). The index re-reads dirty users in one
+# query right before the next lookup.
+@receiver(post_save, sender=Skill)
+def skill_saved_matching(sender, instance, **kwargs):
+    index.mark_dirty_on_commit([instance.user_id])
+
+
+@receiver(skills_bulk_created)
+@receiver(skills_bulk_updated)
+def skills_bulk_changed_matching(sender, user, skills, **kwargs):
+    index.mark_dirty_on_commit([user.id])
+
+
+@receiver(skills_deleted)
+def skills_deleted_matching(sender, counts, **kwargs):
+    index.mark_dirty_on_commit(counts)
@@ -0,0 +1,157 @@
+import threading
+import time
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from apps.projects.models import Project
+from . import index
+from .index import SkillIndex
+
+
+class SkillIndexTests(TestCase):
+    def test_similarity_and_incremental_updates(self):
+        idx = SkillIndex.build([
+            (1, "React", "advanced", 5),
+            (1, "Django", "intermediate", 2),
+            (2, "react", "advanced", 4),
+            (2, "Django ", "beginner", 0),
+            (3, "React", "beginner", 0),
+            (4, "Figma", "advanced", 3),
+        ])
+
+        matches = idx.similar_users(1, k=10)
+        self.assertEqual([m["user_id"] for m in matches], [2, 3])
+        self.assertEqual(matches[0]["skills"], ["Django", "React"])
+
+        idx.set_user(3, [("Django", "advanced", 10), ("React", "advanced", 10)])
+        self.assertEqual(idx.similar_users(1, k=1)[0]["user_id"], 3)
+
+        idx.set_user(3, [])
+        self.assertEqual([m["user_id"] for m in idx.similar_users(1)], [2])
+
+    def test_candidates(self):
+        idx = SkillIndex.build([
+            (1, "Go", "advanced", 3),
+            (2, "Go", "beginner", 0),
+            (2, "Rust", "beginner", 0),
+            (3, "Python", "advanced", 9),
+        ])
+
+        matches = idx.candidates(["go", "RUST", "Elixir"], k=5, exclude=[1])
+        self.assertEqual([m["user_id"] for m in matches], [2])
+        self.assertEqual(idx.candidates(["Elixir"]), [])
+
+    def test_top_k_on_many_users(self):
+        rows = [
+            (user_id, f"S{skill}", "intermediate", user_id % 7)
+            for user_id in range(1, 20001)
+            for skill in (user_id % 50, user_id % 31)
+        ]
+        idx = SkillIndex.build(rows)
+
+        started = time.perf_counter()
+        matches = idx.candidates(["S1", "S2"], k=20)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(matches), 20)
+        scores = [m["score"] for m in matches]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertLess(elapsed, 0.5)
+
+
+class MatchingViewTests(TestCase):
+    def setUp(self):
+        index.reset()
+        self.user = User.objects.create_user(
+            email="match@example.com", password="pass12345", name="Me"
+        )
+        self.other = User.objects.create_user(
+            email="peer@example.com", password="pass12345", name="Peer"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tearDown(self):
+        index.reset()
+
+    def skill(self, user, name, proficiency="advanced"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Skill.objects.create(
+                user=user, name=name, category="other", proficiency=proficiency
+            )
+
+    def test_index_follows_skill_writes(self):
+        django = self.skill(self.user, "Django")
+        self.assertEqual(self.client.get("/api/matching/users/").data, [])
+
+        # Picked up without rebuilding
+        self.skill(self.other, "django")
+        res = self.client.get("/api/matching/users/")
+        self.assertEqual(
+            [(m["user_id"], m["name"]) for m in res.data], [(self.other.id, "Peer")]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.filter(user=self.other).delete()
+        self.assertEqual(self.client.get("/api/matching/users/").data, [])
+
+        project = Project.objects.create(user=self.user, title="API")
+        project.skills.add(django)
+        self.skill(self.other, "Django", proficiency="beginner")
+        res = self.client.get(f"/api/matching/projects/{project.id}/")
+        self.assertEqual([m["user_id"] for m in res.data], [self.other.id])
+
+    def test_uncommitted_writes_are_not_marked_dirty(self):
+        self.skill(self.user, "Django")
+        index.get_index()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Skill.objects.create(
+                user=self.other, name="Django", category="other", proficiency="advanced"
+            )
+            # A lookup before commit must not consume the user
+            self.assertEqual(self.client.get("/api/matching/users/").data, [])
+        for callback in callbacks:
+            callback()
+
+        res = self.client.get("/api/matching/users/")
+        self.assertEqual([m["user_id"] for m in res.data], [self.other.id])
+
+    def test_writes_applied_during_a_rebuild_survive_the_swap(self):
+        self.skill(self.user, "Django")
+        index.get_index()
+        # Snapshot a rebuild started before the next write
+        snapshot = index._load()
+
+        with mock.patch.object(index, "_max_age", return_value=-1), \
+                mock.patch.object(index.threading, "Thread"):
+            self.skill(self.other, "Django")
+            self.assertEqual(len(index.get_index().similar_users(self.user.id)), 1)
+
+        with mock.patch.object(index, "_load", return_value=snapshot), \
+                mock.patch.object(index, "connection"):
+            index._rebuild_in_background()
+
+        res = self.client.get("/api/matching/users/")
+        self.assertEqual([m["user_id"] for m in res.data], [self.other.id])
+
+    def test_concurrent_first_lookups_build_once(self):
+        loads = []
+
+        def slow_load():
+            loads.append(1)
+            time.sleep(0.05)
+            return SkillIndex()
+
+        with mock.patch.object(index, "_load", side_effect=slow_load):
+            threads = [threading.Thread(target=index.get_index) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(loads), 1)
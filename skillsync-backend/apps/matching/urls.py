@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import SimilarUsersView, ProjectCandidatesView
+
+urlpatterns = [
+    path("users/", SimilarUsersView.as_view()),
+    path("projects/<int:project_id>/", ProjectCandidatesView.as_view()),
+]
@@ -0,0 +1,73 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+
+from apps.users.models import User
+from apps.projects.models import Project
+from . import index
+
+
+DEFAULT_K = 10
+MAX_K = 50
+
+
+class MatchingView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get_k(self):
+        try:
+            k = int(self.request.query_params.get("k", DEFAULT_K))
+        except ValueError:
+            raise ValidationError({"k": "Must be an integer."})
+        return max(1, min(k, MAX_K))
+
+    @staticmethod
+    def with_names(matches):
+        # One query for the page; users deleted since indexing drop out
+        names = dict(
+            User.objects
+            .filter(id__in=[m["user_id"] for m in matches], is_active=True)
+            .values_list("id", "name")
+        )
+        return [
+            {**match, "name": names[match["user_id"]]}
+            for match in matches
+            if match["user_id"] in names
+        ]
+
+
+class SimilarUsersView(MatchingView):
+    """
+    GET /api/matching/users/?k=10
+
+    Users whose skills (weighted by proficiency and experience) are
+    most similar to the requesting user's.
+    """
+
+    def get(self, request):
+        matches = index.get_index().similar_users(request.user.id, k=self.get_k())
+        return Response(self.with_names(matches))
+
+
+class ProjectCandidatesView(MatchingView):
+    """
+    GET /api/matching/projects/:id/?k=10
+
+    Best candidates for one of the user's projects, ranked by their
+    weighted coverage of the project's skills.
+    """
+
+    def get(self, request, project_id):
+        project = get_object_or_404(Project, id=project_id, user=request.user)
+        skill_names = [
+            name for _, name, _, _ in index.skill_rows(project.skills.all())
+        ]
+
+        matches = index.get_index().candidates(
+            skill_names,
+            k=self.get_k(),
+            exclude=[request.user.id],
+        )
+        return Response(self.with_names(matches))
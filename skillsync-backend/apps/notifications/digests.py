@@ -0,0 +1,81 @@
+from django.conf import settings
+
+
+# Item names kept on a coalesced notification; `count` keeps the total
+MAX_ITEMS = 20
+# Item names spelled out in the message
+LISTED_ITEMS = 5
+
+
+def _listing(items, count, quote=False):
+    names = [f"'{item}'" if quote else item for item in items[:LISTED_ITEMS]]
+    listing = ", ".join(names)
+    more = count - len(names)
+    if more > 0:
+        listing += f" and {more} more"
+    return listing
+
+
+def render(kind, count, items):
+    """(title, message) for `count` events of `kind` named by `items`."""
+    if kind == "skill_added":
+        if count == 1:
+            return "New Skill Added", f"You added {items[0]}"
+        return "New Skills Added", f"You added {count} skills: {_listing(items, count)}"
+
+    if kind == "project_created":
+        if count == 1:
+            return "New Project Created", f"Project '{items[0]}' was created"
+        return (
+            "New Projects Created",
+            f"{count} projects were created: {_listing(items, count, quote=True)}",
+        )
+
+    raise ValueError(f"Unknown notification kind: {kind}")
+
+
+def build(user_id, kind, items):
+    """Unsaved Notification for a batch of `kind` events."""
+    from .models import Notification
+
+    title, message = render(kind, len(items), items)
+    return Notification(
+        user_id=user_id,
+        kind=kind,
+        count=len(items),
+        items=list(items[:MAX_ITEMS]),
+        title=title,
+        message=message,
+    )
+
+
+def copy(notification):
+    """
+    Unsaved copy of `notification` to merge() a burst into, so callers'
+    instances (e.g. an outbox batch that may be retried) stay as given.
+    """
+    from .models import Notification
+
+    return Notification(
+        user_id=notification.user_id,
+        kind=notification.kind,
+        count=notification.count,
+        items=list(notification.items),
+        title=notification.title,
+        message=notification.message,
+        is_read=notification.is_read,
+    )
+
+
+def merge(notification, other):
+    """Fold `other` into the open `notification` and re-render it."""
+    notification.count += other.count
+    notification.items = (notification.items + other.items)[:MAX_ITEMS]
+    notification.title, notification.message = render(
+        notification.kind, notification.count, notification.items
+    )
+
+
+def window(kind):
+    """Seconds during which `kind` events merge; 0 never merges."""
+    return settings.NOTIFICATION_COALESCE_WINDOWS.get(kind, 0)
@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.notifications.models import Notification
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply the notification retention policy: delete notifications older "
+        "than NOTIFICATION_RETENTION_DAYS and each user's notifications beyond "
+        "their NOTIFICATION_MAX_PER_USER newest, in small batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_DAYS,
+            help="Maximum age in days (0 keeps everything).",
+        )
+        parser.add_argument(
+            "--max-per-user",
+            type=int,
+            default=settings.NOTIFICATION_MAX_PER_USER,
+            help="Notifications kept per user (0 for no limit).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATION_DELETE_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many rows would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        max_per_user = options["max_per_user"]
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+
+        expired = 0
+        if days:
+            cutoff = timezone.now() - timedelta(days=days)
+            old = Notification.objects.filter(created_at__lt=cutoff)
+            expired = old.count() if dry_run else old.delete_in_batches(batch_size)
+
+        trimmed = 0
+        if max_per_user:
+            over_limit = list(
+                Notification.objects.order_by()
+                .values("user_id")
+                .annotate(total=Count("id"))
+                .filter(total__gt=max_per_user)
+                .values_list("user_id", flat=True)
+            )
+            for user_id in over_limit:
+                surplus = Notification.objects.beyond_limit(user_id, max_per_user)
+                trimmed += (
+                    surplus.count() if dry_run else surplus.delete_in_batches(batch_size)
+                )
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {expired} expired and {trimmed} over-limit notifications."
+            )
+        )
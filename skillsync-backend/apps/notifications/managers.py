@@ -0,0 +1,159 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+class NotificationQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Delete the matched notifications and report per-user counts
+        through notifications_deleted, in place of a post_delete per
+        row (which would also stop Django from fast-deleting).
+        """
+        from .signals import notifications_deleted
+
+        with transaction.atomic():
+            counts = {}
+            unread = {}
+            for row in (
+                self.order_by()
+                .values("user_id")
+                .annotate(total=Count("id"), unread=Count("id", filter=Q(is_read=False)))
+            ):
+                counts[row["user_id"]] = row["total"]
+                unread[row["user_id"]] = row["unread"]
+            result = super().delete()
+            if counts:
+                notifications_deleted.send(
+                    sender=self.model, counts=counts, unread=unread
+                )
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def delete_in_batches(self, batch_size=1000):
+        """
+        Delete the matched rows `batch_size` at a time, walking the
+        primary key, each batch in its own short transaction so no
+        single statement locks or loads a user's whole history.
+        Returns the number of rows deleted.
+        """
+        deleted = 0
+        last_id = 0
+        while True:
+            ids = list(
+                self.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            last_id = ids[-1]
+            deleted += self.model.objects.filter(id__in=ids).delete()[0]
+
+    delete_in_batches.alters_data = True
+    delete_in_batches.queryset_only = True
+
+    def beyond_limit(self, user_id, limit):
+        """
+        The user's notifications older than their `limit` newest ones,
+        found with one index lookup for the boundary row.
+        """
+        mine = self.filter(user_id=user_id)
+        boundary = next(iter(
+            mine.order_by("-created_at", "-id")
+            .values_list("created_at", "id")[limit:limit + 1]
+        ), None)
+        if boundary is None:
+            return self.none()
+        created_at, pk = boundary
+        return mine.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lte=pk)
+        )
+
+
+class NotificationManager(models.Manager.from_queryset(NotificationQuerySet)):
+    def bulk_notify(self, notifications):
+        """
+        Insert many notifications with one bulk_create. bulk_create
+        skips post_save, so listeners get notifications_bulk_created
+        instead.
+        """
+        from .signals import notifications_bulk_created
+
+        notifications = self.bulk_create(notifications)
+        if notifications:
+            notifications_bulk_created.send(
+                sender=self.model,
+                notifications=notifications,
+            )
+        return notifications
+
+    def coalesce_notify(self, notifications):
+        """
+        Insert notifications, folding those of a kind listed in
+        NOTIFICATION_COALESCE_WINDOWS into the user's open notification
+        of that kind (unread, created within the window) instead.
+        Returns (created, merged).
+
+        Concurrent callers are serialized per user by locking the user
+        rows first: locking the open notifications alone can't stop two
+        workers from both finding none and both creating one. (SQLite
+        ignores the lock; it only allows one writer anyway.)
+        """
+        from . import digests
+        from .signals import notifications_merged
+
+        plain = []
+        pending = {}    # (user_id, kind) -> Notification, merged into copies
+        for notification in notifications:
+            key = (notification.user_id, notification.kind)
+            if not digests.window(notification.kind):
+                plain.append(notification)
+            elif key in pending:
+                digests.merge(pending[key], notification)
+            else:
+                pending[key] = digests.copy(notification)
+
+        merged = []
+        with transaction.atomic():
+            if pending:
+                user_ids = sorted({user_id for user_id, _ in pending})
+                # Fixed order, so two workers can't deadlock
+                list(
+                    get_user_model().objects.select_for_update()
+                    .filter(id__in=user_ids).order_by("id")
+                    .values_list("id", flat=True)
+                )
+
+                now = timezone.now()
+                oldest = now - timedelta(
+                    seconds=max(digests.window(kind) for _, kind in pending)
+                )
+                open_notifications = {}
+                for existing in self.filter(
+                    user_id__in=user_ids,
+                    kind__in={kind for _, kind in pending},
+                    is_read=False,
+                    created_at__gte=oldest,
+                ).order_by("created_at", "id"):
+                    opened = now - timedelta(seconds=digests.window(existing.kind))
+                    if existing.created_at >= opened:
+                        # Newest wins
+                        open_notifications[(existing.user_id, existing.kind)] = existing
+
+                for key, existing in open_notifications.items():
+                    if key in pending:
+                        digests.merge(existing, pending.pop(key))
+                        merged.append(existing)
+
+                if merged:
+                    self.bulk_update(merged, ["count", "items", "title", "message"])
+                    notifications_merged.send(sender=self.model, notifications=merged)
+
+            created = self.bulk_notify(plain + list(pending.values()))
+        return created, merged
@@ -1,8 +1,16 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
+from .managers import NotificationManager
+
 
 class Notification(models.Model):
+    KIND_CHOICES = [
+        ("", "Other"),
+        ("skill_added", "Skill added"),
+        ("project_created", "Project created"),
+    ]
+
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -13,7 +21,42 @@ class Notification(models.Model):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
 
+    # Coalesced notifications (see digests.py): `count` events of
+    # `kind`, named by up to digests.MAX_ITEMS `items`
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, blank=True, default="")
+    count = models.PositiveIntegerField(default=1)
+    items = models.JSONField(default=list, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationManager()
+
+    class Meta:
+        indexes = [
+            # Activity feed: newest-first keyset scans per user
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="notification_user_created_idx",
+            ),
+            # ?unread=true: only unread rows, usually a small slice
+            models.Index(
+                fields=["user", "created_at", "id"],
+                condition=models.Q(is_read=False),
+                name="notification_user_unread_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} - {self.user.email}"
+
+    def delete(self, *args, **kwargs):
+        from .signals import notifications_deleted
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            notifications_deleted.send(
+                sender=Notification,
+                counts={self.user_id: 1},
+                unread={self.user_id: int(not self.is_read)},
+            )
+        return result
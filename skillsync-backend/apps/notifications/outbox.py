@@ -0,0 +1,195 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+
+logger = logging.getLogger(__name__)
+
+
+# =========================
+# Notification outbox
+# =========================
+# Requests don't write notifications themselves. They hand unsaved
+# Notification instances to the outbox when their transaction commits,
+# and a background thread inserts them in batches with one bulk_create
+# (coalescing bursts, see digests.py).
+# A slow notifications table no longer adds to create latency, and a
+# rolled-back request never leaves a notification behind.
+#
+# The queue lives in process memory: anything still queued when a
+# worker is killed is lost (a clean shutdown flushes it). Set
+# NOTIFICATION_OUTBOX_MODE = "sync" to insert inline instead, as the dev
+# settings do so runserver and the tests need no worker thread.
+
+
+class Outbox:
+    """
+    Batching queue in front of `deliver(batch)`.
+
+    The worker thread takes up to `batch_size` items, waiting at most
+    `flush_interval` seconds to fill a batch. A failed batch is retried
+    with exponential backoff up to `max_retries` times, then dropped
+    and logged.
+    """
+
+    def __init__(
+        self,
+        deliver,
+        batch_size=500,
+        flush_interval=0.2,
+        max_retries=5,
+        retry_delay=0.5,
+    ):
+        self.deliver = deliver
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._in_flight = 0
+        self._delivered = 0
+        self._retries = 0
+        self._dropped = 0
+
+    # -------------------------
+    # Producer side
+    # -------------------------
+    def put(self, items):
+        for item in items:
+            self._queue.put(item)
+        self._ensure_worker()
+
+    def stats(self):
+        return {
+            "depth": self._queue.qsize(),
+            "in_flight": self._in_flight,
+            "delivered": self._delivered,
+            "retries": self._retries,
+            "dropped": self._dropped,
+        }
+
+    def flush(self, timeout=5.0):
+        """Wait until everything queued so far was handled."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    # -------------------------
+    # Worker side
+    # -------------------------
+    def _ensure_worker(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="notification-outbox",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _take_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            self._in_flight = len(batch)
+            try:
+                self._deliver_with_retries(batch)
+            finally:
+                self._in_flight = 0
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver_with_retries(self, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.deliver(batch)
+            except Exception:
+                if attempt == self.max_retries:
+                    self._dropped += len(batch)
+                    logger.exception(
+                        "Dropping %d notifications after %d attempts",
+                        len(batch),
+                        attempt + 1,
+                    )
+                    return
+                self._retries += 1
+                logger.warning("Notification batch failed, retrying", exc_info=True)
+                time.sleep(self.retry_delay * 2 ** attempt)
+            else:
+                self._delivered += len(batch)
+                return
+
+
+def insert(batch):
+    """
+    coalesce_notify() a batch that may have failed before: a rolled
+    back attempt leaves the pks bulk_create() assigned on the
+    instances, so they are reset to unsaved first.
+    """
+    from .models import Notification
+
+    for notification in batch:
+        notification.pk = None
+        notification._state.adding = True
+    Notification.objects.coalesce_notify(batch)
+
+
+def _deliver(batch):
+    # A long-lived thread must recycle its connection like a request would
+    close_old_connections()
+    try:
+        insert(batch)
+    except Exception:
+        # Reconnect on the next attempt
+        connection.close()
+        raise
+
+
+outbox = Outbox(
+    _deliver,
+    batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+    max_retries=settings.NOTIFICATION_OUTBOX_MAX_RETRIES,
+)
+atexit.register(outbox.flush)
+
+
+def notify(notifications):
+    """
+    Queue unsaved Notification instances for insertion once the current
+    transaction commits (immediately in "sync" mode).
+    """
+    notifications = list(notifications)
+    if not notifications:
+        return
+
+    if settings.NOTIFICATION_OUTBOX_MODE == "sync":
+        from .models import Notification
+
+        Notification.objects.coalesce_notify(notifications)
+    else:
+        transaction.on_commit(lambda: outbox.put(notifications))
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+# =========================
+# Pub/sub for live notifications
+# =========================
+# publish() is called from sync code on any thread (request handlers,
+# the outbox worker); subscribers are SSE streams running on an event
+# loop. The backend is chosen with NOTIFICATION_PUBSUB_BACKEND so a
+# multi-node deployment can swap in one backed by Redis or Postgres
+# LISTEN/NOTIFY without touching the publishers or the stream view.
+
+
+class Subscription:
+    """
+    One connected client. New notifications queue up (bounded); unread
+    count changes only set a flag, so a burst of writes costs the
+    stream a single recount.
+    """
+
+    def __init__(self, broker, user_id, maxsize):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.maxsize = maxsize
+        self._events = []
+        self._unread_changed = False
+        self._wakeup = asyncio.Event()
+
+    def deliver(self, event):
+        # Runs on self.loop
+        if event["event"] == "unread":
+            self._unread_changed = True
+        elif len(self._events) < self.maxsize:
+            self._events.append(event)
+        else:
+            # A client this far behind reloads the list on reconnect anyway
+            logger.warning("Dropping live event for slow client of user %s", self.user_id)
+        self._wakeup.set()
+
+    async def get(self, timeout=None):
+        """
+        Wait up to `timeout` seconds for activity and return
+        (notification events, whether the unread count changed).
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+        events, self._events = self._events, []
+        unread_changed, self._unread_changed = self._unread_changed, False
+        return events, unread_changed
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InMemoryBroker:
+    """
+    Single process broker: events reach the clients connected to this
+    worker only.
+    """
+
+    def __init__(self, maxsize=100):
+        self.maxsize = maxsize
+        self._subscriptions = {}   # user id -> set of Subscription
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        subscription = Subscription(self, user_id, self.maxsize)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id, set())
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                self._subscriptions.pop(subscription.user_id, None)
+
+    def has_subscribers(self, user_id):
+        return user_id in self._subscriptions
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Loop already closed, the stream is going away
+                self.unsubscribe(subscription)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.NOTIFICATION_PUBSUB_BACKEND)()
+    return _broker
@@ -1,8 +1,12 @@
 from rest_framework import serializers
+from core.fieldsets import SparseFieldsetSerializerMixin
 from .models import Notification
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+MAX_BULK_IDS = 500
+
+
+class NotificationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = (
@@ -10,6 +14,20 @@ class NotificationSerializer(serializers.ModelSerializer):
             "title",
             "message",
             "is_read",
+            "kind",
+            "count",
+            "items",
             "created_at",
         )
-        read_only_fields = ("id", "created_at")
+        read_only_fields = ("id", "kind", "count", "items", "created_at")
+
+
+class NotificationBulkActionSerializer(serializers.Serializer):
+    ACTION_CHOICES = ("read", "unread", "delete")
+
+    action = serializers.ChoiceField(choices=ACTION_CHOICES)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_BULK_IDS,
+    )
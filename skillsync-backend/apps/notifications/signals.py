@@ -1,26 +1,115 @@
+from django.db import transaction
 from django.db.models.signals import post_save
-from django.dispatch import receiver
+from django.dispatch import receiver, Signal
 
 from apps.skills.models import Skill
+from apps.skills.signals import skills_bulk_created
 from apps.projects.models import Project
+from apps.projects.signals import projects_bulk_created
 from .models import Notification
+from .outbox import notify
+from . import digests
+from .pubsub import get_broker
 
 
+# Sent after a queryset .update() flipped is_read, which bypasses
+# post_save. Arguments: user_id, count (rows changed).
+notifications_marked_read = Signal()
+
+# Same for flipping is_read back to False. Arguments: user_id, count.
+notifications_marked_unread = Signal()
+
+# Sent by Notification.objects.bulk_notify(), which bypasses post_save.
+# Arguments: notifications (list of created Notification instances).
+notifications_bulk_created = Signal()
+
+# Sent by Notification.delete() and queryset .delete() instead of a
+# post_delete per row. Arguments: counts ({user_id: rows deleted}),
+# unread ({user_id: unread rows among them}).
+notifications_deleted = Signal()
+
+# Sent by Notification.objects.coalesce_notify() after folding new
+# events into existing notifications (count, items, title and message
+# changed; is_read did not). Arguments: notifications.
+notifications_merged = Signal()
+
+
+# Creation events go through the outbox, where events of the same kind
+# coalesce per NOTIFICATION_COALESCE_WINDOWS (see digests.py).
 @receiver(post_save, sender=Skill)
 def skill_created_notification(sender, instance, created, **kwargs):
     if created:
-        Notification.objects.create(
-            user=instance.user,
-            title="New Skill Added",
-            message=f"You added {instance.name}"
-        )
+        notify([digests.build(instance.user_id, "skill_added", [instance.name])])
+
+
+@receiver(skills_bulk_created)
+def skills_bulk_created_notification(sender, user, skills, **kwargs):
+    # One notification for the whole batch
+    notify([
+        digests.build(user.pk, "skill_added", [skill.name for skill in skills])
+    ])
 
 
 @receiver(post_save, sender=Project)
 def project_created_notification(sender, instance, created, **kwargs):
     if created:
-        Notification.objects.create(
-            user=instance.user,
-            title="New Project Created",
-            message=f"Project '{instance.title}' was created"
-        )
+        notify([digests.build(instance.user_id, "project_created", [instance.title])])
+
+
+@receiver(projects_bulk_created)
+def projects_bulk_created_notification(sender, user, projects, **kwargs):
+    notify([
+        digests.build(user.pk, "project_created", [project.title])
+        for project in projects
+    ])
+
+
+# =========================
+# Live push (GET /api/notifications/stream/)
+# =========================
+# Published once the write commits. Publishing never queries: streams
+# recount unread notifications themselves, once per burst.
+def _publish(notifications=(), user_ids=()):
+    from .serializers import NotificationSerializer
+
+    broker = get_broker()
+    for notification in notifications:
+        if broker.has_subscribers(notification.user_id):
+            broker.publish(notification.user_id, {
+                "event": "notification",
+                "data": NotificationSerializer(notification).data,
+            })
+
+    for user_id in {n.user_id for n in notifications} | set(user_ids):
+        if broker.has_subscribers(user_id):
+            broker.publish(user_id, {"event": "unread"})
+
+
+@receiver(notifications_bulk_created)
+def notifications_bulk_created_push(sender, notifications, **kwargs):
+    transaction.on_commit(lambda: _publish(notifications=notifications))
+
+
+@receiver(notifications_merged)
+def notifications_merged_push(sender, notifications, **kwargs):
+    transaction.on_commit(lambda: _publish(notifications=notifications))
+
+
+@receiver(post_save, sender=Notification)
+def notification_saved_push(sender, instance, created, **kwargs):
+    notifications = [instance] if created else ()
+    transaction.on_commit(
+        lambda: _publish(notifications=notifications, user_ids=[instance.user_id])
+    )
+
+
+@receiver(notifications_deleted)
+def notifications_deleted_push(sender, counts, **kwargs):
+    transaction.on_commit(lambda: _publish(user_ids=counts))
+
+
+@receiver(notifications_marked_read)
+@receiver(notifications_marked_unread)
+def notifications_marked_read_push(sender, user_id, count, **kwargs):
+    if count:
+        transaction.on_commit(lambda: _publish(user_ids=[user_id]))
@@ -1,3 +1,419 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from apps.projects.models import Project
+from apps.dashboard.models import UserStats
+from . import digests
+from .models import Notification
+from .outbox import Outbox, insert, outbox
+from .signals import notifications_bulk_created
+
+
+class OutboxTests(TransactionTestCase):
+    def test_batches_and_retries(self):
+        user = User.objects.create_user(email="retry@example.com", password="x")
+        burst = [
+            digests.build(user.id, "skill_added", [f"S{i}"]) for i in range(3)
+        ]
+        plain = [Notification(user=user, title=f"N{i}", message="") for i in range(4)]
+        failures = [RuntimeError("db down"), RuntimeError("db down")]
+
+        # Fails inside coalesce_notify, after bulk_create assigned pks
+        def fail_once(**kwargs):
+            if failures:
+                raise failures.pop()
+
+        def deliver(batch):
+            try:
+                insert(batch)
+            finally:
+                connection.close()
+
+        # Every attempt must start from unsaved instances
+        attempts = []
+        coalesce_notify = Notification.objects.coalesce_notify
+
+        def record(batch):
+            attempts.append([n.pk for n in batch])
+            return coalesce_notify(batch)
+
+        box = Outbox(deliver, batch_size=3, flush_interval=0.05, retry_delay=0.01)
+        notifications_bulk_created.connect(fail_once)
+        try:
+            with self.assertLogs("apps.notifications.outbox", "WARNING"), \
+                    mock.patch.object(Notification.objects, "coalesce_notify", record):
+                box.put(plain + burst)
+                self.assertTrue(box.flush())
+        finally:
+            notifications_bulk_created.disconnect(fail_once)
+
+        self.assertEqual(len(attempts), 5)
+        self.assertEqual({pk for pks in attempts for pk in pks}, {None})
+
+        digest = Notification.objects.get(kind="skill_added")
+        self.assertEqual((digest.count, digest.items), (3, ["S0", "S1", "S2"]))
+        self.assertEqual(
+            sorted(Notification.objects.filter(kind="").values_list("title", flat=True)),
+            ["N0", "N1", "N2", "N3"],
+        )
+        self.assertEqual(
+            box.stats(),
+            {"depth": 0, "in_flight": 0, "delivered": 7, "retries": 2, "dropped": 0},
+        )
+
+    def test_drops_after_max_retries(self):
+        box = Outbox(
+            mock.Mock(side_effect=RuntimeError("db down")),
+            max_retries=1,
+            retry_delay=0.01,
+        )
+        with self.assertLogs("apps.notifications.outbox", "ERROR"):
+            box.put([1, 2])
+            self.assertTrue(box.flush())
+        self.assertEqual(box.stats()["dropped"], 2)
+
+    @override_settings(NOTIFICATION_OUTBOX_MODE="thread")
+    def test_signals_enqueue_on_commit(self):
+        user = User.objects.create_user(email="outbox@example.com", password="x")
+
+        with mock.patch.object(outbox, "put") as put:
+            with transaction.atomic():
+                Skill.objects.create(
+                    user=user, name="Go", category="backend", proficiency="beginner"
+                )
+                # Nothing is written inside the request's transaction
+                self.assertFalse(Notification.objects.exists())
+                put.assert_not_called()
+        (queued,), _ = put.call_args
+        self.assertEqual([n.message for n in queued], ["You added Go"])
+
+
+class NotificationListTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="list@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        Notification.objects.bulk_notify([
+            Notification(user=self.user, title=f"N{i}", message="", is_read=i % 3 == 0)
+            for i in range(12)
+        ])
+
+    def test_cursor_pagination_and_unread_filter(self):
+        seen = []
+        url = "/api/notifications/?unread=true&limit=3"
+        while url:
+            res = self.client.get(url)
+            self.assertTrue(all(not n["is_read"] for n in res.data["results"]))
+            seen.extend(n["id"] for n in res.data["results"])
+            url = res.data["next"]
+
+        expected = Notification.objects.filter(user=self.user, is_read=False)
+        self.assertEqual(
+            seen, list(expected.order_by("-created_at", "-id").values_list("id", flat=True))
+        )
+        # No ?limit= / ?cursor=: the plain list older clients expect
+        self.assertEqual(len(self.client.get("/api/notifications/").data), 12)
+        self.assertEqual(
+            self.client.get("/api/notifications/?unread=maybe").status_code, 400
+        )
+
+    def query_plan(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        (query,) = [
+            q["sql"] for q in ctx.captured_queries
+            if 'FROM "notifications_notification"' in q["sql"]
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {query}")
+            return str(cursor.fetchall())
+
+    def test_list_queries_use_the_indexes(self):
+        plan = self.query_plan("/api/notifications/?limit=5")
+        self.assertIn("notification_user_created_idx", plan)
+
+        plan = self.query_plan("/api/notifications/?unread=true&limit=5")
+        self.assertIn("notification_user_unread_idx", plan)
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="unread@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        UserStats.objects.for_user(self.user)
+        self.notifications = Notification.objects.bulk_notify([
+            Notification(user=self.user, title=f"N{i}", message="")
+            for i in range(4)
+        ])
+
+    def unread(self):
+        with self.assertNumQueries(1):
+            count = self.client.get("/api/notifications/unread-count/").data["unread"]
+        self.assertEqual(
+            count, Notification.objects.filter(user=self.user, is_read=False).count()
+        )
+        return count
+
+    def test_counter_follows_every_write(self):
+        self.assertEqual(self.unread(), 4)
+
+        first, second, third, _ = self.notifications
+        url = f"/api/notifications/{first.id}/read/"
+        self.assertEqual(self.client.patch(url).status_code, 200)
+        # Already read: no change, no drift
+        self.assertEqual(self.client.patch(url).status_code, 200)
+        self.assertEqual(self.unread(), 3)
+
+        self.client.delete(f"/api/notifications/{first.id}/")
+        self.client.delete(f"/api/notifications/{second.id}/")
+        self.assertEqual(self.unread(), 2)
+
+        third.is_read = True
+        third.save()
+        self.assertEqual(self.unread(), 1)
+
+        self.client.post("/api/notifications/mark-all-read/")
+        self.assertEqual(self.unread(), 0)
+
+    def test_bulk_actions(self):
+        other = User.objects.create_user(email="other@example.com", password="x")
+        foreign = Notification.objects.create(user=other, title="Theirs", message="")
+        ids = [n.id for n in self.notifications[:3]] + [foreign.id]
+
+        def bulk(action, ids):
+            res = self.client.post(
+                "/api/notifications/bulk/", {"action": action, "ids": ids}, format="json"
+            )
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual(res.data["unread"], self.unread())
+            return res.data
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(bulk("read", ids)["affected"], 3)
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # notifications, then the counters
+        self.assertEqual(len(updates), 2)
+
+        self.assertEqual(bulk("read", ids)["affected"], 0)
+        self.assertEqual(bulk("unread", ids[:2])["affected"], 2)
+        self.assertEqual(bulk("delete", ids)["affected"], 3)
+        self.assertTrue(Notification.objects.filter(id=foreign.id, is_read=False).exists())
+
+        res = self.client.post(
+            "/api/notifications/bulk/", {"action": "archive", "ids": ids}, format="json"
+        )
+        self.assertEqual(res.status_code, 400)
+
+    def test_mark_read_is_one_update(self):
+        other = User.objects.create_user(email="other@example.com", password="x")
+        url = f"/api/notifications/{self.notifications[0].id}/read/"
+
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.patch(url).status_code, 404)
+
+        self.client.force_authenticate(self.user)
+        with self.assertNumQueries(4):
+            # SAVEPOINT, UPDATE notification, UPDATE stats, RELEASE
+            self.client.patch(url)
+
+
+class CoalescingTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="digest@example.com", password="x")
+        self.stats = UserStats.objects.for_user(self.user)
+
+    def add_skills(self, *names):
+        for name in names:
+            Skill.objects.create(
+                user=self.user, name=name, category="other", proficiency="beginner"
+            )
+
+    def test_burst_merges_into_one_notification(self):
+        self.add_skills("Go", "Rust", "Elm")
+
+        notification = Notification.objects.get(user=self.user)
+        self.assertEqual(notification.kind, "skill_added")
+        self.assertEqual(notification.count, 3)
+        self.assertEqual(notification.items, ["Go", "Rust", "Elm"])
+        self.assertEqual(notification.title, "New Skills Added")
+        self.assertEqual(notification.message, "You added 3 skills: Go, Rust, Elm")
+        self.stats.refresh_from_db()
+        self.assertEqual(self.stats.unread_notifications_count, 1)
+
+    def test_retried_batch_is_counted_once(self):
+        batch = [
+            digests.build(self.user.id, "skill_added", [name])
+            for name in ("Go", "Rust", "Elm")
+        ]
+
+        def fail(**kwargs):
+            raise RuntimeError("db down")
+
+        notifications_bulk_created.connect(fail)
+        try:
+            with self.assertRaises(RuntimeError):
+                Notification.objects.coalesce_notify(batch)
+        finally:
+            notifications_bulk_created.disconnect(fail)
+        Notification.objects.coalesce_notify(batch)
+
+        notification = Notification.objects.get(user=self.user)
+        self.assertEqual(notification.count, 3)
+        self.assertEqual(notification.items, ["Go", "Rust", "Elm"])
+        self.assertEqual([n.count for n in batch], [1, 1, 1])
+
+    def test_read_or_expired_notifications_stay_closed(self):
+        self.add_skills("Go")
+        Notification.objects.update(is_read=True)
+        self.add_skills("Rust")
+        Notification.objects.filter(is_read=False).update(
+            created_at=timezone.now() - timedelta(hours=1)
+        )
+        self.add_skills("Elm", "Lua")
+
+        self.assertEqual(
+            list(Notification.objects.order_by("id").values_list("count", flat=True)),
+            [1, 1, 2],
+        )
+
+    def test_users_are_locked_before_looking_for_open_notifications(self):
+        self.add_skills("Go")
+        with CaptureQueriesContext(connection) as ctx:
+            self.add_skills("Rust")
+
+        sql = [q["sql"] for q in ctx.captured_queries]
+        lock = next(i for i, q in enumerate(sql) if 'FROM "users_user"' in q)
+        lookup = next(i for i, q in enumerate(sql) if 'FROM "notifications_notification"' in q)
+        self.assertLess(lock, lookup)
+        self.assertEqual(Notification.objects.get(user=self.user).count, 2)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOWS={"skill_added": 300, "project_created": 0})
+    def test_window_is_per_kind(self):
+        self.add_skills("Go", "Rust")
+        Project.objects.create(user=self.user, title="A")
+        Project.objects.create(user=self.user, title="B")
+
+        self.assertEqual(Notification.objects.filter(kind="skill_added").count(), 1)
+        self.assertEqual(Notification.objects.filter(kind="project_created").count(), 2)
+
+
+class RetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="retention@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.stats = UserStats.objects.for_user(self.user)
+
+        notifications = Notification.objects.bulk_notify([
+            Notification(user=self.user, title=f"N{i}", message="", is_read=i < 5)
+            for i in range(10)
+        ])
+        # N0..N9 spread over the last 10 weeks, N0 oldest
+        for i, notification in enumerate(notifications):
+            notification.created_at = timezone.now() - timedelta(weeks=10 - i)
+        Notification.objects.bulk_update(notifications, ["created_at"])
+
+    def remaining(self):
+        self.stats.refresh_from_db()
+        titles = set(
+            Notification.objects.filter(user=self.user).values_list("title", flat=True)
+        )
+        self.assertEqual(self.stats.notifications_count, len(titles))
+        self.assertEqual(
+            self.stats.unread_notifications_count,
+            Notification.objects.filter(user=self.user, is_read=False).count(),
+        )
+        return titles
+
+    def test_purge_by_age_then_count(self):
+        call_command(
+            "purge_notifications", "--days=50", "--max-per-user=0",
+            "--batch-size=2", stdout=StringIO(),
+        )
+        self.assertEqual(self.remaining(), {f"N{i}" for i in range(3, 10)})
+
+        call_command(
+            "purge_notifications", "--days=0", "--max-per-user=4", stdout=StringIO(),
+        )
+        self.assertEqual(self.remaining(), {"N6", "N7", "N8", "N9"})
+
+    @override_settings(NOTIFICATION_DELETE_BATCH_SIZE=3)
+    def test_clear_all_deletes_in_batches(self):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.delete("/api/notifications/clear/")
+
+        self.assertEqual(res.status_code, 200)
+        deletes = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('DELETE FROM "notifications_notification"')
+        ]
+        self.assertEqual(len(deletes), 4)
+        self.assertEqual(self.remaining(), set())
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="stream@example.com", password="x")
+        Notification.objects.create(user=self.user, title="Old", message="Unread")
+
+    def notify(self, title):
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.bulk_notify([
+                Notification(user=self.user, title=title, message="Hello")
+            ])
+
+    async def ticket(self):
+        token = str(AccessToken.for_user(self.user))
+        response = await self.async_client.post(
+            "/api/notifications/stream/ticket/",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["ticket"]
+
+    async def test_pushes_notifications_and_unread_count(self):
+        ticket = await self.ticket()
+        response = await self.async_client.get(f"/api/notifications/stream/?ticket={ticket}")
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        self.assertEqual(await anext(stream), b'event: unread\ndata: {"unread": 1}\n\n')
+
+        await sync_to_async(self.notify)("New")
+        self.assertIn(b'"title": "New"', await anext(stream))
+        self.assertEqual(await anext(stream), b'event: unread\ndata: {"unread": 2}\n\n')
+
+        await stream.aclose()
+
+    async def test_requires_valid_ticket(self):
+        token = str(AccessToken.for_user(self.user))
+        ticket = await self.ticket()
+
+        # Access tokens are no longer accepted in the URL
+        for query in (f"token={token}", "ticket=bad", f"ticket={ticket}x"):
+            response = await self.async_client.get(f"/api/notifications/stream/?{query}")
+            self.assertEqual(response.status_code, 401)
+
+        with override_settings(NOTIFICATION_STREAM_TICKET_TTL=-1):
+            response = await self.async_client.get(f"/api/notifications/stream/?ticket={ticket}")
+        self.assertEqual(response.status_code, 401)
+
+        # Revoked along with the user's tokens
+        self.user.token_version += 1
+        await self.user.asave(update_fields=["token_version"])
+        response = await self.async_client.get(f"/api/notifications/stream/?ticket={ticket}")
+        self.assertEqual(response.status_code, 401)
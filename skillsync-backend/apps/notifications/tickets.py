@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+
+
+# =========================
+# Stream tickets
+# =========================
+# EventSource can't send an Authorization header, and an access token
+# in the query string ends up in proxy and access logs. The stream
+# takes a ticket instead: signed, scoped to the stream by its salt and
+# valid for NOTIFICATION_STREAM_TICKET_TTL seconds. It carries the
+# user's token_version, so a password change revokes it like a token.
+SALT = "notifications.stream"
+
+
+def issue(user):
+    return signing.TimestampSigner(salt=SALT).sign(
+        f"{user.pk}:{user.token_version}"
+    )
+
+
+async def user_for(ticket):
+    """The active user a still valid ticket was issued to, or None."""
+    try:
+        value = signing.TimestampSigner(salt=SALT).unsign(
+            ticket, max_age=settings.NOTIFICATION_STREAM_TICKET_TTL
+        )
+        user_id, version = map(int, value.split(":"))
+    except (signing.BadSignature, ValueError):
+        return None
+
+    User = get_user_model()
+    try:
+        user = await User.objects.aget(pk=user_id, token_version=version)
+    except User.DoesNotExist:
+        return None
+    return user if user.is_active else None
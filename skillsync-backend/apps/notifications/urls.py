@@ -6,13 +6,19 @@ from .views import (
     MarkAllReadView,
     NotificationDeleteView,
     ClearAllNotificationsView,
+    NotificationBulkActionView,
+    StreamTicketView,
+    notification_stream,
 )
 
 urlpatterns = [
     path("", NotificationListView.as_view()),
     path("unread-count/", UnreadCountView.as_view()),
+    path("stream/", notification_stream),
+    path("stream/ticket/", StreamTicketView.as_view()),
     path("<int:pk>/read/", MarkAsReadView.as_view()),
     path("mark-all-read/", MarkAllReadView.as_view()),
+    path("bulk/", NotificationBulkActionView.as_view()),
     path("<int:pk>/", NotificationDeleteView.as_view()),
-    path("", ClearAllNotificationsView.as_view()),
+    path("clear/", ClearAllNotificationsView.as_view()),
 ]
@@ -1,43 +1,97 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django.shortcuts import get_object_or_404
 
+from apps.dashboard.models import UserStats
+from apps.users.authentication import CachedJWTAuthentication
+from core.fieldsets import SparseFieldsetViewMixin
+from core.pagination import OptionalCursorPagination
+from . import tickets
 from .models import Notification
-from .serializers import NotificationSerializer
+from .pubsub import get_broker
+from .serializers import NotificationSerializer, NotificationBulkActionSerializer
+from .signals import notifications_marked_read, notifications_marked_unread
+
+
+class NotificationCursorPagination(OptionalCursorPagination):
+    ordering = ("-created_at", "-id")
 
 
-class NotificationListView(generics.ListAPIView):
+class NotificationListView(SparseFieldsetViewMixin, generics.ListAPIView):
+    """
+    GET /api/notifications/            -> newest first
+    GET /api/notifications/?unread=true
+    GET /api/notifications/?fields=id,title,is_read
+
+    Cursor pagination with ?limit= / ?cursor=, served by the
+    (user, created_at, id) indexes.
+    """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
-        return Notification.objects.filter(
+        queryset = Notification.objects.filter(
             user=self.request.user
-        ).order_by("-created_at")
+        ).order_by("-created_at", "-id")
+
+        unread = self.request.query_params.get("unread")
+        if unread:
+            if unread not in ("true", "false"):
+                raise ValidationError({"unread": "Expected true or false."})
+            queryset = queryset.filter(is_read=unread == "false")
+
+        return self.trim_queryset(queryset)
 
 
 class UnreadCountView(generics.GenericAPIView):
+    """
+    GET /api/notifications/unread-count/
+
+    Reads the counter kept on UserStats, no COUNT(*).
+    """
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        count = Notification.objects.filter(
-            user=request.user,
-            is_read=False
-        ).count()
-        return Response({"unread": count})
+        stats = UserStats.objects.for_user(request.user)
+        return Response({"unread": stats.unread_notifications_count})
 
 
 class MarkAsReadView(generics.GenericAPIView):
+    """
+    PATCH /api/notifications/<id>/read/
+
+    One conditional UPDATE; the unread counter only moves when it
+    actually flipped the row.
+    """
     permission_classes = [permissions.IsAuthenticated]
 
     def patch(self, request, pk):
-        notification = get_object_or_404(
-            Notification,
-            pk=pk,
-            user=request.user
-        )
-        notification.is_read = True
-        notification.save()
+        with transaction.atomic():
+            changed = Notification.objects.filter(
+                pk=pk,
+                user=request.user,
+                is_read=False
+            ).update(is_read=True)
+            if changed:
+                notifications_marked_read.send(
+                    sender=Notification,
+                    user_id=request.user.pk,
+                    count=changed,
+                )
+
+        if not changed:
+            # Already read, or not the user's: 404 only for the latter
+            get_object_or_404(Notification.objects.only("id"), pk=pk, user=request.user)
         return Response({"status": "read"})
 
 
@@ -45,13 +99,61 @@ class MarkAllReadView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
-        Notification.objects.filter(
-            user=request.user,
-            is_read=False
-        ).update(is_read=True)
+        with transaction.atomic():
+            count = Notification.objects.filter(
+                user=request.user,
+                is_read=False
+            ).update(is_read=True)
+            notifications_marked_read.send(
+                sender=Notification,
+                user_id=request.user.pk,
+                count=count,
+            )
         return Response({"status": "all read"})
 
 
+class NotificationBulkActionView(generics.GenericAPIView):
+    """
+    POST /api/notifications/bulk/   {"action": "read" | "unread" | "delete",
+                                     "ids": [1, 2, ...]}   (up to 500)
+
+    One UPDATE / DELETE scoped to the user's notifications; ids that
+    aren't theirs are ignored. Returns the rows changed and the new
+    unread count.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = NotificationBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        action = serializer.validated_data["action"]
+        user = request.user
+
+        notifications = Notification.objects.filter(
+            user=user, id__in=serializer.validated_data["ids"]
+        )
+        with transaction.atomic():
+            if action == "delete":
+                affected, _ = notifications.delete()
+            else:
+                is_read = action == "read"
+                affected = notifications.filter(is_read=not is_read).update(
+                    is_read=is_read
+                )
+                signal = (
+                    notifications_marked_read if is_read
+                    else notifications_marked_unread
+                )
+                signal.send(sender=Notification, user_id=user.pk, count=affected)
+
+        stats = UserStats.objects.for_user(user)
+        return Response({
+            "action": action,
+            "affected": affected,
+            "unread": stats.unread_notifications_count,
+        })
+
+
 class NotificationDeleteView(generics.DestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -60,8 +162,109 @@ class NotificationDeleteView(generics.DestroyAPIView):
 
 
 class ClearAllNotificationsView(generics.GenericAPIView):
+    """
+    DELETE /api/notifications/clear/
+
+    Deletes in NOTIFICATION_DELETE_BATCH_SIZE chunks, like the
+    retention purge.
+    """
     permission_classes = [permissions.IsAuthenticated]
 
     def delete(self, request):
-        Notification.objects.filter(user=request.user).delete()
+        Notification.objects.filter(user=request.user).delete_in_batches(
+            settings.NOTIFICATION_DELETE_BATCH_SIZE
+        )
         return Response({"status": "cleared"})
+
+
+# =========================
+# Live stream (Server-Sent Events)
+# =========================
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _authenticate(request):
+    """
+    JWT from the Authorization header, or a stream ticket from ?ticket=
+    since browsers' EventSource can't set headers.
+    """
+    auth = CachedJWTAuthentication()
+    header = auth.get_header(request)
+    if header is None:
+        return await tickets.user_for(request.GET.get("ticket", ""))
+
+    raw_token = auth.get_raw_token(header)
+    if not raw_token:
+        return None
+    try:
+        token = auth.get_validated_token(raw_token)
+        return await sync_to_async(auth.get_user)(token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+
+
+async def _unread_count(user):
+    stats = await sync_to_async(UserStats.objects.for_user)(user)
+    return stats.unread_notifications_count
+
+
+async def _events(user):
+    subscription = get_broker().subscribe(user.pk)
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT
+    try:
+        yield f"retry: {heartbeat * 1000}\n"
+        yield _sse("unread", {"unread": await _unread_count(user)})
+        while True:
+            events, unread_changed = await subscription.get(timeout=heartbeat)
+            if not events and not unread_changed:
+                # Keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                yield _sse(event["event"], event["data"])
+            if unread_changed:
+                yield _sse("unread", {"unread": await _unread_count(user)})
+    finally:
+        subscription.close()
+
+
+class StreamTicketView(generics.GenericAPIView):
+    """
+    POST /api/notifications/stream/ticket/
+
+    A short-lived ticket for opening the stream with ?ticket=, so the
+    access token itself never goes into a URL.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        return Response({
+            "ticket": tickets.issue(request.user),
+            "expires_in": settings.NOTIFICATION_STREAM_TICKET_TTL,
+        })
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    GET /api/notifications/stream/?ticket=<stream ticket>
+
+    text/event-stream replacing unread-count polling:
+    event: unread        data: {"unread": n}   (on connect and on change)
+    event: notification  data: <notification>  (as they are created)
+
+    Runs as an async view: serve it with an ASGI server (core.asgi).
+    """
+    user = await _authenticate(request)
+    if user is None or not user.is_active:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided or are invalid."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    response = StreamingHttpResponse(_events(user), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Don't let nginx buffer the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
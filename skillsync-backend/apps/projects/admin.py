@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Project, Milestone
+from .signals import milestones_bulk_changed
 
 
 class MilestoneInline(admin.TabularInline):
@@ -14,8 +15,58 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ("title", "description")
     inlines = [MilestoneInline]
 
+    def save_formset(self, request, form, formset, change):
+        if formset.model is not Milestone:
+            return super().save_formset(request, form, formset, change)
+
+        # Bulk writes and one milestones_bulk_changed for the project,
+        # as the API does, instead of a post_save (and a dashboard
+        # version bump) per inline row
+        milestones = formset.save(commit=False)
+        Milestone.objects.filter(
+            pk__in=[m.pk for m in formset.deleted_objects]
+        ).delete()
+
+        created = [m for m in milestones if m._state.adding]
+        changed = [m for m in milestones if not m._state.adding]
+        previous = dict(
+            Milestone.objects
+            .filter(pk__in=[m.pk for m in changed])
+            .values_list("pk", "completed_at")
+        )
+
+        completion_changes = []
+        for milestone in milestones:
+            milestone.sync_completed_at()
+            if milestone.pk in previous and milestone.completed_at != previous[milestone.pk]:
+                completion_changes.append((previous[milestone.pk], milestone.completed_at))
+
+        Milestone.objects.bulk_create(created)
+        Milestone.objects.bulk_update(
+            changed, ["title", "is_completed", "completed_at"]
+        )
+        if created or changed:
+            milestones_bulk_changed.send(
+                sender=Milestone,
+                project=form.instance,
+                created=created,
+                completion_changes=completion_changes,
+            )
+
 
 @admin.register(Milestone)
 class MilestoneAdmin(admin.ModelAdmin):
     list_display = ("title", "project", "is_completed", "created_at")
     list_filter = ("is_completed",)
+
+    # Milestone deletes don't fire signals (see apps.dashboard.signals),
+    # saving the parent project records the change instead.
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        obj.project.save(update_fields=["updated_at"])
+
+    def delete_queryset(self, request, queryset):
+        projects = list(Project.objects.filter(milestones__in=queryset).distinct())
+        super().delete_queryset(request, queryset)
+        for project in projects:
+            project.save(update_fields=["updated_at"])
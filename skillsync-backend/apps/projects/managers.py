@@ -0,0 +1,88 @@
+from django.db import models, transaction
+from django.db.models import Case, Count, Prefetch, Q, Value, When
+from django.utils import timezone
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_milestone_counts(self):
+        """
+        Annotate milestones_total / milestones_completed using
+        conditional aggregation, so progress for any number of
+        projects comes back in a single query.
+        """
+        return self.annotate(
+            milestones_total=Count("milestones"),
+            milestones_completed=Count(
+                "milestones",
+                filter=Q(milestones__is_completed=True),
+            ),
+        )
+
+    def with_related(self):
+        """
+        Prefetch everything ProjectSerializer reads, so serializing any
+        number of projects costs a fixed 3 queries.
+        """
+        from .models import Milestone
+
+        return self.prefetch_related(
+            Prefetch("milestones", queryset=Milestone.objects.order_by("id")),
+            "skills",
+        )
+
+
+class MilestoneQuerySet(models.QuerySet):
+    def set_completed(self, states):
+        """
+        Apply completion `states` ({milestone id: True / False / None})
+        to the milestones in this queryset, None meaning "flip".
+
+        The matched rows are locked to read their current state, then
+        every change is written with a single conditional UPDATE, so
+        concurrent toggles serialize instead of losing updates.
+        Returns ({id: (is_completed, completed_at)}, completion_changes)
+        where completion_changes lists (old, new) completed_at pairs.
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            current = {
+                pk: (is_completed, completed_at)
+                for pk, is_completed, completed_at in (
+                    self.filter(id__in=states)
+                    .select_for_update()
+                    .values_list("id", "is_completed", "completed_at")
+                )
+            }
+
+            result = {}
+            completed_ids = []
+            reopened_ids = []
+            completion_changes = []
+            for pk, (is_completed, completed_at) in current.items():
+                target = states[pk]
+                if target is None:
+                    target = not is_completed
+
+                if target == is_completed:
+                    result[pk] = (is_completed, completed_at)
+                    continue
+
+                new_completed_at = now if target else None
+                (completed_ids if target else reopened_ids).append(pk)
+                completion_changes.append((completed_at, new_completed_at))
+                result[pk] = (target, new_completed_at)
+
+            if completed_ids or reopened_ids:
+                self.filter(id__in=completed_ids + reopened_ids).update(
+                    is_completed=Case(
+                        When(id__in=completed_ids, then=Value(True)),
+                        default=Value(False),
+                    ),
+                    completed_at=Case(
+                        When(id__in=completed_ids, then=Value(now)),
+                        default=None,
+                    ),
+                )
+
+        return result, completion_changes
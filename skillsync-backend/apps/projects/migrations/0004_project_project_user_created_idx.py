@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_end_date_project_skills_project_start_date'),
+        ('skills', '0003_skill_skill_user_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='project_user_created_idx'),
+        ),
+    ]
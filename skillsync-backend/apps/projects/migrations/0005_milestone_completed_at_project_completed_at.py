@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:21
+
+from django.db import migrations, models
+
+
+def backfill_completed_at(apps, schema_editor):
+    # Best known completion time for rows completed before the column existed
+    Project = apps.get_model("projects", "Project")
+    Milestone = apps.get_model("projects", "Milestone")
+
+    Project.objects.filter(
+        status="completed",
+        completed_at__isnull=True,
+    ).update(completed_at=models.F("updated_at"))
+
+    Milestone.objects.filter(
+        is_completed=True,
+        completed_at__isnull=True,
+    ).update(completed_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_project_project_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='milestone',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
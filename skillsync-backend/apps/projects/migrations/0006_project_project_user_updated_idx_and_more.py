@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_milestone_completed_at_project_completed_at'),
+        ('skills', '0003_skill_skill_user_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='project_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'status', 'updated_at', 'id'], name='project_user_status_upd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'start_date'], name='project_user_start_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.db import migrations
+
+
+# PostgreSQL only: generated tsvector columns with GIN indexes for
+# full-text search, plus trigram indexes on titles for typo-tolerant
+# matching. Other backends (SQLite in dev) fall back to LIKE queries,
+# see apps/search/queries.py.
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE projects_project ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX project_search_vector_idx ON projects_project USING gin (search_vector)",
+    "CREATE INDEX project_title_trgm_idx ON projects_project USING gin (title gin_trgm_ops)",
+    """
+    ALTER TABLE projects_milestone ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(title, ''))) STORED
+    """,
+    "CREATE INDEX milestone_search_vector_idx ON projects_milestone USING gin (search_vector)",
+    "CREATE INDEX milestone_title_trgm_idx ON projects_milestone USING gin (title gin_trgm_ops)",
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS milestone_title_trgm_idx",
+    "DROP INDEX IF EXISTS milestone_search_vector_idx",
+    "ALTER TABLE projects_milestone DROP COLUMN IF EXISTS search_vector",
+    "DROP INDEX IF EXISTS project_title_trgm_idx",
+    "DROP INDEX IF EXISTS project_search_vector_idx",
+    "ALTER TABLE projects_project DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run(statements):
+    def apply(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_project_user_updated_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(FORWARD_SQL), run(BACKWARD_SQL)),
+    ]
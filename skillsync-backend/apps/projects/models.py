@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from apps.skills.models import Skill
+from .managers import ProjectQuerySet, MilestoneQuerySet
 
 
 class Project(models.Model):
@@ -34,12 +36,60 @@ class Project(models.Model):
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
 
+    # Set when status becomes "completed", cleared when it leaves it
+    completed_at = models.DateTimeField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Activity feed: newest-first keyset scans per user
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="project_user_created_idx",
+            ),
+            # Project list: cursor ordering, optionally filtered by status
+            models.Index(
+                fields=["user", "updated_at", "id"],
+                name="project_user_updated_idx",
+            ),
+            models.Index(
+                fields=["user", "status", "updated_at", "id"],
+                name="project_user_status_upd_idx",
+            ),
+            # Project list: start_date range filter
+            models.Index(
+                fields=["user", "start_date"],
+                name="project_user_start_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if "status" in self.__dict__:
+            self.sync_completed_at()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "status" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "completed_at"}
+        super().save(*args, **kwargs)
+
+    def sync_completed_at(self):
+        if self.status != "completed":
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
+
+    @staticmethod
+    def progress_for(total, completed):
+        if not total:
+            return 0
+        return int((completed / total) * 100)
+
 
 class Milestone(models.Model):
     project = models.ForeignKey(
@@ -50,7 +100,24 @@ class Milestone(models.Model):
 
     title = models.CharField(max_length=200)
     is_completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = MilestoneQuerySet.as_manager()
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        if "is_completed" in self.__dict__:
+            self.sync_completed_at()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "is_completed" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "completed_at"}
+        super().save(*args, **kwargs)
+
+    def sync_completed_at(self):
+        if not self.is_completed:
+            self.completed_at = None
+        elif self.completed_at is None:
+            self.completed_at = timezone.now()
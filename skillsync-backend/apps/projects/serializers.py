@@ -1,12 +1,19 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import Project, Milestone
-from apps.skills.models import Skill
+from .signals import milestones_bulk_changed, projects_bulk_created
+from apps.skills.fields import OwnedSkillField
+from apps.skills.serializers import SkillBriefSerializer
+from core.fieldsets import SparseFieldsetSerializerMixin
 
 
 # =========================
 # Milestone Serializer
 # =========================
 class MilestoneSerializer(serializers.ModelSerializer):
+    # Writable so project updates can match milestones by id
+    id = serializers.IntegerField(required=False)
+
     # Map frontend `completed` -> backend `is_completed`
     completed = serializers.BooleanField(
         source="is_completed",
@@ -20,13 +27,113 @@ class MilestoneSerializer(serializers.ModelSerializer):
             "title",
             "completed",
         )
-        read_only_fields = ("id",)
+
+
+# =========================
+# Milestone Toggle Serializer (batch)
+# =========================
+class MilestoneToggleSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    # Omitted -> flip the current state
+    completed = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+def build_milestones(project, milestones_data):
+    milestones = []
+    for m in milestones_data:
+        milestone = Milestone(
+            project=project,
+            title=m.get("title"),
+            is_completed=m.get("is_completed", False),
+        )
+        milestone.sync_completed_at()
+        milestones.append(milestone)
+    return milestones
+
+
+# =========================
+# Project List Serializer (bulk create)
+# =========================
+class ProjectListSerializer(serializers.ListSerializer):
+    """
+    POST /api/projects/ with a list body.
+
+    Projects, skill links and milestones are each inserted with one
+    bulk_create inside a single transaction, so a batch costs a fixed
+    number of writes however many projects it holds.
+    """
+
+    def to_internal_value(self, data):
+        skills = self.child.fields.get("skills")
+        if (
+            skills is None
+            or not isinstance(data, list)
+            or (self.max_length is not None and len(data) > self.max_length)
+        ):
+            return super().to_internal_value(data)
+
+        # Skill ids of the whole batch in one query, not one per project
+        with skills.prefetched(
+            item.get("skills") for item in data if isinstance(item, dict)
+        ):
+            return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+        SkillLink = Project.skills.through
+
+        with transaction.atomic():
+            projects = []
+            for data in validated_data:
+                data = dict(data)
+                data.pop("milestones", None)
+                data.pop("skills", None)
+                project = Project(user=user, **data)
+                project.sync_completed_at()
+                projects.append(project)
+
+            Project.objects.bulk_create(projects)
+
+            links = []
+            milestones = []
+            for project, data in zip(projects, validated_data):
+                links.extend(
+                    SkillLink(project_id=project.id, skill_id=skill.id)
+                    for skill in dict.fromkeys(data.get("skills", []))
+                )
+                milestones.extend(
+                    build_milestones(project, data.get("milestones", []))
+                )
+
+            SkillLink.objects.bulk_create(links)
+            Milestone.objects.bulk_create(milestones)
+
+            projects_bulk_created.send(
+                sender=Project,
+                user=user,
+                projects=projects,
+                milestones=milestones,
+            )
+
+        # Reload with prefetching so the response is a fixed 3 queries
+        created = (
+            Project.objects
+            .filter(id__in=[p.id for p in projects])
+            .with_related()
+            .in_bulk()
+        )
+        return [created[p.id] for p in projects]
 
 
 # =========================
 # Project Serializer
 # =========================
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    # ?expand=skills -> [{id, name, category}] instead of ids
+    expandable_fields = {
+        "skills": (SkillBriefSerializer, {"many": True}),
+    }
+
     # 🔒 Always guarantee a valid status
     status = serializers.ChoiceField(
         choices=Project.STATUS_CHOICES,
@@ -34,7 +141,7 @@ class ProjectSerializer(serializers.ModelSerializer):
     )
 
     # Frontend field mappings
-    userId = serializers.IntegerField(source="user.id", read_only=True)
+    userId = serializers.IntegerField(source="user_id", read_only=True)
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
     updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
 
@@ -51,11 +158,8 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     milestones = MilestoneSerializer(many=True, required=False)
 
-    skills = serializers.PrimaryKeyRelatedField(
-        queryset=Skill.objects.all(),
-        many=True,
-        required=False
-    )
+    # Only the user's own skills, resolved in one query
+    skills = OwnedSkillField(many=True, required=False)
 
     class Meta:
         model = Project
@@ -72,6 +176,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             "createdAt",
             "updatedAt",
         )
+        list_serializer_class = ProjectListSerializer
 
     # =========================
     # CREATE
@@ -80,20 +185,25 @@ class ProjectSerializer(serializers.ModelSerializer):
         milestones_data = validated_data.pop("milestones", [])
         skills = validated_data.pop("skills", [])
 
-        project = Project.objects.create(
-            user=self.context["request"].user,
-            **validated_data
-        )
+        with transaction.atomic():
+            project = Project.objects.create(
+                user=self.context["request"].user,
+                **validated_data
+            )
 
-        if skills:
-            project.skills.set(skills)
+            if skills:
+                project.skills.set(skills)
 
-        for m in milestones_data:
-            Milestone.objects.create(
-                project=project,
-                title=m.get("title"),
-                is_completed=m.get("is_completed", False),
+            milestones = Milestone.objects.bulk_create(
+                build_milestones(project, milestones_data)
             )
+            if milestones:
+                milestones_bulk_changed.send(
+                    sender=Milestone,
+                    project=project,
+                    created=milestones,
+                    completion_changes=[],
+                )
 
         return project
 
@@ -104,24 +214,88 @@ class ProjectSerializer(serializers.ModelSerializer):
         milestones_data = validated_data.pop("milestones", None)
         skills = validated_data.pop("skills", None)
 
-        # Update scalar fields safely
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
+        with transaction.atomic():
+            # Update scalar fields safely
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
 
-        instance.save()
+            instance.save()
 
-        # Update skills if provided
-        if skills is not None:
-            instance.skills.set(skills)
+            # Update skills if provided
+            if skills is not None:
+                instance.skills.set(skills)
 
-        # Replace milestones if provided
-        if milestones_data is not None:
-            instance.milestones.all().delete()
-            for m in milestones_data:
-                Milestone.objects.create(
-                    project=instance,
-                    title=m.get("title"),
-                    is_completed=m.get("is_completed", False),
-                )
+            # Reconcile milestones if provided
+            if milestones_data is not None:
+                self._sync_milestones(instance, milestones_data)
 
         return instance
+
+    def _sync_milestones(self, project, milestones_data):
+        """
+        Diff the payload against the stored milestones by id:
+        unchanged rows are left alone, changed rows go through one
+        bulk_update, new rows through one bulk_create and missing rows
+        through one DELETE. Payload ids that don't belong to this
+        project are treated as new milestones.
+        """
+        existing = {m.id: m for m in project.milestones.all()}
+        kept = set()
+        to_create = []
+        to_update = []
+        completion_changes = []
+
+        for data in milestones_data:
+            milestone = existing.get(data.get("id"))
+
+            if milestone is None or milestone.id in kept:
+                if not data.get("title"):
+                    raise serializers.ValidationError({
+                        "milestones": "New milestones need a title."
+                    })
+                milestone = Milestone(
+                    project=project,
+                    title=data["title"],
+                    is_completed=data.get("is_completed", False),
+                )
+                milestone.sync_completed_at()
+                to_create.append(milestone)
+                continue
+
+            kept.add(milestone.id)
+            title = data.get("title", milestone.title)
+            is_completed = data.get("is_completed", milestone.is_completed)
+            if (title, is_completed) == (milestone.title, milestone.is_completed):
+                continue
+
+            previous_completed_at = milestone.completed_at
+            milestone.title = title
+            milestone.is_completed = is_completed
+            milestone.sync_completed_at()
+            to_update.append(milestone)
+
+            if milestone.completed_at != previous_completed_at:
+                completion_changes.append(
+                    (previous_completed_at, milestone.completed_at)
+                )
+
+        removed = existing.keys() - kept
+        if removed:
+            Milestone.objects.filter(project=project, id__in=removed).delete()
+
+        if to_update:
+            Milestone.objects.bulk_update(
+                to_update,
+                ["title", "is_completed", "completed_at"],
+            )
+
+        if to_create:
+            Milestone.objects.bulk_create(to_create)
+
+        if to_create or completion_changes:
+            milestones_bulk_changed.send(
+                sender=Milestone,
+                project=project,
+                created=to_create,
+                completion_changes=completion_changes,
+            )
@@ -0,0 +1,18 @@
+from django.dispatch import Signal
+
+
+# Sent after milestones were written with bulk_create / bulk_update /
+# queryset update(), none of which fire post_save.
+# Arguments:
+#   project            -> the Project the milestones belong to
+#   created            -> list of newly created Milestone instances
+#   completion_changes -> list of (old completed_at, new completed_at)
+milestones_bulk_changed = Signal()
+
+# Sent after projects were inserted with bulk_create, which bypasses
+# post_save.
+# Arguments:
+#   user        -> owner of the projects
+#   projects    -> list of created Project instances
+#   milestones  -> list of Milestone instances created with them
+projects_bulk_created = Signal()
@@ -1,3 +1,364 @@
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from .models import Project, Milestone
+
+
+class ProjectAPITestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="projects@example.com",
+            password="pass12345",
+            name="Projects",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.skill = Skill.objects.create(
+            user=self.user, name="Django", category="backend", proficiency="advanced"
+        )
+
+    def create_projects(self, count, **fields):
+        projects = []
+        for i in range(count):
+            project = Project.objects.create(user=self.user, title=f"P{i}", **fields)
+            project.skills.add(self.skill)
+            Milestone.objects.create(project=project, title="M1")
+            Milestone.objects.create(project=project, title="M2", is_completed=True)
+            projects.append(project)
+        return projects
+
+
+class ProjectListViewTests(ProjectAPITestCase):
+    def test_query_count_is_constant(self):
+        self.create_projects(2)
+        with self.assertNumQueries(3):
+            self.client.get("/api/projects/")
+
+        self.create_projects(20)
+        with self.assertNumQueries(3):
+            res = self.client.get("/api/projects/")
+
+        self.assertEqual(len(res.data), 22)
+        self.assertEqual(res.data[0]["skills"], [self.skill.id])
+        self.assertEqual(len(res.data[0]["milestones"]), 2)
+
+    def test_cursor_pagination(self):
+        self.create_projects(5)
+
+        seen = []
+        url = "/api/projects/?limit=2"
+        while url:
+            res = self.client.get(url)
+            self.assertLessEqual(len(res.data["results"]), 2)
+            seen.extend(p["id"] for p in res.data["results"])
+            url = res.data["next"]
+
+        expected = list(
+            Project.objects.order_by("-updated_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_filters(self):
+        self.create_projects(2, status="completed", start_date="2026-02-01")
+        self.create_projects(3, start_date="2026-05-01")
+
+        res = self.client.get("/api/projects/?status=completed")
+        self.assertEqual(len(res.data), 2)
+
+        res = self.client.get("/api/projects/?from=2026-04-01&to=2026-06-30")
+        self.assertEqual(len(res.data), 3)
+
+        res = self.client.get("/api/projects/?status=archived")
+        self.assertEqual(res.status_code, 400)
+
+    def test_sparse_fieldsets(self):
+        self.create_projects(3)
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get("/api/projects/?fields=id,title,status")
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertNotIn("description", ctx.captured_queries[0]["sql"])
+        self.assertEqual(set(res.data[0]), {"id", "title", "status"})
+
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/projects/?fields=id,skills&expand=skills&limit=2")
+        self.assertEqual(
+            res.data["results"][0]["skills"],
+            [{"id": self.skill.id, "name": "Django", "category": "backend"}],
+        )
+
+        # A skill of someone else's linked to the project stays hidden
+        other = User.objects.create_user(email="other-fields@example.com", password="x")
+        theirs = Skill.objects.create(
+            user=other, name="Secret", category="other", proficiency="beginner"
+        )
+        project = Project.objects.get(id=res.data["results"][0]["id"])
+        project.skills.add(theirs)
+        res = self.client.get("/api/projects/?fields=id,skills&expand=skills&limit=2")
+        self.assertEqual(
+            [s["name"] for s in res.data["results"][0]["skills"]], ["Django"]
+        )
+
+        self.assertEqual(self.client.get("/api/projects/?fields=nope").status_code, 400)
+
+
+class ProjectMilestoneSyncTests(ProjectAPITestCase):
+    def put(self, project, milestones):
+        return self.client.put(
+            f"/api/projects/{project.id}/",
+            {"title": project.title, "status": project.status, "milestones": milestones},
+            format="json",
+        )
+
+    def test_reconciles_by_id(self):
+        project = self.create_projects(1)[0]
+        m1, m2 = project.milestones.order_by("id")
+        Milestone.objects.create(project=project, title="M3")
+        created_at = m1.created_at
+
+        res = self.put(project, [
+            {"id": m1.id, "title": "M1", "completed": False},
+            {"id": m2.id, "title": "M2 renamed", "completed": False},
+            {"title": "New"},
+        ])
+
+        self.assertEqual(res.status_code, 200)
+        rows = list(project.milestones.order_by("id").values_list(
+            "id", "title", "is_completed", "completed_at"
+        ))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][:3], (m1.id, "M1", False))
+        self.assertEqual(rows[1], (m2.id, "M2 renamed", False, None))
+        self.assertEqual(rows[2][1], "New")
+        m1.refresh_from_db()
+        self.assertEqual(m1.created_at, created_at)
+
+    def test_foreign_ids_are_not_hijacked(self):
+        mine = self.create_projects(1)[0]
+        other_user = User.objects.create_user(email="other@example.com", password="x")
+        other = Project.objects.create(user=other_user, title="Other")
+        foreign = Milestone.objects.create(project=other, title="Foreign")
+
+        self.put(mine, [{"id": foreign.id, "title": "Mine now?"}])
+
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.title, "Foreign")
+        self.assertEqual(mine.milestones.get().title, "Mine now?")
+
+    def _edit_queries(self, size):
+        project = Project.objects.create(user=self.user, title=f"Sized {size}")
+        Milestone.objects.bulk_create(
+            Milestone(project=project, title=f"M{i}") for i in range(size * 2)
+        )
+        milestones = list(project.milestones.order_by("id"))
+        payload = (
+            # unchanged, toggled, renamed, removed, added
+            [{"id": m.id, "title": m.title} for m in milestones[:size // 2]]
+            + [{"id": m.id, "title": m.title, "completed": True}
+               for m in milestones[size // 2:size]]
+            + [{"id": m.id, "title": "renamed"} for m in milestones[size:size * 3 // 2]]
+            + [{"title": f"new {i}"} for i in range(size)]
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.put(project, payload)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(project.milestones.count(), size * 3 // 2 + size)
+        return len(ctx.captured_queries)
+
+    def test_edit_costs_fixed_queries(self):
+        # First edit of the day also creates the rollup cells
+        self._edit_queries(2)
+        self.assertEqual(self._edit_queries(4), self._edit_queries(20))
+
+
+class ProjectCreateTests(ProjectAPITestCase):
+    def payload(self, title, milestones=3):
+        return {
+            "title": title,
+            "status": "completed",
+            "skills": [self.skill.id],
+            "milestones": [{"title": f"M{i}"} for i in range(milestones)],
+        }
+
+    def test_create_is_atomic(self):
+        with mock.patch(
+            "apps.projects.serializers.Milestone.objects.bulk_create",
+            side_effect=RuntimeError("boom"),
+        ):
+            with self.assertRaises(RuntimeError):
+                self.client.post("/api/projects/", self.payload("Half"), format="json")
+
+        self.assertFalse(Project.objects.filter(title="Half").exists())
+
+    def test_bulk_create(self):
+        self.client.get("/api/dashboard/stats/")
+
+        res = self.client.post(
+            "/api/projects/",
+            [self.payload(f"Bulk {i}") for i in range(10)],
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(res.data), 10)
+        self.assertEqual(res.data[0]["title"], "Bulk 0")
+        self.assertEqual(len(res.data[0]["milestones"]), 3)
+        self.assertEqual(res.data[0]["skills"], [self.skill.id])
+        self.assertEqual(Milestone.objects.count(), 30)
+
+        stats = self.client.get("/api/users/stats/").data
+        self.assertEqual(stats["projects"], 10)
+        # 1 for the skill + 1 digest for the 10 projects
+        self.assertEqual(stats["notifications"], 2)
+        self.assertEqual(
+            self.client.get("/api/dashboard/stats/").data["completed_projects"], 10
+        )
+
+    def test_bulk_create_query_count_is_bounded(self):
+        def run(count):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.post(
+                    "/api/projects/",
+                    [self.payload(f"P{i}", milestones=5) for i in range(count)],
+                    format="json",
+                )
+            return len(ctx.captured_queries)
+
+        run(1)
+        small = run(2)
+        large = run(8)
+        self.assertEqual(large, small)
+
+    def test_skill_ids_resolved_in_one_scoped_query(self):
+        skills = Skill.objects.bulk_create(
+            Skill(user=self.user, name=f"S{i}", category="other", proficiency="beginner")
+            for i in range(40)
+        )
+        ids = [s.id for s in skills]
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.post(
+                "/api/projects/", {"title": "Many", "skills": ids}, format="json"
+            )
+        self.assertEqual(res.status_code, 201)
+        # Validation lookups, as opposed to set() and the response
+        skill_selects = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "skills_skill"') and "JOIN" not in q["sql"]
+        ]
+        self.assertEqual(len(skill_selects), 1)
+
+        other_user = User.objects.create_user(email="other@example.com", password="x")
+        foreign = Skill.objects.create(
+            user=other_user, name="Theirs", category="other", proficiency="beginner"
+        )
+        res = self.client.post(
+            "/api/projects/",
+            {"title": "Bad", "skills": [ids[0], foreign.id, 999999]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertIn(f"{foreign.id}, 999999", str(res.data["skills"]))
+
+        # Fractional ids are rejected, not truncated to another skill
+        res = self.client.post(
+            "/api/projects/",
+            {"title": "Float", "skills": [ids[0] + 0.9]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+
+        # Same checks when the whole batch is resolved up front
+        res = self.client.post(
+            "/api/projects/",
+            [{"title": "Ok", "skills": ids[:2]}, {"title": "Bad", "skills": [foreign.id]}],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.data[0], {})
+        self.assertIn(str(foreign.id), str(res.data[1]["skills"]))
+
+    def test_bulk_create_is_capped(self):
+        res = self.client.post(
+            "/api/projects/",
+            [{"title": f"P{i}"} for i in range(101)],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 400)
+
+
+class MilestoneToggleTests(ProjectAPITestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = self.create_projects(1)[0]
+        self.m1, self.m2 = self.project.milestones.order_by("id")
+
+    def test_single_toggle_flips(self):
+        url = f"/api/projects/{self.project.id}/milestones/{self.m1.id}/"
+
+        res = self.client.patch(url)
+        self.assertEqual(res.data, {"status": "updated", "is_completed": True})
+        self.m1.refresh_from_db()
+        self.assertIsNotNone(self.m1.completed_at)
+
+        other = User.objects.create_user(email="other@example.com", password="x")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.patch(url).status_code, 404)
+
+    def test_single_toggle_rolls_back_with_its_dashboard_writes(self):
+        url = f"/api/projects/{self.project.id}/milestones/{self.m1.id}/"
+
+        with mock.patch(
+            "apps.dashboard.models.DailyRollup.objects.add",
+            side_effect=RuntimeError("db down"),
+        ):
+            with self.assertRaises(RuntimeError):
+                self.client.patch(url)
+
+        self.m1.refresh_from_db()
+        self.assertFalse(self.m1.is_completed)
+
+    def test_batch_toggle(self):
+        extra = [
+            Milestone.objects.create(project=self.project, title=f"X{i}")
+            for i in range(10)
+        ]
+        payload = (
+            [{"id": self.m1.id}, {"id": self.m2.id, "completed": False}]
+            + [{"id": m.id, "completed": True} for m in extra]
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.patch(
+                f"/api/projects/{self.project.id}/milestones/", payload, format="json"
+            )
+        updates = [
+            q for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "projects_milestone"')
+        ]
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(res.data["milestones_total"], 12)
+        self.assertEqual(res.data["milestones_completed"], 11)
+        self.assertEqual(res.data["progress"], 91)
+        states = {m["id"]: m["completed"] for m in res.data["milestones"]}
+        self.assertEqual(states[self.m1.id], True)
+        self.assertEqual(states[self.m2.id], False)
+        self.assertFalse(Milestone.objects.get(id=self.m2.id).completed_at)
+
+    def test_batch_rejects_unknown_ids(self):
+        res = self.client.patch(
+            f"/api/projects/{self.project.id}/milestones/",
+            [{"id": self.m1.id, "completed": True}, {"id": 999999}],
+            format="json",
+        )
 
-# Create your tests here.
+        self.assertEqual(res.status_code, 400)
+        self.assertFalse(Milestone.objects.get(id=self.m1.id).is_completed)
@@ -3,11 +3,16 @@ from .views import (
     ProjectListCreateView,
     ProjectDetailView,
     ToggleMilestoneView,
+    BulkToggleMilestonesView,
 )
 
 urlpatterns = [
     path("", ProjectListCreateView.as_view()),
     path("<int:pk>/", ProjectDetailView.as_view()),
+    path(
+        "<int:project_id>/milestones/",
+        BulkToggleMilestonesView.as_view(),
+    ),
     path(
         "<int:project_id>/milestones/<int:milestone_id>/",
         ToggleMilestoneView.as_view(),
@@ -1,21 +1,69 @@
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
+from core.fieldsets import SparseFieldsetViewMixin
+from core.pagination import OptionalCursorPagination
+from core.params import parse_date_param
 from .models import Project, Milestone
-from .serializers import ProjectSerializer
+from .serializers import ProjectSerializer, MilestoneToggleSerializer
+from .signals import milestones_bulk_changed
 
 
-class ProjectListCreateView(generics.ListCreateAPIView):
+MAX_BULK_CREATE = 100
+MAX_BULK_TOGGLE = 200
+
+
+class ProjectCursorPagination(OptionalCursorPagination):
+    ordering = ("-updated_at", "-id")
+
+
+class ProjectListCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
     """
     GET  /api/projects/        -> List user's projects
     POST /api/projects/        -> Create project with optional milestones
+                                  (a list body creates up to 100 at once)
+
+    Optional filters:
+    ?status=planned|in_progress|completed
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD   (start_date range)
+    Cursor pagination with ?limit= / ?cursor=, newest update first.
+
+    Sparse fieldsets (columns and prefetches are trimmed to match):
+    ?fields=id,title,status
+    ?expand=skills                    (skill objects instead of ids)
     """
     serializer_class = ProjectSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ProjectCursorPagination
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user)
+        queryset = (
+            Project.objects
+            .filter(user=self.request.user)
+            .with_related()
+            .order_by("-updated_at", "-id")
+        )
+        params = self.request.query_params
+
+        project_status = params.get("status")
+        if project_status:
+            if project_status not in dict(Project.STATUS_CHOICES):
+                raise ValidationError({"status": "Invalid status."})
+            queryset = queryset.filter(status=project_status)
+
+        date_from = parse_date_param(params, "from")
+        if date_from:
+            queryset = queryset.filter(start_date__gte=date_from)
+
+        date_to = parse_date_param(params, "to")
+        if date_to:
+            queryset = queryset.filter(start_date__lte=date_to)
+
+        return self.trim_queryset(queryset)
 
     def get_serializer_context(self):
         """
@@ -26,6 +74,23 @@ class ProjectListCreateView(generics.ListCreateAPIView):
         context["request"] = self.request
         return context
 
+    def create(self, request, *args, **kwargs):
+        """
+        A list body creates many projects in one request
+        (see ProjectListSerializer).
+        """
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=MAX_BULK_CREATE,
+        )
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
 
 class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -37,7 +102,36 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Project.objects.filter(user=self.request.user)
+        return Project.objects.filter(user=self.request.user).with_related()
+
+
+def set_milestones_completed(project, states):
+    """
+    Write completion `states` for milestones of an owned `project`
+    (see MilestoneQuerySet.set_completed) and report the change to
+    the dashboard, since a queryset update skips post_save.
+    """
+    result, completion_changes = Milestone.objects.filter(
+        project=project,
+    ).set_completed(states)
+
+    if completion_changes:
+        milestones_bulk_changed.send(
+            sender=Milestone,
+            project=project,
+            created=[],
+            completion_changes=completion_changes,
+        )
+    return result
+
+
+def get_owned_project(request, project_id):
+    # Only what the milestone writes and signals need
+    return get_object_or_404(
+        Project.objects.only("id", "user_id"),
+        id=project_id,
+        user=request.user,
+    )
 
 
 class ToggleMilestoneView(generics.GenericAPIView):
@@ -47,20 +141,78 @@ class ToggleMilestoneView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def patch(self, request, project_id, milestone_id):
-        milestone = get_object_or_404(
-            Milestone,
-            id=milestone_id,
-            project__id=project_id,
-            project__user=request.user,
+        project = get_owned_project(request, project_id)
+        # The dashboard writes made by the signal commit with the toggle
+        with transaction.atomic():
+            result = set_milestones_completed(project, {milestone_id: None})
+        if milestone_id not in result:
+            raise Http404
+
+        return Response(
+            {
+                "status": "updated",
+                "is_completed": result[milestone_id][0],
+            },
+            status=status.HTTP_200_OK,
         )
 
-        milestone.is_completed = not milestone.is_completed
-        milestone.save()
+
+class BulkToggleMilestonesView(generics.GenericAPIView):
+    """
+    PATCH /api/projects/:project_id/milestones/
+
+    Body: [{"id": 1, "completed": true}, {"id": 2}, ...]
+    Omitting "completed" flips the milestone. All changes land in one
+    UPDATE; the response carries the new states and project progress.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def patch(self, request, project_id):
+        serializer = MilestoneToggleSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=MAX_BULK_TOGGLE,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        states = {}
+        for item in serializer.validated_data:
+            states[item["id"]] = item["completed"]
+
+        project = get_owned_project(request, project_id)
+        with transaction.atomic():
+            result = set_milestones_completed(project, states)
+
+            # All or nothing: unknown ids undo the whole batch
+            missing = sorted(states.keys() - result.keys())
+            if missing:
+                raise ValidationError({"ids": f"Unknown milestones: {missing}"})
+
+        counts = (
+            Project.objects
+            .filter(id=project.id)
+            .with_milestone_counts()
+            .values("milestones_total", "milestones_completed")
+            .get()
+        )
 
         return Response(
             {
-                "status": "updated",
-                "is_completed": milestone.is_completed,
+                "milestones": [
+                    {
+                        "id": pk,
+                        "completed": is_completed,
+                        "completedAt": completed_at,
+                    }
+                    for pk, (is_completed, completed_at) in sorted(result.items())
+                ],
+                "milestones_total": counts["milestones_total"],
+                "milestones_completed": counts["milestones_completed"],
+                "progress": Project.progress_for(
+                    counts["milestones_total"],
+                    counts["milestones_completed"],
+                ),
             },
             status=status.HTTP_200_OK,
         )
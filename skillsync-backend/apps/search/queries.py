@@ -0,0 +1,163 @@
+import re
+
+from django.db import connection
+from django.db.models import (
+    BooleanField,
+    Case,
+    CharField,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.expressions import RawSQL
+
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+
+# Word characters only, so user input never reaches to_tsquery syntax
+TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# =========================
+# Sources
+# =========================
+# Each source is projected onto the same columns so they can be combined
+# with UNION ALL and ranked in one query: type, ref_id, text, parent_id
+# (the owning project), plus rank once matched.
+def _projects(user):
+    return Project.objects.filter(user=user).annotate(
+        type=Value("project", output_field=CharField()),
+        ref_id=F("id"),
+        text=F("title"),
+        parent_id=F("id"),
+    )
+
+
+def _milestones(user):
+    return Milestone.objects.filter(project__user=user).annotate(
+        type=Value("milestone", output_field=CharField()),
+        ref_id=F("id"),
+        text=F("title"),
+        parent_id=F("project_id"),
+    )
+
+
+def _skills(user):
+    return Skill.objects.filter(user=user).annotate(
+        type=Value("skill", output_field=CharField()),
+        ref_id=F("id"),
+        text=F("name"),
+        parent_id=Value(None, output_field=IntegerField()),
+    )
+
+
+# (source, model, title column, other searchable columns)
+SOURCES = (
+    (_projects, Project, "title", ("description",)),
+    (_milestones, Milestone, "title", ()),
+    (_skills, Skill, "name", ()),
+)
+
+FIELDS = ("type", "ref_id", "text", "parent_id", "rank")
+
+
+# =========================
+# Matching
+# =========================
+def _match_postgres(qs, model, title, others, q, terms):
+    """
+    Full-text match on the generated search_vector column (GIN indexed,
+    see the search_vector migrations) with prefix terms, OR a trigram
+    match on the title for typos. Ranked by ts_rank + similarity.
+    """
+    table = model._meta.db_table
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+
+    matched = RawSQL(
+        f"({table}.search_vector @@ to_tsquery('simple', %s)"
+        f" OR {table}.{title} %% %s)",
+        [tsquery, q],
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f"ts_rank({table}.search_vector, to_tsquery('simple', %s))"
+        f" + similarity({table}.{title}, %s)",
+        [tsquery, q],
+        output_field=FloatField(),
+    )
+    return qs.filter(matched).annotate(rank=rank)
+
+
+def _match_fallback(qs, model, title, others, q, terms):
+    """
+    LIKE-based match for backends without full-text search (SQLite in
+    dev): every term must appear in one of the searchable columns.
+    Title matches rank above body-only matches.
+    """
+    condition = Q()
+    for term in terms:
+        term_condition = Q(**{f"{title}__icontains": term})
+        for column in others:
+            term_condition |= Q(**{f"{column}__icontains": term})
+        condition &= term_condition
+
+    rank = Case(
+        When(**{f"{title}__iexact": q}, then=Value(1.0)),
+        When(**{f"{title}__istartswith": q}, then=Value(0.75)),
+        When(**{f"{title}__icontains": q}, then=Value(0.5)),
+        default=Value(0.25),
+        output_field=FloatField(),
+    )
+    return qs.filter(condition).annotate(rank=rank)
+
+
+# =========================
+# Search
+# =========================
+def search(user, q, limit=DEFAULT_PAGE_SIZE, offset=0):
+    """
+    Rank the user's projects, milestones and skills against `q`.
+
+    One UNION ALL query, ordered by rank and limited in the database.
+    Returns (items, has_more).
+    """
+    terms = TERM_RE.findall(q.lower())
+    if not terms:
+        return [], False
+
+    match = (
+        _match_postgres
+        if connection.vendor == "postgresql"
+        else _match_fallback
+    )
+
+    querysets = [
+        match(source(user), model, title, others, q, terms).values(*FIELDS)
+        for source, model, title, others in SOURCES
+    ]
+
+    first, *rest = querysets
+    rows = list(
+        first.union(*rest, all=True)
+        .order_by("-rank", "type", "ref_id")[offset:offset + limit + 1]
+    )
+
+    has_more = len(rows) > limit
+    items = [
+        {
+            "type": row["type"],
+            "id": row["ref_id"],
+            "title": row["text"],
+            "project_id": row["parent_id"],
+            "rank": round(row["rank"], 4),
+        }
+        for row in rows[:limit]
+    ]
+    return items, has_more
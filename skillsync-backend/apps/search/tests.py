@@ -0,0 +1,64 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+
+
+class SearchViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="search@example.com",
+            password="pass12345",
+            name="Search",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        self.skill = Skill.objects.create(
+            user=self.user, name="Django", category="backend", proficiency="advanced"
+        )
+        self.project = Project.objects.create(
+            user=self.user, title="Portfolio", description="Built with Django and React"
+        )
+        self.milestone = Milestone.objects.create(
+            project=self.project, title="Deploy django app"
+        )
+        Project.objects.create(user=self.user, title="Unrelated")
+
+        other = User.objects.create_user(email="other@example.com", password="x")
+        Skill.objects.create(
+            user=other, name="Django", category="backend", proficiency="beginner"
+        )
+
+    def test_ranks_across_sources(self):
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/search/?q=django")
+
+        self.assertEqual(res.status_code, 200)
+        results = res.data["results"]
+        self.assertEqual(
+            [(r["type"], r["id"]) for r in results],
+            [
+                ("skill", self.skill.id),
+                ("milestone", self.milestone.id),
+                ("project", self.project.id),
+            ],
+        )
+        self.assertEqual(results[1]["project_id"], self.project.id)
+
+    def test_paginates(self):
+        res = self.client.get("/api/search/?q=django&limit=2")
+        self.assertEqual(len(res.data["results"]), 2)
+        self.assertIsNotNone(res.data["next"])
+
+        res = self.client.get(res.data["next"])
+        self.assertEqual(len(res.data["results"]), 1)
+        self.assertIsNone(res.data["next"])
+
+    def test_requires_query(self):
+        self.assertEqual(self.client.get("/api/search/").status_code, 400)
+        self.assertEqual(
+            self.client.get("/api/search/?q=%20%21").data["results"], []
+        )
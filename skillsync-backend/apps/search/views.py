@@ -0,0 +1,55 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from . import queries
+
+
+class SearchView(APIView):
+    """
+    Ranked search across the user's projects, milestones and skills
+
+    GET /api/search/?q=django                -> {"next", "results"}
+    GET /api/search/?q=django&limit=10&offset=10
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        q = request.query_params.get("q", "").strip()
+        if not q:
+            raise ValidationError({"q": "This parameter is required."})
+
+        limit = self._int_param("limit", queries.DEFAULT_PAGE_SIZE)
+        limit = max(1, min(limit, queries.MAX_PAGE_SIZE))
+        offset = max(0, self._int_param("offset", 0))
+
+        items, has_more = queries.search(request.user, q, limit=limit, offset=offset)
+
+        next_url = None
+        if has_more:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "offset", offset + limit
+            )
+
+        previous_url = None
+        if offset:
+            url = request.build_absolute_uri()
+            previous_url = (
+                replace_query_param(url, "offset", offset - limit)
+                if offset > limit
+                else remove_query_param(url, "offset")
+            )
+
+        return Response({
+            "next": next_url,
+            "previous": previous_url,
+            "results": items,
+        })
+
+    def _int_param(self, name, default):
+        try:
+            return int(self.request.query_params.get(name, default))
+        except ValueError:
+            raise ValidationError({name: "Must be an integer."})
@@ -0,0 +1,246 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from apps.skills.models import Skill, CanonicalSkill
+from apps.projects.models import Project, Milestone
+from apps.notifications.models import Notification
+from apps.dashboard.models import UserStats, DailyRollup
+from apps.matching import index as matching
+from .serializers import (
+    SkillRecordSerializer,
+    ProjectRecordSerializer,
+    NotificationRecordSerializer,
+    RECORD_SERIALIZERS,
+)
+
+
+CHUNK_SIZE = 500
+BATCH_SIZE = 500
+
+
+# =========================
+# Export
+# =========================
+def export_records(user):
+    """
+    Yield every skill, project (with milestones and skill links) and
+    notification of `user` as plain dicts. Querysets are read with
+    chunked iterator() so memory stays flat whatever the account size.
+    """
+    skills = Skill.objects.filter(user=user).order_by("id")
+    for skill in skills.iterator(chunk_size=CHUNK_SIZE):
+        yield {"type": "skill", **SkillRecordSerializer(skill).data}
+
+    projects = (
+        Project.objects
+        .filter(user=user)
+        .order_by("id")
+        .prefetch_related(
+            Prefetch("milestones", queryset=Milestone.objects.order_by("id")),
+            Prefetch("skills", queryset=Skill.objects.only("id")),
+        )
+    )
+    for project in projects.iterator(chunk_size=CHUNK_SIZE):
+        project.skill_ids = [skill.id for skill in project.skills.all()]
+        yield {"type": "project", **ProjectRecordSerializer(project).data}
+
+    notifications = Notification.objects.filter(user=user).order_by("id")
+    for notification in notifications.iterator(chunk_size=CHUNK_SIZE):
+        yield {"type": "notification", **NotificationRecordSerializer(notification).data}
+
+
+def export_lines(user):
+    for record in export_records(user):
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+# =========================
+# Import
+# =========================
+def _restore_timestamps(model, objs, stamps, fields):
+    # auto_now / auto_now_add override values on insert, so exported
+    # timestamps are written back with one bulk_update per batch.
+    restored = []
+    for obj, values in zip(objs, stamps):
+        values = {f: values[f] for f in fields if values.get(f)}
+        if values:
+            for field, value in values.items():
+                setattr(obj, field, value)
+            restored.append(obj)
+    if restored:
+        model.objects.bulk_update(restored, fields)
+
+
+class _Importer:
+    """
+    Buffers validated records and writes them in bulk_create batches.
+    Skills are always flushed before projects so links can be remapped
+    from exported skill ids to the newly created ones.
+    """
+
+    def __init__(self, user, batch_size=BATCH_SIZE):
+        self.user = user
+        self.batch_size = batch_size
+        self.skill_ids = {}
+        self.pending = {"skill": [], "project": [], "notification": []}
+        self.counts = {"skills": 0, "projects": 0, "milestones": 0, "notifications": 0}
+
+    def add(self, kind, line_no, data):
+        buffer = self.pending[kind]
+        buffer.append((line_no, data))
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self._flush_skills()
+        self._flush_projects()
+        self._flush_notifications()
+
+    def _take(self, kind):
+        records, self.pending[kind] = self.pending[kind], []
+        return records
+
+    def _flush_skills(self):
+        records = self._take("skill")
+        if not records:
+            return
+        skills = []
+        for _, data in records:
+            data = dict(data)
+            data.pop("id")
+            data.pop("created_at", None)
+            data.pop("updated_at", None)
+            skills.append(Skill(user=self.user, **data))
+        CanonicalSkill.objects.link(skills)
+        Skill.objects.bulk_create(skills)
+        _restore_timestamps(
+            Skill, skills, [d for _, d in records], ["created_at", "updated_at"]
+        )
+        for skill, (_, data) in zip(skills, records):
+            self.skill_ids[data["id"]] = skill.id
+        self.counts["skills"] += len(skills)
+
+    def _flush_projects(self):
+        records = self._take("project")
+        if not records:
+            return
+        SkillLink = Project.skills.through
+
+        projects = []
+        for line_no, data in records:
+            unknown = [i for i in data.get("skill_ids", []) if i not in self.skill_ids]
+            if unknown:
+                raise serializers.ValidationError({
+                    "line": line_no,
+                    "detail": {"skills": f"Unknown skill ids: {unknown}"},
+                })
+            fields = {
+                k: v for k, v in data.items()
+                if k not in ("skill_ids", "milestones", "created_at", "updated_at")
+            }
+            project = Project(user=self.user, **fields)
+            project.sync_completed_at()
+            projects.append(project)
+        Project.objects.bulk_create(projects)
+        _restore_timestamps(
+            Project, projects, [d for _, d in records], ["created_at", "updated_at"]
+        )
+
+        links = []
+        milestones = []
+        milestone_stamps = []
+        for project, (_, data) in zip(projects, records):
+            links.extend(
+                SkillLink(project_id=project.id, skill_id=self.skill_ids[i])
+                for i in dict.fromkeys(data.get("skill_ids", []))
+            )
+            for m in data.get("milestones", []):
+                milestone = Milestone(
+                    project=project,
+                    title=m["title"],
+                    is_completed=m.get("is_completed", False),
+                    completed_at=m.get("completed_at"),
+                )
+                milestone.sync_completed_at()
+                milestones.append(milestone)
+                milestone_stamps.append(m)
+        SkillLink.objects.bulk_create(links)
+        Milestone.objects.bulk_create(milestones)
+        _restore_timestamps(Milestone, milestones, milestone_stamps, ["created_at"])
+
+        self.counts["projects"] += len(projects)
+        self.counts["milestones"] += len(milestones)
+
+    def _flush_notifications(self):
+        records = self._take("notification")
+        if not records:
+            return
+        notifications = []
+        for _, data in records:
+            fields = {k: v for k, v in data.items() if k != "created_at"}
+            notifications.append(Notification(user=self.user, **fields))
+        # Plain bulk_create: imported history must not fan out as new
+        # notifications; counters are rebuilt once the import is done.
+        Notification.objects.bulk_create(notifications)
+        _restore_timestamps(
+            Notification, notifications, [d for _, d in records], ["created_at"]
+        )
+        self.counts["notifications"] += len(notifications)
+
+
+def _parse_line(line_no, raw):
+    try:
+        record = json.loads(raw)
+    except ValueError:
+        raise serializers.ValidationError({"line": line_no, "detail": "Invalid JSON."})
+    if not isinstance(record, dict):
+        raise serializers.ValidationError(
+            {"line": line_no, "detail": "Expected a JSON object."}
+        )
+
+    kind = record.pop("type", None)
+    serializer_class = RECORD_SERIALIZERS.get(kind)
+    if serializer_class is None:
+        raise serializers.ValidationError(
+            {"line": line_no, "detail": f"Unknown record type: {kind!r}."}
+        )
+
+    serializer = serializer_class(data=record)
+    if not serializer.is_valid():
+        raise serializers.ValidationError(
+            {"line": line_no, "detail": serializer.errors}
+        )
+    return kind, serializer.validated_data
+
+
+def import_lines(user, lines, batch_size=BATCH_SIZE):
+    """
+    Import NDJSON `lines` (str or bytes) for `user`.
+
+    Lines are parsed one at a time and written in bulk_create batches,
+    all inside one transaction: a bad line raises ValidationError with
+    its line number and nothing is kept. Returns per-type counts.
+    """
+    importer = _Importer(user, batch_size)
+
+    with transaction.atomic():
+        for line_no, raw in enumerate(lines, start=1):
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            if not raw.strip():
+                continue
+            kind, data = _parse_line(line_no, raw)
+            importer.add(kind, line_no, data)
+        importer.flush()
+
+        # Bulk writes skip the signal receivers, so rebuild once
+        UserStats.objects.rebuild_for(user.id)
+        UserStats.objects.touch(user.id)
+        DailyRollup.objects.rebuild([user.id])
+        matching.mark_dirty_on_commit([user.id])
+
+    return importer.counts
@@ -0,0 +1,30 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.settings_app.data_transfer import export_lines
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Export a user's skills, projects and notifications as NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("email")
+        parser.add_argument(
+            "--output",
+            help="File to write to (defaults to stdout).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user with email {options['email']}")
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as out:
+                out.writelines(export_lines(user))
+        else:
+            for line in export_lines(user):
+                self.stdout.write(line, ending="")
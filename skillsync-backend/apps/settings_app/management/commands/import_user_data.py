@@ -0,0 +1,38 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from apps.settings_app.data_transfer import import_lines
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Import an NDJSON export into an existing user's account."
+
+    def add_arguments(self, parser):
+        parser.add_argument("email")
+        parser.add_argument(
+            "--input",
+            help="File to read from (defaults to stdin).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(email=options["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user with email {options['email']}")
+
+        try:
+            if options["input"]:
+                with open(options["input"], encoding="utf-8") as lines:
+                    counts = import_lines(user, lines)
+            else:
+                counts = import_lines(user, sys.stdin)
+        except ValidationError as exc:
+            raise CommandError(f"Import failed: {exc.detail}")
+
+        summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"Imported {summary}."))
@@ -0,0 +1,92 @@
+from rest_framework import serializers
+
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+from apps.notifications.models import Notification
+
+
+# =========================
+# NDJSON record serializers (import / export)
+# =========================
+# One line per record, tagged with "type". Timestamps are carried over
+# so a migrated account keeps its history.
+
+class SkillRecordSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField()
+    created_at = serializers.DateTimeField(required=False)
+    updated_at = serializers.DateTimeField(required=False)
+
+    class Meta:
+        model = Skill
+        fields = (
+            "id",
+            "name",
+            "category",
+            "proficiency",
+            "years_of_experience",
+            "created_at",
+            "updated_at",
+        )
+
+
+class MilestoneRecordSerializer(serializers.ModelSerializer):
+    created_at = serializers.DateTimeField(required=False)
+
+    class Meta:
+        model = Milestone
+        fields = (
+            "title",
+            "is_completed",
+            "completed_at",
+            "created_at",
+        )
+
+
+class ProjectRecordSerializer(serializers.ModelSerializer):
+    # Ids of exported skills, remapped on import
+    skills = serializers.ListField(
+        child=serializers.IntegerField(),
+        source="skill_ids",
+        required=False,
+    )
+    milestones = MilestoneRecordSerializer(many=True, required=False)
+    created_at = serializers.DateTimeField(required=False)
+    updated_at = serializers.DateTimeField(required=False)
+
+    class Meta:
+        model = Project
+        fields = (
+            "title",
+            "description",
+            "status",
+            "start_date",
+            "end_date",
+            "completed_at",
+            "created_at",
+            "updated_at",
+            "skills",
+            "milestones",
+        )
+
+
+class NotificationRecordSerializer(serializers.ModelSerializer):
+    created_at = serializers.DateTimeField(required=False)
+
+    class Meta:
+        model = Notification
+        fields = (
+            "title",
+            "message",
+            "is_read",
+            "kind",
+            "count",
+            "items",
+            "created_at",
+        )
+
+
+RECORD_SERIALIZERS = {
+    "skill": SkillRecordSerializer,
+    "project": ProjectRecordSerializer,
+    "notification": NotificationRecordSerializer,
+}
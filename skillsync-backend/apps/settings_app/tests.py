@@ -1,3 +1,106 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.users.models import User
+from apps.skills.models import Skill
+from apps.projects.models import Project, Milestone
+from apps.notifications.models import Notification
+from apps.dashboard.models import UserStats
+from apps.matching import index as matching
+
+
+class DataTransferTests(TestCase):
+    def setUp(self):
+        self.source = User.objects.create_user(
+            email="source@example.com", password="pass12345", name="Source"
+        )
+        self.target = User.objects.create_user(
+            email="target@example.com", password="pass12345", name="Target"
+        )
+        self.client = APIClient()
+
+        skill = Skill.objects.create(
+            user=self.source, name="Django", category="backend", proficiency="advanced"
+        )
+        project = Project.objects.create(
+            user=self.source, title="API", status="completed"
+        )
+        project.skills.add(skill)
+        Milestone.objects.create(project=project, title="Models", is_completed=True)
+        Milestone.objects.create(project=project, title="Views")
+
+    def export(self, user):
+        self.client.force_authenticate(user)
+        res = self.client.get("/api/settings/export/")
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        return b"".join(res.streaming_content)
+
+    def import_(self, user, body):
+        self.client.force_authenticate(user)
+        return self.client.post(
+            "/api/settings/import/", body, content_type="application/x-ndjson"
+        )
+
+    def test_round_trip(self):
+        body = self.export(self.source)
+        types = [json.loads(line)["type"] for line in body.splitlines()]
+        # Skill and project creation each left a notification
+        self.assertEqual(types, ["skill", "project", "notification", "notification"])
+
+        res = self.import_(self.target, body)
+
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.data, {
+            "skills": 1, "projects": 1, "milestones": 2, "notifications": 2,
+        })
+        project = Project.objects.get(user=self.target)
+        source_project = Project.objects.get(user=self.source)
+        self.assertEqual(project.created_at, source_project.created_at)
+        self.assertEqual(project.completed_at, source_project.completed_at)
+        self.assertEqual(
+            list(project.skills.values_list("user", flat=True)), [self.target.id]
+        )
+        self.assertEqual(
+            sorted(project.milestones.values_list("title", "is_completed")),
+            [("Models", True), ("Views", False)],
+        )
+        # No fresh "created" notifications fan out from an import
+        self.assertEqual(Notification.objects.filter(user=self.target).count(), 2)
+        stats = UserStats.objects.get(user=self.target)
+        self.assertEqual(stats.completed_projects_count, 1)
+
+    def test_import_updates_the_matching_index(self):
+        body = self.export(self.source)
+        matching.reset()
+        self.addCleanup(matching.reset)
+        self.assertEqual(matching.get_index().similar_users(self.source.id), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.import_(self.target, body)
+
+        matches = matching.get_index().similar_users(self.source.id)
+        self.assertEqual([m["user_id"] for m in matches], [self.target.id])
+
+    def test_bad_line_rolls_back(self):
+        body = self.export(self.source) + b'{"type": "skill", "name": "x"}\n'
+
+        res = self.import_(self.target, body)
+
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.data["line"], "5")
+        self.assertFalse(Skill.objects.filter(user=self.target).exists())
+
+    def test_management_commands(self):
+        with tempfile.NamedTemporaryFile("w+", suffix=".ndjson") as f:
+            call_command("export_user_data", "source@example.com", "--output", f.name)
+            call_command(
+                "import_user_data", "target@example.com", "--input", f.name,
+                stdout=StringIO(),
+            )
 
-# Create your tests here.
+        self.assertEqual(Milestone.objects.filter(project__user=self.target).count(), 2)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ExportDataView, ImportDataView
+
+urlpatterns = [
+    path("export/", ExportDataView.as_view()),
+    path("import/", ImportDataView.as_view()),
+]
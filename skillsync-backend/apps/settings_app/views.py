@@ -1,3 +1,40 @@
-from django.shortcuts import render
+from django.http import StreamingHttpResponse
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
 
-# Create your views here.
+from .data_transfer import export_lines, import_lines
+
+
+class ExportDataView(APIView):
+    """
+    GET /api/settings/export/
+
+    Streams the user's skills, projects (with milestones and skill links)
+    and notifications as NDJSON, one record per line.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        response = StreamingHttpResponse(
+            export_lines(request.user),
+            content_type="application/x-ndjson",
+        )
+        response["Content-Disposition"] = 'attachment; filename="skillsync-export.ndjson"'
+        return response
+
+
+class ImportDataView(APIView):
+    """
+    POST /api/settings/import/
+
+    Body is an NDJSON export. Lines are read straight off the request
+    stream and written in batches; returns how many records were created.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        # Read the raw stream; touching request.data would buffer the body
+        counts = import_lines(request.user, request.stream or [])
+        return Response(counts, status=status.HTTP_201_CREATED)
@@ -1,4 +1,17 @@
 from django.contrib import admin
-from .models import Skill
+from .models import Skill, CanonicalSkill, SkillAlias
 
 admin.site.register(Skill)
+
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(CanonicalSkill)
+class CanonicalSkillAdmin(admin.ModelAdmin):
+    list_display = ("name", "category", "updated_at")
+    list_filter = ("category",)
+    search_fields = ("name", "aliases__name")
+    inlines = [SkillAliasInline]
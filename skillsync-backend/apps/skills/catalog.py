@@ -0,0 +1,156 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connection
+
+
+# Keep letters, digits and the symbols that tell skills apart (C++, C#,
+# F#); "React", "react.js" and "ReactJS" all become "react" / "reactjs"
+# and the catalog aliases close the remaining gap.
+KEY_RE = re.compile(r"[^0-9a-z+#]")
+
+
+def normalize(name):
+    return KEY_RE.sub("", name.lower())
+
+
+# =========================
+# Autocomplete
+# =========================
+class PrefixIndex:
+    """
+    Sorted array of (key, canonical id) over every canonical name and
+    alias, searched with bisect: a lookup is O(log n + matches) and
+    touches no database.
+    """
+
+    def __init__(self, entries, skills):
+        # entries: [(key, canonical_id)], skills: {id: (name, category, uses)}
+        entries = sorted(set(entries))
+        self._keys = [key for key, _ in entries]
+        self._ids = [canonical_id for _, canonical_id in entries]
+        self._skills = skills
+
+    def search(self, prefix, limit=10, scan=200):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        found = {}
+        position = bisect_left(self._keys, prefix)
+        end = min(len(self._keys), position + scan)
+        while position < end and self._keys[position].startswith(prefix):
+            canonical_id = self._ids[position]
+            # Exact name/alias hits first, then the most used skills
+            exact = self._keys[position] == prefix
+            found[canonical_id] = found.get(canonical_id, False) or exact
+            position += 1
+
+        ranked = sorted(
+            found,
+            key=lambda pk: (
+                not found[pk],
+                -self._skills[pk][2],
+                self._skills[pk][0].lower(),
+            ),
+        )
+        return [
+            {
+                "id": pk,
+                "name": self._skills[pk][0],
+                "category": self._skills[pk][1],
+            }
+            for pk in ranked[:limit]
+        ]
+
+
+def load():
+    from django.db.models import Count
+    from .models import CanonicalSkill, SkillAlias
+
+    skills = {}
+    entries = []
+    for pk, name, key, category, uses in CanonicalSkill.objects.annotate(
+        uses=Count("skills")
+    ).values_list("id", "name", "key", "category", "uses"):
+        skills[pk] = (name, category, uses)
+        entries.append((key, pk))
+
+    entries.extend(SkillAlias.objects.values_list("key", "canonical_id"))
+    return PrefixIndex(entries, skills)
+
+
+def catalog_version():
+    from django.db.models import Count, Max
+    from .models import CanonicalSkill, SkillAlias
+
+    return (
+        CanonicalSkill.objects.aggregate(n=Count("id"), at=Max("updated_at")),
+        SkillAlias.objects.aggregate(n=Count("id"), at=Max("updated_at")),
+    )
+
+
+# =========================
+# Process-wide index
+# =========================
+# Loaded once per worker. Every worker compares the catalog version in
+# a background thread every CATALOG_REFRESH_INTERVAL seconds; a catalog
+# write makes the writing process check on its next lookup instead
+# (see apps.skills.signals). Lookups only touch the database on a
+# worker's very first call, never on the request that wrote.
+_index = None
+_version = None
+_checked_at = 0.0
+_refreshing = False
+_lock = threading.Lock()
+
+
+def reload():
+    global _index, _version, _checked_at
+    version = catalog_version()
+    index = load()
+    with _lock:
+        _index, _version, _checked_at = index, version, time.monotonic()
+    return index
+
+
+def invalidate():
+    """Have the next get_index() refresh in the background."""
+    global _checked_at
+    with _lock:
+        _checked_at = 0.0
+
+
+def _refresh():
+    global _refreshing
+    try:
+        if catalog_version() != _version:
+            reload()
+    finally:
+        _refreshing = False
+        # Threads get their own connection, don't leak it
+        connection.close()
+
+
+def get_index():
+    global _checked_at, _refreshing
+
+    with _lock:
+        index = _index
+        due = (
+            index is not None
+            and not _refreshing
+            and time.monotonic() - _checked_at > settings.CATALOG_REFRESH_INTERVAL
+        )
+        if due:
+            _refreshing = True
+            _checked_at = time.monotonic()
+
+    if index is None:
+        return reload()
+    if due:
+        threading.Thread(target=_refresh, daemon=True).start()
+    return index
@@ -0,0 +1,106 @@
+from contextlib import contextmanager
+
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+from .models import Skill
+
+
+# =========================
+# Skill link fields
+# =========================
+class OwnedSkillsManyField(serializers.ManyRelatedField):
+    """
+    List side of OwnedSkillField: resolves every id with one IN query
+    instead of one lookup per item, and reports all missing ids at once.
+    """
+    default_error_messages = {
+        "does_not_exist": "Invalid skill ids: {ids}.",
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._prefetched = None
+
+    def _to_id(self, item):
+        if isinstance(item, bool):
+            self.child_relation.fail("incorrect_type", data_type="bool")
+        try:
+            # Not int(): it would truncate 1.9 to 1 and link a skill the
+            # client never sent
+            return serializers.IntegerField().to_internal_value(item)
+        except serializers.ValidationError:
+            self.child_relation.fail(
+                "incorrect_type", data_type=type(item).__name__
+            )
+
+    @contextmanager
+    def prefetched(self, lists):
+        """
+        Resolve the ids of many inputs (e.g. every item of a bulk
+        payload) in one query up front; to_internal_value() reads from
+        that until the block exits. Malformed ids are skipped here and
+        reported by to_internal_value() as usual.
+        """
+        ids = set()
+        for data in lists:
+            if isinstance(data, (list, tuple)):
+                for item in data:
+                    try:
+                        ids.add(self._to_id(item))
+                    except serializers.ValidationError:
+                        pass
+        self._prefetched = (
+            self.child_relation.get_queryset().in_bulk(ids) if ids else {}
+        )
+        try:
+            yield
+        finally:
+            self._prefetched = None
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        ids = list(dict.fromkeys(self._to_id(item) for item in data))
+        if not ids:
+            return []
+
+        if self._prefetched is None:
+            found = self.child_relation.get_queryset().in_bulk(ids)
+        else:
+            found = self._prefetched
+        missing = [pk for pk in ids if pk not in found]
+        if missing:
+            self.fail("does_not_exist", ids=", ".join(map(str, missing)))
+
+        return [found[pk] for pk in ids]
+
+
+class OwnedSkillField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key link to one of the requesting user's skills.
+
+    skills = OwnedSkillField(many=True, required=False)
+
+    Ids of other users' skills are rejected like unknown ids. Needs
+    `request` in the serializer context.
+    """
+
+    def __init__(self, **kwargs):
+        if not kwargs.get("read_only"):
+            kwargs.setdefault("queryset", Skill.objects.all())
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.context["request"].user)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return OwnedSkillsManyField(**list_kwargs)
@@ -0,0 +1,71 @@
+from collections import Counter
+
+from django.db import models, transaction
+from django.db.models import Q
+
+from . import catalog
+from .signals import skills_deleted
+
+
+class SkillQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Delete the matched skills and report per-user counts through
+        skills_deleted, in place of a post_delete per row.
+        """
+        with transaction.atomic():
+            counts = Counter(self.values_list("user_id", flat=True))
+            result = super().delete()
+            if counts:
+                skills_deleted.send(sender=self.model, counts=dict(counts))
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class CanonicalSkillManager(models.Manager):
+    """
+    Lookups against the curated catalog. Free-text names that match no
+    entry or alias stay unlinked: user input never creates catalog
+    entries, which are shared with every user through autocomplete.
+    """
+
+    def resolve(self, name):
+        """Canonical entry for a free-text skill name, or None."""
+        key = catalog.normalize(name)
+        if not key:
+            return None
+        return self.filter(Q(key=key) | Q(aliases__key=key)).first()
+
+    def link(self, skills):
+        """
+        Set .canonical on many Skill instances at once, for bulk_create
+        and bulk_update, which skip Skill.save().
+        """
+        canonicals = self.resolve_many(skill.name for skill in skills)
+        for skill in skills:
+            skill.canonical = canonicals.get(catalog.normalize(skill.name))
+
+    def resolve_many(self, names):
+        """
+        Bulk resolve() in two queries. Returns {key: CanonicalSkill}
+        for the names that matched.
+        """
+        from .models import SkillAlias
+
+        keys = {key for key in map(catalog.normalize, names) if key}
+        if not keys:
+            return {}
+
+        found = {
+            alias.key: alias.canonical
+            for alias in SkillAlias.objects.filter(
+                key__in=keys
+            ).select_related("canonical")
+        }
+        found.update(
+            (canonical.key, canonical)
+            for canonical in self.filter(key__in=keys - found.keys())
+        )
+        return found
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0002_skill_updated_at_alter_skill_category'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='skill_user_created_idx'),
+        ),
+    ]
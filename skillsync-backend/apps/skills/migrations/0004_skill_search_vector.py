@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+# PostgreSQL only: a generated tsvector column with a GIN index for
+# full-text search, plus a trigram index for typo-tolerant matching.
+# Other backends (SQLite in dev) fall back to LIKE queries, see
+# apps/search/queries.py.
+FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE skills_skill ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(name, ''))) STORED
+    """,
+    "CREATE INDEX skill_search_vector_idx ON skills_skill USING gin (search_vector)",
+    "CREATE INDEX skill_name_trgm_idx ON skills_skill USING gin (name gin_trgm_ops)",
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS skill_name_trgm_idx",
+    "DROP INDEX IF EXISTS skill_search_vector_idx",
+    "ALTER TABLE skills_skill DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run(statements):
+    def apply(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0003_skill_skill_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(FORWARD_SQL), run(BACKWARD_SQL)),
+    ]
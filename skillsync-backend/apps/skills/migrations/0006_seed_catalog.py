@@ -0,0 +1,77 @@
+import re
+
+from django.db import migrations
+
+
+# Frozen copy of apps.skills.catalog.normalize
+KEY_RE = re.compile(r"[^0-9a-z+#]")
+
+
+def normalize(name):
+    return KEY_RE.sub("", name.lower())
+
+
+SEED = [
+    # (name, category, aliases)
+    # "React.js" / "ReactJS" share the key "reactjs"
+    ("React", "frontend", ["ReactJS"]),
+    ("Vue.js", "frontend", ["Vue"]),
+    ("Angular", "frontend", ["AngularJS"]),
+    ("Next.js", "frontend", ["Next"]),
+    ("JavaScript", "frontend", ["JS", "ECMAScript"]),
+    ("TypeScript", "frontend", ["TS"]),
+    ("Tailwind CSS", "frontend", ["Tailwind"]),
+    ("Node.js", "backend", ["Node"]),
+    ("Python", "backend", []),
+    ("Django", "backend", []),
+    ("Go", "backend", ["Golang"]),
+    ("PostgreSQL", "backend", ["Postgres", "psql"]),
+    ("Docker", "devops", []),
+    ("Kubernetes", "devops", ["K8s"]),
+    ("Amazon Web Services", "devops", ["AWS"]),
+    ("Figma", "design", []),
+]
+
+BATCH_SIZE = 1000
+
+
+def seed_and_link(apps, schema_editor):
+    CanonicalSkill = apps.get_model("skills", "CanonicalSkill")
+    SkillAlias = apps.get_model("skills", "SkillAlias")
+    Skill = apps.get_model("skills", "Skill")
+
+    by_key = {}
+    for name, category, aliases in SEED:
+        canonical = CanonicalSkill.objects.create(
+            name=name, key=normalize(name), category=category
+        )
+        by_key[canonical.key] = canonical
+        for alias in aliases:
+            SkillAlias.objects.create(canonical=canonical, name=alias, key=normalize(alias))
+            by_key[normalize(alias)] = canonical
+
+    # Link existing skills to the seeded entries; unknown names stay
+    # unlinked (the catalog is curated, not built from user input)
+    last_pk = 0
+    while True:
+        skills = list(Skill.objects.filter(pk__gt=last_pk).order_by("pk")[:BATCH_SIZE])
+        if not skills:
+            break
+        last_pk = skills[-1].pk
+
+        for skill in skills:
+            canonical = by_key.get(normalize(skill.name))
+            skill.canonical_id = canonical.pk if canonical else None
+
+        Skill.objects.bulk_update(skills, ["canonical"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0005_canonical_catalog'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_and_link, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('skills', '0006_seed_catalog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skillalias',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
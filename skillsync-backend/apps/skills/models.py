@@ -1,15 +1,71 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
+from .catalog import normalize
+from .managers import SkillQuerySet, CanonicalSkillManager
+from .signals import skills_deleted
+
+
+CATEGORY_CHOICES = [
+    ("frontend", "Frontend"),
+    ("backend", "Backend"),
+    ("devops", "DevOps"),
+    ("design", "Design"),
+    ("other", "Other"),
+]
+
+
+# =========================
+# Canonical catalog
+# =========================
+class CanonicalSkill(models.Model):
+    """
+    One entry per real-world skill. Free-text Skill rows link here so
+    "React", "react.js" and "ReactJS" can be counted together.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    # normalize(name), set on save
+    key = models.CharField(max_length=100, unique=True, editable=False)
+    category = models.CharField(max_length=50, choices=CATEGORY_CHOICES, default="other")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CanonicalSkillManager()
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.key = normalize(self.name)
+        super().save(*args, **kwargs)
+
+
+class SkillAlias(models.Model):
+    canonical = models.ForeignKey(
+        CanonicalSkill,
+        on_delete=models.CASCADE,
+        related_name="aliases",
+    )
+    name = models.CharField(max_length=100)
+    # normalize(name), set on save
+    key = models.CharField(max_length=100, unique=True, editable=False)
+    # Renames and repoints change the catalog version (catalog_version)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "skill aliases"
+
+    def __str__(self):
+        return f"{self.name} -> {self.canonical.name}"
+
+    def save(self, *args, **kwargs):
+        self.key = normalize(self.name)
+        super().save(*args, **kwargs)
+
 
 class Skill(models.Model):
-    CATEGORY_CHOICES = [
-        ("frontend", "Frontend"),
-        ("backend", "Backend"),
-        ("devops", "DevOps"),
-        ("design", "Design"),
-        ("other", "Other"),
-    ]
+    CATEGORY_CHOICES = CATEGORY_CHOICES
 
     PROFICIENCY_CHOICES = [
         ("beginner", "Beginner"),
@@ -28,8 +84,44 @@ class Skill(models.Model):
     proficiency = models.CharField(max_length=50, choices=PROFICIENCY_CHOICES)
     years_of_experience = models.PositiveIntegerField(default=0)
 
+    # Resolved from `name` on save
+    canonical = models.ForeignKey(
+        CanonicalSkill,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="skills",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SkillQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Activity feed: newest-first keyset scans per user
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="skill_user_created_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.user.email})"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if "name" in self.__dict__ and (
+            update_fields is None or "name" in update_fields
+        ):
+            self.canonical = CanonicalSkill.objects.resolve(self.name)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "canonical"}
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            skills_deleted.send(sender=Skill, counts={self.user_id: 1})
+        return result
@@ -1,8 +1,98 @@
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Skill
+from core.fieldsets import SparseFieldsetSerializerMixin
+from .models import Skill, CanonicalSkill
+from .signals import skills_bulk_created, skills_bulk_updated
 
 
-class SkillSerializer(serializers.ModelSerializer):
+MAX_BULK_SKILLS = 100
+
+
+class SkillBriefSerializer(serializers.ModelSerializer):
+    """Compact skill for ?expand=skills on projects."""
+    class Meta:
+        model = Skill
+        fields = ("id", "name", "category")
+
+
+class SkillProjectSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+
+
+# =========================
+# Bulk create / update
+# =========================
+class SkillListSerializer(serializers.ListSerializer):
+    """
+    POST /api/skills/bulk/
+
+    One bulk_create for the whole batch; listeners get a single
+    skills_bulk_created instead of a post_save per skill.
+    """
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+
+        with transaction.atomic():
+            skills = [Skill(**data) for data in validated_data]
+            CanonicalSkill.objects.link(skills)
+            skills = Skill.objects.bulk_create(skills)
+            skills_bulk_created.send(sender=Skill, user=user, skills=skills)
+
+        return skills
+
+
+class SkillBulkUpdateListSerializer(serializers.ListSerializer):
+    """
+    PATCH /api/skills/bulk/
+
+    `instance` is the queryset of skills the user may edit. Every
+    changed column goes out in one bulk_update.
+    """
+
+    def update(self, instance, validated_data):
+        ids = [data["id"] for data in validated_data]
+        skills = instance.filter(id__in=ids).in_bulk()
+
+        missing = [pk for pk in dict.fromkeys(ids) if pk not in skills]
+        if missing:
+            raise serializers.ValidationError(
+                {"ids": f"Unknown skills: {missing}"}
+            )
+
+        now = timezone.now()
+        fields = {"updated_at"}
+        for data in validated_data:
+            skill = skills[data["id"]]
+            for attr, value in data.items():
+                if attr != "id":
+                    setattr(skill, attr, value)
+                    fields.add(attr)
+            # bulk_update skips auto_now
+            skill.updated_at = now
+
+        updated = [skills[pk] for pk in dict.fromkeys(ids)]
+        with transaction.atomic():
+            if "name" in fields:
+                CanonicalSkill.objects.link(updated)
+                fields.add("canonical")
+            Skill.objects.bulk_update(updated, sorted(fields))
+            skills_bulk_updated.send(
+                sender=Skill,
+                user=self.context["request"].user,
+                skills=updated,
+            )
+
+        return updated
+
+
+class SkillSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        "projects": (SkillProjectSerializer, {"many": True}),
+    }
+
     class Meta:
         model = Skill
         fields = (
@@ -15,3 +105,20 @@ class SkillSerializer(serializers.ModelSerializer):
             "updated_at",
         )
         read_only_fields = ("id", "created_at", "updated_at")
+        list_serializer_class = SkillListSerializer
+
+
+class SkillBulkUpdateSerializer(SkillSerializer):
+    id = serializers.IntegerField()
+
+    class Meta(SkillSerializer.Meta):
+        read_only_fields = ("created_at", "updated_at")
+        list_serializer_class = SkillBulkUpdateListSerializer
+
+
+class SkillBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=MAX_BULK_SKILLS,
+    )
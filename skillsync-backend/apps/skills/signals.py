@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+
+from . import catalog
+
+
+# Sent after skills were inserted with bulk_create, which bypasses
+# post_save.
+# Arguments:
+#   user    -> owner of the skills
+#   skills  -> list of created Skill instances
+skills_bulk_created = Signal()
+
+# Sent after skills were changed with bulk_update.
+# Arguments:
+#   user    -> owner of the skills
+#   skills  -> list of updated Skill instances
+skills_bulk_updated = Signal()
+
+# Sent after skills were deleted, through Skill.delete() or a queryset
+# delete(). Skills have no post_delete receivers so that a batch is a
+# fixed number of DELETEs instead of one signal per row.
+# Arguments:
+#   counts  -> {user_id: number of skills deleted}
+skills_deleted = Signal()
+
+
+# =========================
+# Catalog
+# =========================
+# Lazy senders: models.py imports this module.
+@receiver(post_save, sender="skills.CanonicalSkill")
+@receiver(post_delete, sender="skills.CanonicalSkill")
+@receiver(post_save, sender="skills.SkillAlias")
+@receiver(post_delete, sender="skills.SkillAlias")
+def catalog_changed(sender, **kwargs):
+    transaction.on_commit(catalog.invalidate)
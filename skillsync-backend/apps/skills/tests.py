@@ -1,3 +1,180 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from apps.users.models import User
+from apps.projects.models import Project
+from . import catalog
+from .models import Skill, CanonicalSkill, SkillAlias
+
+
+class SkillListViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="skills@example.com",
+            password="pass12345",
+            name="Skills",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_sparse_fieldsets(self):
+        skill = Skill.objects.create(
+            user=self.user, name="Django", category="backend", proficiency="advanced"
+        )
+        project = Project.objects.create(user=self.user, title="API")
+        project.skills.add(skill)
+
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/skills/?fields=id,name&expand=projects")
+
+        self.assertEqual(res.data, [{
+            "id": skill.id,
+            "name": "Django",
+            "projects": [{"id": project.id, "title": "API"}],
+        }])
+        self.assertEqual(self.client.get("/api/skills/?expand=user").status_code, 400)
+
+        # A project of someone else's linked to this skill stays hidden
+        other = User.objects.create_user(email="other-fields@example.com", password="x")
+        Project.objects.create(user=other, title="Theirs").skills.add(skill)
+        res = self.client.get("/api/skills/?fields=id&expand=projects")
+        self.assertEqual(res.data[0]["projects"], [{"id": project.id, "title": "API"}])
+
+
+class SkillBulkViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="bulk@example.com",
+            password="pass12345",
+            name="Bulk",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        # Build the counters row so the bulk paths adjust it
+        self.client.get("/api/users/stats/")
+
+    def payload(self, count):
+        return [
+            {"name": f"S{i}", "category": "backend", "proficiency": "beginner"}
+            for i in range(count)
+        ]
+
+    def test_bulk_create_sends_one_notification(self):
+        res = self.client.post("/api/skills/bulk/", self.payload(12), format="json")
+
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(len(res.data), 12)
+        notifications = self.user.notifications.all()
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(
+            notifications[0].message,
+            "You added 12 skills: S0, S1, S2, S3, S4 and 7 more",
+        )
+        stats = self.client.get("/api/users/stats/").data
+        self.assertEqual((stats["skills"], stats["notifications"]), (12, 1))
+
+    def test_bulk_create_query_count_is_fixed(self):
+        def run(count):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.post("/api/skills/bulk/", self.payload(count), format="json")
+            return len(ctx.captured_queries)
+
+        run(1)
+        self.assertEqual(run(2), run(30))
+
+    def test_bulk_update_and_delete(self):
+        created = self.client.post(
+            "/api/skills/bulk/", self.payload(3), format="json"
+        ).data
+        ids = [s["id"] for s in created]
+
+        res = self.client.patch(
+            "/api/skills/bulk/",
+            [{"id": ids[0], "proficiency": "advanced"}, {"id": ids[1], "name": "Go"}],
+            format="json",
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            list(Skill.objects.order_by("id").values_list("name", "proficiency")),
+            [("S0", "advanced"), ("Go", "beginner"), ("S2", "beginner")],
+        )
+
+        res = self.client.patch(
+            "/api/skills/bulk/", [{"id": 999999, "name": "X"}], format="json"
+        )
+        self.assertEqual(res.status_code, 400)
+
+        # Owner counts, collect, two DELETEs and one counter UPDATE,
+        # inside a savepoint, whatever the batch size
+        with self.assertNumQueries(7):
+            res = self.client.delete(
+                "/api/skills/bulk/", {"ids": ids[:2]}, format="json"
+            )
+        self.assertEqual(res.data, {"deleted": 2})
+        self.assertEqual(self.client.get("/api/users/stats/").data["skills"], 1)
+
+        for body in ([ids[2]], {"ids": []}, {"ids": "1"}):
+            res = self.client.delete("/api/skills/bulk/", body, format="json")
+            self.assertEqual(res.status_code, 400)
+
+
+class SkillCatalogTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="catalog@example.com",
+            password="pass12345",
+            name="Catalog",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_skills_link_to_canonical_entries(self):
+        react = CanonicalSkill.objects.get(name="React")
+        for name in ("React", "react.js", "ReactJS"):
+            skill = Skill.objects.create(
+                user=self.user, name=name, category="frontend", proficiency="beginner"
+            )
+            self.assertEqual(skill.canonical, react)
+
+        self.client.post(
+            "/api/skills/bulk/",
+            [
+                {"name": "REACT", "category": "frontend", "proficiency": "advanced"},
+                {"name": "Elm", "category": "frontend", "proficiency": "beginner"},
+            ],
+            format="json",
+        )
+        self.assertEqual(react.skills.count(), 4)
+        # Unknown names stay unlinked and never become catalog entries
+        self.assertIsNone(Skill.objects.get(name="Elm").canonical)
+        self.assertFalse(CanonicalSkill.objects.filter(name="Elm").exists())
+
+    def test_autocomplete_is_served_from_memory(self):
+        catalog.reload()
+
+        with self.assertNumQueries(0):
+            res = self.client.get("/api/skills/catalog/?q=type")
+        self.assertEqual([s["name"] for s in res.data], ["TypeScript"])
+
+        # Alias hits resolve to their canonical entry
+        res = self.client.get("/api/skills/catalog/?q=k8")
+        self.assertEqual([s["name"] for s in res.data], ["Kubernetes"])
+
+        # Catalog writes only schedule a refresh, they never reload inline
+        with self.captureOnCommitCallbacks(execute=True):
+            CanonicalSkill.objects.create(name="Typst", category="other")
+        self.assertEqual(catalog._checked_at, 0.0)
+
+        catalog.reload()
+        res = self.client.get("/api/skills/catalog/?q=ty")
+        self.assertEqual([s["name"] for s in res.data], ["TypeScript", "Typst"])
+
+    def test_alias_edits_change_the_catalog_version(self):
+        alias = SkillAlias.objects.first()
+        version = catalog.catalog_version()
+
+        alias.name = f"{alias.name} renamed"
+        alias.save()
+        self.assertNotEqual(catalog.catalog_version(), version)
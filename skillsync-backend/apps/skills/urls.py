@@ -1,8 +1,15 @@
 from django.urls import path
-from .views import SkillListCreateView, SkillDetailView
+from .views import (
+    SkillListCreateView,
+    SkillDetailView,
+    SkillBulkView,
+    SkillCatalogAutocompleteView,
+)
 
 urlpatterns = [
     path("", SkillListCreateView.as_view()),
+    path("bulk/", SkillBulkView.as_view()),
+    path("catalog/", SkillCatalogAutocompleteView.as_view()),
     path("<int:pk>/", SkillDetailView.as_view()),
 ]
 
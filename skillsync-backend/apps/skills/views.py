@@ -1,14 +1,29 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.response import Response
+from core.fieldsets import SparseFieldsetViewMixin
+from . import catalog
 from .models import Skill
-from .serializers import SkillSerializer
+from .serializers import (
+    MAX_BULK_SKILLS,
+    SkillSerializer,
+    SkillBulkUpdateSerializer,
+    SkillBulkDeleteSerializer,
+)
 
 
-class SkillListCreateView(generics.ListCreateAPIView):
+class SkillListCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
+    """
+    GET  /api/skills/   -> List user's skills
+    POST /api/skills/   -> Create skill
+
+    ?fields=id,name       -> only those keys
+    ?expand=projects      -> include [{id, title}] of linked projects
+    """
     serializer_class = SkillSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Skill.objects.filter(user=self.request.user)
+        return self.trim_queryset(Skill.objects.filter(user=self.request.user))
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -20,3 +35,76 @@ class SkillDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         return Skill.objects.filter(user=self.request.user)
+
+
+class SkillBulkView(generics.GenericAPIView):
+    """
+    Many skills per request, each batch in one transaction:
+
+    POST   /api/skills/bulk/   [{name, category, ...}, ...]  -> create
+    PATCH  /api/skills/bulk/   [{id, <changed fields>}, ...]  -> update
+    DELETE /api/skills/bulk/   {"ids": [1, 2, ...]}           -> delete
+
+    Creating a batch sends one aggregated notification.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return Skill.objects.filter(user=self.request.user)
+
+    def post(self, request):
+        serializer = SkillSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=MAX_BULK_SKILLS,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def patch(self, request):
+        serializer = SkillBulkUpdateSerializer(
+            self.get_queryset(),
+            data=request.data,
+            many=True,
+            partial=True,
+            allow_empty=False,
+            max_length=MAX_BULK_SKILLS,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+    def delete(self, request):
+        serializer = SkillBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        _, deleted = self.get_queryset().filter(
+            id__in=serializer.validated_data["ids"]
+        ).delete()
+        return Response({"deleted": deleted.get(Skill._meta.label, 0)})
+
+
+class SkillCatalogAutocompleteView(generics.GenericAPIView):
+    """
+    GET /api/skills/catalog/?q=rea&limit=10
+
+    Canonical skills whose name or alias starts with `q`. Served from
+    an in-memory sorted index (see apps.skills.catalog), so keystrokes
+    never reach the database.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get("limit", 10))
+        except ValueError:
+            raise serializers.ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, 50))
+
+        return Response(
+            catalog.get_index().search(request.query_params.get("q", ""), limit=limit)
+        )
@@ -0,0 +1,85 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import TOKEN_VERSION_CLAIM
+
+
+# =========================
+# Authenticated user cache
+# =========================
+class UserCache:
+    """
+    Per-process {user id: (expires at, token version, user)} with a
+    short TTL and a size bound. Ids are keyed as strings, the way
+    tokens carry them. Entries are dropped once a save or delete of the
+    user row commits in this process (see apps.users.signals);
+    other processes catch up within the TTL.
+    """
+
+    def __init__(self, ttl, max_size=10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id, version):
+        with self._lock:
+            entry = self._entries.get(str(user_id))
+        if entry is None:
+            return None
+        expires_at, cached_version, user = entry
+        if cached_version != version or expires_at < time.monotonic():
+            return None
+        return user
+
+    def set(self, user_id, version, user):
+        user_id = str(user_id)
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, version, user)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(str(user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = UserCache(settings.AUTH_USER_CACHE_TTL)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves request.user from user_cache, so most
+    requests skip the user query. Tokens carry the user's token_version
+    (the "tv" claim); a token whose version no longer matches, e.g.
+    after a password change, is rejected.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        # Tokens issued before the claim existed match version 0
+        version = validated_token.get(TOKEN_VERSION_CLAIM, 0)
+
+        user = user_cache.get(user_id, version)
+        if user is None:
+            user = super().get_user(validated_token)
+            if user.token_version != version:
+                raise AuthenticationFailed(
+                    "Token has been revoked.", code="token_revoked"
+                )
+            user_cache.set(user.pk, version, user)
+
+        # Requests may modify request.user; never hand out the cached one
+        return copy.copy(user)
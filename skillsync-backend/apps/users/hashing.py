@@ -0,0 +1,131 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+
+
+# =========================
+# Off-thread password hashing
+# =========================
+# A PBKDF2 hash is hundreds of milliseconds of CPU by design. The
+# async auth views run it in a bounded process pool instead of on the
+# event loop (or on the single thread Django runs sync views on under
+# ASGI), so a login storm can't starve other requests. Hashers are
+# plain objects: only the hasher, password and salt cross the process
+# boundary.
+
+
+class HashingBusy(Exception):
+    """More hashing jobs are queued than the pool may hold."""
+
+
+class HashingPool:
+    """
+    `workers` processes (threads when 0) behind a cap of `max_pending`
+    queued or running jobs; submissions beyond it fail fast with
+    HashingBusy rather than queueing behind a login storm.
+    """
+
+    def __init__(self, workers, max_pending):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                if self.workers:
+                    # spawn: children don't inherit the parent's DB
+                    # connections or threads
+                    self._executor = ProcessPoolExecutor(
+                        self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(1, "password-hashing")
+            return self._executor
+
+    async def run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HashingBusy()
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(
+                settings.PASSWORD_HASHING_WORKERS,
+                settings.PASSWORD_HASHING_MAX_PENDING,
+            )
+        return _pool
+
+
+async def make_password(password, hasher=None, pool=None):
+    """Async django.contrib.auth.hashers.make_password()."""
+    hasher = hasher or get_hasher()
+    return await (pool or get_pool()).run(hasher.encode, password, hasher.salt())
+
+
+async def check_password(password, encoded, pool=None):
+    """
+    Async django.contrib.auth.hashers.check_password(). Returns
+    (valid, needs_rehash).
+    """
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False, False
+
+    valid = await (pool or get_pool()).run(hasher.verify, password, encoded)
+    needs_rehash = valid and (
+        hasher.algorithm != get_hasher().algorithm or hasher.must_update(encoded)
+    )
+    return valid, needs_rehash
+
+
+async def authenticate(email, password):
+    """
+    Async EmailBackend.authenticate(): the user for these credentials,
+    or None. Outdated hashes are upgraded like check_password() does.
+    """
+    from .models import User
+
+    try:
+        user = await User.objects.aget(email=email)
+    except User.DoesNotExist:
+        # Same cost as a wrong password, so emails can't be probed by timing
+        await make_password(password)
+        return None
+
+    valid, needs_rehash = await check_password(password, user.password)
+    if not valid or not user.is_active:
+        return None
+
+    if needs_rehash:
+        user.password = await make_password(password)
+        await user.asave(update_fields=["password"])
+    return user
@@ -0,0 +1,94 @@
+import asyncio
+import statistics
+import time
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.hashing import HashingBusy, HashingPool, check_password
+
+
+def _int_list(value):
+    try:
+        return [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise CommandError(f"Expected comma separated integers, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure login password checks per second through the hashing pool "
+        "for each combination of pool size and PBKDF2 iteration count."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pool-sizes", default="0,1,2,4")
+        parser.add_argument("--iterations", default="100000,600000,1000000")
+        parser.add_argument("--logins", type=int, default=100)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="Logins in flight at once (also the pool's pending cap).",
+        )
+
+    def handle(self, *args, **options):
+        pool_sizes = _int_list(options["pool_sizes"])
+        iteration_counts = _int_list(options["iterations"])
+
+        self.stdout.write(
+            f"{'workers':>8} {'iterations':>11} {'logins/s':>9} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'rejected':>9}"
+        )
+        for iterations in iteration_counts:
+            hasher = PBKDF2PasswordHasher()
+            hasher.iterations = iterations
+            encoded = hasher.encode("benchmark-password", hasher.salt())
+
+            for workers in pool_sizes:
+                pool = HashingPool(workers, options["concurrency"])
+                try:
+                    result = asyncio.run(
+                        self.run(pool, encoded, options["logins"], options["concurrency"])
+                    )
+                finally:
+                    pool.shutdown()
+                self.stdout.write(
+                    f"{workers:>8} {iterations:>11} {result['rate']:>9.1f} "
+                    f"{result['p50']:>8.1f} {result['p95']:>8.1f} {result['rejected']:>9}"
+                )
+
+    async def run(self, pool, encoded, logins, concurrency):
+        # Start the workers before timing anything
+        await asyncio.gather(*(
+            check_password("benchmark-password", encoded, pool=pool)
+            for _ in range(max(pool.workers, 1))
+        ))
+
+        gate = asyncio.Semaphore(concurrency)
+        latencies = []
+        rejected = 0
+
+        async def login():
+            nonlocal rejected
+            async with gate:
+                started = time.perf_counter()
+                try:
+                    valid, _ = await check_password("benchmark-password", encoded, pool=pool)
+                except HashingBusy:
+                    rejected += 1
+                    return
+                assert valid
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            "rate": len(latencies) / elapsed,
+            "p50": statistics.median(latencies) if latencies else 0.0,
+            "p95": latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0,
+            "rejected": rejected,
+        }
@@ -1,5 +1,4 @@
 from rest_framework import serializers
-from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from .models import User
 
@@ -44,33 +43,36 @@ class RegisterSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        validated_data.pop("password2", None)
-        password = validated_data.pop("password")
+        """
+        Sync fallback for save(): hashes inline. The register view uses
+        acreate() instead.
+        """
+        return User.objects.create_user(
+            email=validated_data["email"],
+            password=validated_data["password"],
+            name=validated_data.get("name", ""),
+        )
 
-        user = User.objects.create_user(
+    async def acreate(self, validated_data):
+        """
+        create() with the password hashed in the hashing pool; may
+        raise hashing.HashingBusy.
+        """
+        return await User.objects.acreate_user(
             email=validated_data["email"],
-            password=password,
-            name=validated_data.get("name", "")
+            password=validated_data["password"],
+            name=validated_data.get("name", ""),
         )
-        return user
 
 
 class LoginSerializer(serializers.Serializer):
+    """
+    Credentials only: the login view checks them with
+    apps.users.hashing.authenticate(), off the event loop.
+    """
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
-    def validate(self, data):
-        user = authenticate(
-            request=self.context.get("request"),
-            email=data["email"],
-            password=data["password"],
-        )
-
-        if not user:
-            raise serializers.ValidationError("Invalid email or password")
-
-        return user
-
 
 
 class UserSerializer(serializers.ModelSerializer):
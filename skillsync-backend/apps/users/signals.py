@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .authentication import user_cache
+from .models import User
+
+
+# Invalidate once committed: a request reading the user in between
+# would otherwise cache the old row again until the TTL runs out.
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed_invalidate_cache(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: user_cache.invalidate(user_id))
@@ -1,3 +1,141 @@
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from . import hashing
+from .authentication import user_cache
+from .models import User
+from .serializers import RegisterSerializer
+from .tokens import tokens_for_user
+
+
+class AuthViewTests(TestCase):
+    def test_register_login_and_change_password(self):
+        res = self.client.post(
+            "/api/auth/register/",
+            {"email": "New@Example.com", "password": "s3cret-pass", "name": "New"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 201)
+        user = User.objects.get(email="New@example.com")
+        self.assertTrue(user.check_password("s3cret-pass"))
+
+        res = self.client.post(
+            "/api/auth/login/",
+            {"email": "New@example.com", "password": "wrong"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 400)
+
+        res = self.client.post(
+            "/api/auth/login/",
+            {"email": "New@example.com", "password": "s3cret-pass"},
+            content_type="application/json",
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["user"]["name"], "New")
+
+        res = self.client.post(
+            "/api/users/change-password/",
+            {"old_password": "s3cret-pass", "new_password": "an0ther-pass"},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {res.json()['access']}",
+        )
+        self.assertEqual(res.status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.check_password("an0ther-pass"))
+
+    def test_register_serializer_saves_synchronously(self):
+        serializer = RegisterSerializer(
+            data={"email": "sync@example.com", "password": "s3cret-pass"}
+        )
+        self.assertTrue(serializer.is_valid())
+        user = serializer.save()
+        self.assertTrue(user.check_password("s3cret-pass"))
+
+    def test_saturated_pool_answers_503(self):
+        User.objects.create_user(email="busy@example.com", password="s3cret-pass")
+
+        with mock.patch.object(hashing.get_pool(), "max_pending", 0):
+            res = self.client.post(
+                "/api/auth/login/",
+                {"email": "busy@example.com", "password": "s3cret-pass"},
+                content_type="application/json",
+            )
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res["Retry-After"], "1")
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="cached@example.com", password="s3cret-pass", name="Cached"
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {tokens_for_user(self.user).access_token}"}
+
+    def test_user_query_is_skipped_once_cached(self):
+        self.client.get("/api/users/stats/", **self.auth)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/users/stats/", **self.auth)
+        self.assertFalse(
+            [q for q in ctx.captured_queries if 'FROM "users_user"' in q["sql"]]
+        )
+
+    def test_profile_update_invalidates(self):
+        self.client.get("/api/users/me/", **self.auth)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                "/api/users/me/", {"name": "Renamed"}, content_type="application/json", **self.auth
+            )
+        res = self.client.get("/api/users/me/", **self.auth)
+        self.assertEqual(res.json()["name"], "Renamed")
+
+    def test_password_change_revokes_tokens(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                "/api/users/change-password/",
+                {"old_password": "s3cret-pass", "new_password": "an0ther-pass"},
+                content_type="application/json",
+                **self.auth,
+            )
+        self.assertEqual(res.status_code, 200)
+
+        self.assertEqual(self.client.get("/api/users/me/", **self.auth).status_code, 401)
+        fresh = {"HTTP_AUTHORIZATION": f"Bearer {res.json()['access']}"}
+        self.assertEqual(self.client.get("/api/users/me/", **fresh).status_code, 200)
+
+    def test_password_change_revokes_refresh_tokens(self):
+        old_refresh = str(tokens_for_user(self.user))
+        res = self.client.post(
+            "/api/users/change-password/",
+            {"old_password": "s3cret-pass", "new_password": "an0ther-pass"},
+            content_type="application/json",
+            **self.auth,
+        )
+
+        for token, status in ((old_refresh, 401), (res.json()["refresh"], 200)):
+            refreshed = self.client.post(
+                "/api/users/token/refresh/",
+                {"refresh": token},
+                content_type="application/json",
+            )
+            self.assertEqual(refreshed.status_code, status)
+
+    def test_deactivation_invalidates(self):
+        self.client.get("/api/users/me/", **self.auth)
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.client.get("/api/users/me/", **self.auth).status_code, 401)
 
-# Create your tests here.
+    def test_invalidation_waits_for_commit(self):
+        self.client.get("/api/users/me/", **self.auth)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.name = "Renamed"
+            self.user.save()
+            self.assertIsNotNone(user_cache.get(self.user.pk, 0))
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(user_cache.get(self.user.pk, 0))
@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+# Carries User.token_version; bumping it revokes every token issued
+# before (checked by CachedJWTAuthentication, and on refresh by
+# VersionedTokenRefreshSerializer). Access tokens minted from a refresh
+# token copy it.
+TOKEN_VERSION_CLAIM = "tv"
+
+
+def tokens_for_user(user):
+    refresh = RefreshToken.for_user(user)
+    refresh[TOKEN_VERSION_CLAIM] = user.token_version
+    return refresh
+
+
+class VersionedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    TokenRefreshSerializer that rejects refresh tokens whose version no
+    longer matches the user's token_version, so a revoked session can't
+    mint fresh access tokens. Wired in through
+    SIMPLE_JWT["TOKEN_REFRESH_SERIALIZER"].
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        # Tokens issued before the claim existed match version 0
+        version = refresh.payload.get(TOKEN_VERSION_CLAIM, 0)
+
+        current = get_user_model().objects.filter(
+            **{api_settings.USER_ID_FIELD: user_id, "token_version": version}
+        )
+        if not current.exists():
+            raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        return super().validate(attrs)
@@ -2,11 +2,11 @@ from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from .views import (
-    RegisterView,
-    LoginView,
+    register,
+    login,
     LogoutView,
     MeView,
-    ChangePasswordView,
+    change_password,
     UserStatsView,
 )
 
@@ -14,8 +14,8 @@ urlpatterns = [
     # -------------------------
     # AUTH
     # -------------------------
-    path("register/", RegisterView.as_view(), name="register"),
-    path("login/", LoginView.as_view(), name="login"),
+    path("register/", register, name="register"),
+    path("login/", login, name="login"),
     path("logout/", LogoutView.as_view(), name="logout"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
 
@@ -23,7 +23,7 @@ urlpatterns = [
     # USER (ME)
     # -------------------------
     path("me/", MeView.as_view(), name="me"),
-    path("change-password/", ChangePasswordView.as_view(), name="change-password"),
+    path("change-password/", change_password, name="change-password"),
     path("stats/", UserStatsView.as_view(), name="user-stats"),
 
 ]
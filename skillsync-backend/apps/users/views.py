@@ -1,9 +1,20 @@
+import json
+
+from asgiref.sync import sync_to_async
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.contrib.auth import authenticate, get_user_model
+from rest_framework.settings import api_settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.password_validation import password_changed
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 
+from apps.dashboard.models import UserStats
 
+from . import hashing
+from .tokens import tokens_for_user
 from .serializers import (
     RegisterSerializer,
     LoginSerializer,
@@ -17,33 +28,88 @@ User = get_user_model()
 # -------------------------
 # AUTH VIEWS
 # -------------------------
-
-class RegisterView(generics.CreateAPIView):
-    serializer_class = RegisterSerializer
-    permission_classes = [permissions.AllowAny]
-
-
-class LoginView(generics.GenericAPIView):
-    serializer_class = LoginSerializer
-    permission_classes = [permissions.AllowAny]
-
-    def post(self, request):
-        serializer = self.get_serializer(
-            data=request.data,
-            context={"request": request}  # ✅ CRITICAL FIX
-        )
-        serializer.is_valid(raise_exception=True)
-
-        # ✅ serializer.validate() already returned the user
-        user = serializer.validated_data
-
-        refresh = RefreshToken.for_user(user)
-
-        return Response({
-            "access": str(refresh.access_token),
-            "refresh": str(refresh),
-            "user": UserProfileSerializer(user).data,
-        })
+# Register, login and change-password hash passwords, so they are
+# async views that await apps.users.hashing instead of DRF views
+# burning a worker on PBKDF2. A saturated hashing pool answers 503.
+#
+# Being plain Django views, they skip DRF's request handling: no
+# throttling, content negotiation/renderers or EXCEPTION_HANDLER apply,
+# and only JSON and form bodies are parsed. Add any of those here
+# explicitly if the API starts relying on them.
+
+def _request_data(request):
+    if request.content_type == "application/json":
+        try:
+            return json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    return request.POST
+
+
+def _bad_request(errors):
+    return JsonResponse(errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _busy():
+    return JsonResponse(
+        {"detail": "Server is busy, please retry shortly."},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _authenticate(request):
+    """The user for the request's credentials, per DRF's auth classes."""
+    for auth_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        try:
+            result = await sync_to_async(auth_class().authenticate)(request)
+        except AuthenticationFailed:
+            return None
+        if result is not None:
+            return result[0]
+    return None
+
+
+@csrf_exempt
+@require_POST
+async def register(request):
+    """POST /api/auth/register/   {email, password, password2?, name?}"""
+    serializer = RegisterSerializer(data=_request_data(request))
+    # Email uniqueness is checked against the database
+    if not await sync_to_async(serializer.is_valid)():
+        return _bad_request(serializer.errors)
+
+    try:
+        user = await serializer.acreate(serializer.validated_data)
+    except hashing.HashingBusy:
+        return _busy()
+
+    return JsonResponse(
+        RegisterSerializer(user).data, status=status.HTTP_201_CREATED
+    )
+
+
+@csrf_exempt
+@require_POST
+async def login(request):
+    """POST /api/auth/login/   {email, password} -> tokens + user"""
+    serializer = LoginSerializer(data=_request_data(request))
+    if not serializer.is_valid():
+        return _bad_request(serializer.errors)
+
+    try:
+        user = await hashing.authenticate(**serializer.validated_data)
+    except hashing.HashingBusy:
+        return _busy()
+    if user is None:
+        return _bad_request({"non_field_errors": ["Invalid email or password"]})
+
+    refresh = await sync_to_async(tokens_for_user)(user)
+    return JsonResponse({
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+        "user": UserProfileSerializer(user).data,
+    })
 
 
 class LogoutView(generics.GenericAPIView):
@@ -70,35 +136,57 @@ class MeView(generics.RetrieveUpdateDestroyAPIView):
         return self.request.user
 
 
-class ChangePasswordView(generics.GenericAPIView):
-    serializer_class = ChangePasswordSerializer
-    permission_classes = [permissions.IsAuthenticated]
+@csrf_exempt
+@require_POST
+async def change_password(request):
+    """
+    POST /api/users/change-password/   {old_password, new_password}
 
-    def post(self, request):
-        user = request.user
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+    Signs out every other session: returns new tokens, the old ones
+    stop working.
+    """
+    user = await _authenticate(request)
+    if user is None or not user.is_active:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    serializer = ChangePasswordSerializer(data=_request_data(request))
+    if not serializer.is_valid():
+        return _bad_request(serializer.errors)
+
+    data = serializer.validated_data
+    try:
+        valid, _ = await hashing.check_password(data["old_password"], user.password)
+        if not valid:
+            return _bad_request({"detail": "Wrong password"})
+        user.password = await hashing.make_password(data["new_password"])
+    except hashing.HashingBusy:
+        return _busy()
 
-        if not user.check_password(serializer.validated_data["old_password"]):
-            return Response(
-                {"detail": "Wrong password"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+    # Revokes every token issued so far; this client gets fresh ones
+    user.token_version += 1
+    await user.asave(update_fields=["password", "token_version"])
+    password_changed(data["new_password"], user)
 
-        user.set_password(serializer.validated_data["new_password"])
-        user.save()
-        return Response({"detail": "Password updated successfully"})
+    refresh = await sync_to_async(tokens_for_user)(user)
+    return JsonResponse({
+        "detail": "Password updated successfully",
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+    })
 
 
 class UserStatsView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        user = request.user
+        stats = UserStats.objects.for_user(request.user)
         return Response({
-            "skills": user.skills.count(),
-            "projects": user.projects.count(),
-            "notifications": user.notifications.count(),
+            "skills": stats.skills_count,
+            "projects": stats.projects_count,
+            "notifications": stats.notifications_count,
         })
 
 
@@ -0,0 +1,169 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.exceptions import ValidationError
+
+
+# =========================
+# Sparse fieldsets: ?fields= / ?expand=
+# =========================
+# GET /api/projects/?fields=id,title,status   -> only those keys
+# GET /api/projects/?expand=skills            -> skill objects, not ids
+#
+# The serializer mixin trims the output; the view mixin parses the
+# query params and trims the queryset to match (only() + prefetches).
+
+
+def _split(value):
+    return [name for name in (part.strip() for part in value.split(",")) if name]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Drops fields not listed in context["fields"] and swaps in the
+    representations of `expandable_fields` listed in context["expand"].
+
+    expandable_fields = {name: (SerializerClass, {init kwargs})}
+    """
+    expandable_fields = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        expand = self.context.get("expand", ())
+        for name in expand:
+            serializer_class, options = self.expandable_fields[name]
+            self.fields[name] = serializer_class(read_only=True, **options)
+
+        fields = self.context.get("fields")
+        if fields is not None:
+            for name in set(self.fields) - set(fields) - set(expand):
+                self.fields.pop(name)
+
+
+class SparseFieldsetViewMixin:
+    """
+    Reads ?fields= / ?expand= on GET requests, passes them to the
+    serializer context and trims get_queryset() accordingly:
+    unrequested columns are deferred with only() and prefetches for
+    unrequested relations are dropped.
+    """
+
+    def get_fieldsets(self):
+        if hasattr(self, "_fieldsets"):
+            return self._fieldsets
+
+        fieldsets = {}
+        params = self.request.query_params if self.request.method == "GET" else {}
+        serializer_class = self.get_serializer_class()
+
+        if params.get("expand"):
+            expand = _split(params["expand"])
+            unknown = set(expand) - set(serializer_class.expandable_fields)
+            if unknown:
+                raise ValidationError(
+                    {"expand": f"Unknown fields: {', '.join(sorted(unknown))}"}
+                )
+            fieldsets["expand"] = expand
+
+        if params.get("fields"):
+            fields = _split(params["fields"])
+            available = set(serializer_class().fields) | set(
+                serializer_class.expandable_fields
+            )
+            unknown = set(fields) - available
+            if unknown:
+                raise ValidationError(
+                    {"fields": f"Unknown fields: {', '.join(sorted(unknown))}"}
+                )
+            fieldsets["fields"] = fields
+
+        self._fieldsets = fieldsets
+        return fieldsets
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.get_fieldsets())
+        return context
+
+    def _owned(self, opts, lookup):
+        """
+        `lookup` limited to the requesting user's rows when the related
+        model has an owner: rows linked across users (e.g. a project
+        pointing at someone else's skill) must not show up expanded.
+        """
+        relation = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+        related = opts.get_field(relation).related_model
+        try:
+            related._meta.get_field("user")
+        except FieldDoesNotExist:
+            return lookup
+
+        queryset = related._default_manager.all()
+        if isinstance(lookup, Prefetch):
+            queryset = lookup.queryset if lookup.queryset is not None else queryset
+            to_attr = lookup.to_attr
+        else:
+            to_attr = None
+        return Prefetch(
+            relation,
+            queryset=queryset.filter(user=self.request.user),
+            to_attr=to_attr,
+        )
+
+    def trim_queryset(self, queryset):
+        """
+        Load only what the requested fields read. A no-op unless the
+        client asked for ?fields= or ?expand=.
+        """
+        if not self.get_fieldsets():
+            return queryset
+
+        opts = queryset.model._meta
+        columns = {opts.pk.name}
+        relations = set()
+        for field in self.get_serializer().fields.values():
+            if field.source == "*":
+                # Reads the whole instance, nothing can be deferred
+                columns = None
+                continue
+            try:
+                model_field = opts.get_field(field.source.split(".")[0])
+            except FieldDoesNotExist:
+                continue
+            if model_field.many_to_many or model_field.one_to_many:
+                relations.add(model_field.name)
+            elif columns is not None and model_field.concrete:
+                columns.add(model_field.name)
+
+        # Keep prefetches for requested relations only, add missing ones
+        lookups = []
+        covered = set()
+        for lookup in queryset._prefetch_related_lookups:
+            path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+            relation = path.split("__")[0]
+            if relation in relations:
+                lookups.append(self._owned(opts, lookup) if path == relation else lookup)
+                covered.add(relation)
+        queryset = queryset.prefetch_related(None).prefetch_related(
+            *lookups,
+            *(self._owned(opts, relation) for relation in sorted(relations - covered)),
+        )
+
+        if columns is None:
+            return queryset
+
+        # Ordering columns are read by cursor pagination
+        ordering = list(queryset.query.order_by)
+        pagination_ordering = getattr(self.pagination_class, "ordering", None) or ()
+        if isinstance(pagination_ordering, str):
+            pagination_ordering = (pagination_ordering,)
+        ordering += pagination_ordering
+        for name in ordering:
+            name = name.lstrip("-")
+            try:
+                if opts.get_field(name).concrete:
+                    columns.add(name)
+            except FieldDoesNotExist:
+                pass
+
+        return queryset.only(*columns)
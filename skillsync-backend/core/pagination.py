@@ -0,0 +1,21 @@
+from rest_framework.pagination import CursorPagination
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination that only kicks in when the client asks
+    for it with ?cursor= or ?limit=, so existing clients keep receiving
+    a plain list.
+    """
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if (
+            self.cursor_query_param not in params
+            and self.page_size_query_param not in params
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
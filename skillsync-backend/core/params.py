@@ -0,0 +1,19 @@
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+
+def parse_date_param(params, name):
+    """
+    Optional YYYY-MM-DD query parameter `name` as a date, None when
+    absent. Malformed or impossible dates are a 400 on that parameter.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: "Expected a YYYY-MM-DD date."})
+    return parsed
@@ -49,6 +49,8 @@ INSTALLED_APPS = [
     "apps.notifications",
     "apps.dashboard",
     "apps.settings_app",
+    "apps.search",
+    "apps.matching",
 ]
 
 # =========================
@@ -166,7 +168,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # =========================
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
@@ -182,6 +184,7 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_REFRESH_SERIALIZER": "apps.users.tokens.VersionedTokenRefreshSerializer",
 }
 
 # =========================
@@ -189,6 +192,10 @@ SIMPLE_JWT = {
 # =========================
 AUTH_USER_MODEL = "users.User"
 
+# Seconds an authenticated user is served from the per-process cache
+# (apps.users.authentication) before it is re-read from the database.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "30"))
+
 AUTHENTICATION_BACKENDS = [
     "apps.users.auth_backend.EmailBackend",
     "django.contrib.auth.backends.ModelBackend",
@@ -205,3 +212,63 @@ CSRF_TRUSTED_ORIGINS = [
 ]
 
 
+
+# =========================
+# Matching
+# =========================
+# Seconds before a worker rebuilds its in-memory skill index from the
+# database, picking up writes made through other workers.
+MATCHING_INDEX_MAX_AGE = int(os.getenv("MATCHING_INDEX_MAX_AGE", "600"))
+
+# =========================
+# Skill catalog
+# =========================
+# Seconds between checks for catalog changes made by other workers
+# (autocomplete reloads in the background when it changed).
+CATALOG_REFRESH_INTERVAL = int(os.getenv("CATALOG_REFRESH_INTERVAL", "60"))
+
+# =========================
+# Notification outbox
+# =========================
+# "thread": notifications are queued on commit and inserted in batches
+# by a background thread per worker. "sync": inserted inline.
+NOTIFICATION_OUTBOX_MODE = os.getenv("NOTIFICATION_OUTBOX_MODE", "thread")
+NOTIFICATION_OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "500"))
+NOTIFICATION_OUTBOX_MAX_RETRIES = int(os.getenv("NOTIFICATION_OUTBOX_MAX_RETRIES", "5"))
+
+# Seconds during which events of a kind merge into the user's open
+# (unread) notification of that kind; kinds not listed never merge.
+NOTIFICATION_COALESCE_WINDOWS = {
+    "skill_added": int(os.getenv("NOTIFICATION_COALESCE_SKILL_ADDED", "300")),
+    "project_created": int(os.getenv("NOTIFICATION_COALESCE_PROJECT_CREATED", "300")),
+}
+
+# =========================
+# Live notifications (SSE)
+# =========================
+NOTIFICATION_PUBSUB_BACKEND = os.getenv(
+    "NOTIFICATION_PUBSUB_BACKEND", "apps.notifications.pubsub.InMemoryBroker"
+)
+# Seconds between keep-alive comments on an idle stream
+NOTIFICATION_STREAM_HEARTBEAT = int(os.getenv("NOTIFICATION_STREAM_HEARTBEAT", "15"))
+# Seconds a ticket from POST /api/notifications/stream/ticket/ stays
+# valid for opening the stream (apps.notifications.tickets)
+NOTIFICATION_STREAM_TICKET_TTL = int(os.getenv("NOTIFICATION_STREAM_TICKET_TTL", "60"))
+
+# =========================
+# Notification retention
+# =========================
+# Enforced by `manage.py purge_notifications`; 0 disables a rule.
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "180"))
+NOTIFICATION_MAX_PER_USER = int(os.getenv("NOTIFICATION_MAX_PER_USER", "1000"))
+# Rows per DELETE for the purge and for clear-all
+NOTIFICATION_DELETE_BATCH_SIZE = int(os.getenv("NOTIFICATION_DELETE_BATCH_SIZE", "1000"))
+
+# =========================
+# Password hashing pool
+# =========================
+# Processes per worker that hash passwords for register / login /
+# change-password (0 hashes on a thread instead), and how many hashing
+# jobs may be queued or running before those endpoints answer 503.
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", "2"))
+PASSWORD_HASHING_MAX_PENDING = int(os.getenv("PASSWORD_HASHING_MAX_PENDING", "16"))
@@ -28,3 +28,8 @@ DATABASES = {
 # CORS (DEV ONLY)
 # ===============================
 CORS_ALLOW_ALL_ORIGINS = True
+
+# ===============================
+# NOTIFICATIONS (DEV - INLINE)
+# ===============================
+NOTIFICATION_OUTBOX_MODE = os.getenv("NOTIFICATION_OUTBOX_MODE", "sync")
@@ -2,12 +2,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
 
+from apps.notifications.outbox import outbox
+
 
 # =========================
 # Health check (Render)
 # =========================
 def health_check(request):
-    return JsonResponse({"status": "ok"})
+    return JsonResponse({"status": "ok", "notification_outbox": outbox.stats()})
 
 
 urlpatterns = [
@@ -33,4 +35,7 @@ urlpatterns = [
     path("api/projects/", include("apps.projects.urls")),
     path("api/notifications/", include("apps.notifications.urls")),
     path("api/dashboard/", include("apps.dashboard.urls")),
+    path("api/settings/", include("apps.settings_app.urls")),
+    path("api/search/", include("apps.search.urls")),
+    path("api/matching/", include("apps.matching.urls")),
 ]